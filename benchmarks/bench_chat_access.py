@@ -0,0 +1,70 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""Benchmark of the chat access filtering of the users fetched by SyncZoom.
+
+Every bucket of users used to be filtered by scanning the chat access list, which holds the members
+of every role with the ChatMessage:Read privilege, duplicates included, against the list of the user
+ids of the bucket. The chat access users are now a set resolved once with the roles and every user of
+a bucket is looked up in it.
+
+Every user is its own bucket, as the threaded sync runs one task per user and object type. The list
+scans are too slow to run for every bucket, they are timed on a sample of buckets and extrapolated.
+
+Usage: python benchmarks/bench_chat_access.py [--users 100000] [--roles 3] [--bucket-size 1] [--sample 500]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom.sync_zoom import get_chat_access_enabled_users  # noqa
+
+
+def get_chat_access_enabled_users_from_list(users, all_chat_access):
+    """The previous filtering, scanning the chat access list against the user ids of the bucket."""
+    user_ids_list = []
+    for user in users:
+        user_ids_list.append(user["id"])
+    return [user_id for user_id in all_chat_access if user_id in user_ids_list]
+
+
+def run(filter_users, buckets, chat_access):
+    """Filters every bucket of users.
+    :returns: seconds spent and number of users with chat access.
+    """
+    start = time.perf_counter()
+    count = sum(len(filter_users(bucket, chat_access)) for bucket in buckets)
+    return time.perf_counter() - start, count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--roles", type=int, default=3)
+    parser.add_argument("--bucket-size", type=int, default=1)
+    parser.add_argument("--sample", type=int, default=500)
+    args = parser.parse_args()
+    users = [{"id": f"user_{index}"} for index in range(args.users)]
+    buckets = [users[index:index + args.bucket_size] for index in range(0, args.users, args.bucket_size)]
+    # Every role with chat access contains half of the users, so most users appear several times.
+    chat_access_list = []
+    for role_index in range(args.roles):
+        chat_access_list.extend(
+            user["id"] for user in users[role_index * args.users // (2 * args.roles):][:args.users // 2]
+        )
+    duration, count = run(get_chat_access_enabled_users, buckets, set(chat_access_list))
+    print(f"set lookups: {duration:.3f}s, {count} users with chat access")
+    sample = buckets[:args.sample]
+    duration, _ = run(get_chat_access_enabled_users_from_list, sample, chat_access_list)
+    print(
+        f"list scans: {duration * len(buckets) / len(sample):.3f}s extrapolated from {len(sample)} "
+        f"of {len(buckets)} buckets"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""Benchmark of the ConnectorQueue throughput against the previous multiprocessing based queue.
+
+Producer threads append documents shaped like the meetings documents to the queue while consumer
+threads read them until they receive their end signal, as the full sync does. The previous queue
+pickles every 100 documents chunk through a pipe, the in-process queue hands the chunks over in memory.
+
+Usage: python benchmarks/bench_connector_queue.py [--documents 200000] [--producers 4] [--consumers 4]
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from multiprocessing.queues import Queue
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom.connector_queue import ConnectorQueue  # noqa
+
+
+class MultiprocessingConnectorQueue(Queue):
+    """The previous ConnectorQueue, based on multiprocessing.queues.Queue."""
+
+    def __init__(self, logger):
+        self.logger = logger
+        super().__init__(ctx=multiprocessing.get_context())
+
+    def end_signal(self):
+        self.put({"type": "signal_close"})
+
+    def append_to_queue(self, documents):
+        for index in range(0, len(documents), 100):
+            self.put({"type": "document_list", "data": documents[index:index + 100]})
+
+
+def create_documents(count, producer_index):
+    """Creates documents of about 1KB similar to the meetings documents."""
+    return [
+        {
+            "type": "meetings",
+            "id": f"meeting_{producer_index}_{index}",
+            "title": f"Weekly meeting {index}",
+            "body": "Agenda: " + "x" * 700,
+            "url": f"https://zoom.us/user/{producer_index}/meeting/{index}",
+            "created_at": "2022-04-01T10:00:00Z",
+            "_allow_permissions": ["Meeting:Read", "role_1", "group_2"],
+        }
+        for index in range(count)
+    ]
+
+
+def run(connector_queue, documents_per_producer, producers_count, consumers_count):
+    """Runs the producers and the consumers on the queue.
+    :returns: number of documents read by the consumers per second.
+    """
+    consumed_counts = []
+
+    def consume():
+        count = 0
+        while True:
+            message = connector_queue.get()
+            if message.get("type") == "signal_close":
+                break
+            count += len(message["data"])
+        consumed_counts.append(count)
+
+    documents = [
+        create_documents(documents_per_producer, index) for index in range(producers_count)
+    ]
+    consumers = [threading.Thread(target=consume) for _ in range(consumers_count)]
+    producers = [
+        threading.Thread(target=connector_queue.append_to_queue, args=(documents[index],))
+        for index in range(producers_count)
+    ]
+    start = time.perf_counter()
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in range(consumers_count):
+        connector_queue.end_signal()
+    for thread in consumers:
+        thread.join()
+    duration = time.perf_counter() - start
+    assert sum(consumed_counts) == documents_per_producer * producers_count
+    return sum(consumed_counts) / duration
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=200000)
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--consumers", type=int, default=4)
+    args = parser.parse_args()
+    logger = logging.getLogger("bench_connector_queue")
+    documents_per_producer = args.documents // args.producers
+    queues = [
+        ("multiprocessing queue", MultiprocessingConnectorQueue(logger)),
+        ("in-process queue", ConnectorQueue(logger)),
+        ("in-process queue bounded to 5000 documents", ConnectorQueue(logger, max_documents=5000)),
+        ("in-process queue bounded to 5MB", ConnectorQueue(logger, max_bytes=5 * 1024 * 1024)),
+    ]
+    for name, connector_queue in queues:
+        throughput = run(connector_queue, documents_per_producer, args.producers, args.consumers)
+        print(f"{name}: {throughput:,.0f} documents/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""Benchmark of the CPU spent by the indexing consumer to batch the documents pulled from the queue.
+
+The previous consumer re-stringified the whole batch after every message pulled from the queue and
+measured every document again while splitting the batch by size, and the Enterprise Search client then
+encoded the batch to JSON. The DocumentBatcher encodes every document once, with orjson when it is
+installed, keeps a running total and hands the encoded batch to the client. The request itself is not sent.
+
+Usage: python benchmarks/bench_document_batching.py [--documents 100000] [--message-size 10]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from unittest.mock import Mock
+
+from elastic_enterprise_search import JSONSerializer
+from iteration_utilities import unique_everseen
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom import utils  # noqa
+from ees_zoom.connector_queue import ConnectorQueue  # noqa
+from ees_zoom.constant import BATCH_SIZE  # noqa
+from ees_zoom.sync_enterprise_search import SyncEnterpriseSearch  # noqa
+from ees_zoom.utils import (split_by_max_cumulative_length,  # noqa
+                            split_documents_into_equal_chunks)
+
+
+def create_documents(count):
+    """Creates documents of about 1KB similar to the meetings documents."""
+    return [
+        {
+            "type": "meetings",
+            "id": f"meeting_{index}",
+            "title": f"Weekly meeting {index}",
+            "body": "Agenda: " + "x" * 700,
+            "url": f"https://zoom.us/meeting/{index}",
+            "created_at": "2022-04-01T10:00:00Z",
+            "_allow_permissions": ["Meeting:Read", "role_1", "group_2"],
+        }
+        for index in range(count)
+    ]
+
+
+def previous_perform_sync(connector_queue, max_allowed_bytes, index_documents):
+    """The previous batching loop of SyncEnterpriseSearch.perform_sync."""
+    signal_open = True
+    while signal_open:
+        documents_to_index = []
+        while len(documents_to_index) < BATCH_SIZE and len(str(documents_to_index)) < max_allowed_bytes:
+            documents = connector_queue.get()
+            if documents.get("type") == "signal_close":
+                signal_open = False
+                break
+            documents_to_index.extend(documents.get("data"))
+        documents_to_index = list(unique_everseen(documents_to_index))
+        for document_list in split_documents_into_equal_chunks(documents_to_index, BATCH_SIZE):
+            for documents in split_by_max_cumulative_length(document_list, max_allowed_bytes):
+                index_documents(documents)
+
+
+def fill_queue(logger, documents, message_size):
+    """Returns a queue holding the documents in messages of message_size documents and an end signal."""
+    connector_queue = ConnectorQueue(logger)
+    for index in range(0, len(documents), message_size):
+        connector_queue.put({"type": "document_list", "data": documents[index:index + message_size]})
+    connector_queue.end_signal()
+    return connector_queue
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=100000)
+    parser.add_argument("--message-size", type=int, default=10)
+    args = parser.parse_args()
+    logger = logging.getLogger("bench_document_batching")
+    documents = create_documents(args.documents)
+
+    serializer = JSONSerializer()
+
+    def send_request(body, timeout, on_error=None):
+        """Encodes the body as the Enterprise Search client does, bytes being sent as is."""
+        serializer.dumps(body)
+        return {"results": []}
+
+    connector_queue = fill_queue(logger, documents, args.message_size)
+    index_documents = Mock(side_effect=lambda documents: send_request(documents, None))
+    start = time.process_time()
+    previous_perform_sync(connector_queue, 10000000, index_documents)
+    duration = time.process_time() - start
+    print(f"previous batching: {duration:.2f}s CPU, {index_documents.call_count} batches")
+
+    encoders = [("json", None)]
+    if utils.orjson:
+        encoders.append(("orjson", utils.orjson))
+    for encoder_name, orjson in encoders:
+        utils.orjson = orjson
+        workplace_search_client = Mock()
+        workplace_search_client.index_documents = Mock(side_effect=send_request)
+        sync_enterprise_search = SyncEnterpriseSearch(
+            Mock(get_value=Mock(return_value=1)), logger, workplace_search_client, fill_queue(logger, documents, args.message_size)
+        )
+        start = time.process_time()
+        sync_enterprise_search.perform_sync()
+        duration = time.process_time() - start
+        print(
+            f"DocumentBatcher with {encoder_name}: {duration:.2f}s CPU, "
+            f"{workplace_search_client.index_documents.call_count} batches"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""Benchmark of ZoomClient.iter_pages with different prefetch depths.
+
+A local stub server emulates a paginated Zoom endpoint answering after a fixed latency, and the
+consumer spends a fixed time turning every page into documents, so the time saved by overlapping
+the next request with the processing of the current page is visible for each prefetch depth.
+
+Usage: python benchmarks/bench_zoom_client_prefetch.py [--pages 50] [--latency 0.05] [--processing 0.05]
+"""
+import argparse
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom import zoom_client as zoom_client_module  # noqa
+from ees_zoom.configuration import Configuration  # noqa
+from ees_zoom.zoom_client import ZoomClient  # noqa
+
+CONFIG_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "config", "zoom_connector.yml"
+)
+
+
+class SlowStubZoomHandler(BaseHTTPRequestHandler):
+    """Serves a fixed number of 300 records pages for any endpoint after a fixed latency."""
+
+    protocol_version = "HTTP/1.1"
+    total_pages = 1
+    latency = 0
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        page = 1
+        if "next_page_token=" in self.path:
+            page = int(self.path.rsplit("next_page_token=", 1)[1]) + 1
+        next_page_token = str(page) if page < self.total_pages else ""
+        body = json.dumps(
+            {
+                "next_page_token": next_page_token,
+                "messages": [{"id": f"message_{page}_{index}"} for index in range(300)],
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--processing", type=float, default=0.05)
+    args = parser.parse_args()
+
+    SlowStubZoomHandler.total_pages = args.pages
+    SlowStubZoomHandler.latency = args.latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowStubZoomHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    zoom_client_module.ZOOM_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v2/"
+
+    config = Configuration(file_name=CONFIG_FILE)
+    zoom_client = ZoomClient(config, logging.getLogger("bench_zoom_client_prefetch"))
+    zoom_client.access_token = "dummy"
+    zoom_client.access_token_expiration = time.time() + 4000
+    zoom_client.ensure_token_valid = lambda: None
+
+    print(
+        f"{args.pages} page(s), {args.latency * 1000:.0f}ms latency, "
+        f"{args.processing * 1000:.0f}ms processing per page"
+    )
+    for prefetch_depth in [0, 1, 2, 4]:
+        start = time.perf_counter()
+        for _ in zoom_client.iter_pages(
+            "chat/users/me/messages?page_size=300",
+            "messages",
+            prefetch_depth=prefetch_depth,
+        ):
+            time.sleep(args.processing)
+        elapsed = time.perf_counter() - start
+        print(
+            f"prefetch depth {prefetch_depth}  {elapsed:8.3f}s  {args.pages / elapsed:8.1f} pages/s"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
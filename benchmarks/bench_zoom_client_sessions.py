@@ -0,0 +1,134 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""Benchmark comparing bare requests.get calls with the pooled, thread-local sessions of ZoomClient.
+
+A local stub server emulates a paginated Zoom endpoint and counts the TCP connections it accepts,
+so the number of handshakes saved by connection pooling is visible next to the wall-clock time.
+Every worker walks the meetings of its own user, as ZoomClient shares a request between the concurrent
+calls to the same endpoint.
+
+Usage: python benchmarks/bench_zoom_client_sessions.py [--threads 5] [--pages 200]
+"""
+import argparse
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom import zoom_client as zoom_client_module  # noqa
+from ees_zoom.configuration import Configuration  # noqa
+from ees_zoom.zoom_client import ZoomClient  # noqa
+
+CONFIG_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "config", "zoom_connector.yml"
+)
+
+
+class StubZoomHandler(BaseHTTPRequestHandler):
+    """Serves a fixed number of pages for any endpoint and keeps connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    connections_lock = threading.Lock()
+    total_pages = 1
+
+    def setup(self):
+        super().setup()
+        # headers and body are written separately, avoid Nagle delays on kept-alive connections
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with StubZoomHandler.connections_lock:
+            StubZoomHandler.connections += 1
+
+    def do_GET(self):
+        page = 1
+        if "next_page_token=" in self.path:
+            page = int(self.path.rsplit("next_page_token=", 1)[1]) + 1
+        next_page_token = str(page) if page < self.total_pages else ""
+        body = json.dumps(
+            {"next_page_token": next_page_token, "meetings": [{"id": f"meeting_{page}"}]}
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def get_end_point(worker_index):
+    """Returns the paginated endpoint walked by a worker, distinct for every worker."""
+    return f"users/user_{worker_index}/meetings?page_size=300"
+
+
+def bare_requests_worker(base_url, pages, worker_index):
+    """Walks the paginated stub endpoint the way ZoomClient.get used to, with one requests.get per page."""
+    next_page_token = ""
+    for _ in range(pages):
+        url = f"{base_url}{get_end_point(worker_index)}"
+        if next_page_token:
+            url = f"{url}&next_page_token={next_page_token}"
+        next_page_token = json.loads(requests.get(url=url).text)["next_page_token"]
+
+
+def run(label, threads, func):
+    """Runs func on every thread with the index of the worker and prints elapsed time and opened connections."""
+    StubZoomHandler.connections = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(func, worker_index) for worker_index in range(threads)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<28} {elapsed:8.3f}s  {StubZoomHandler.connections:6d} connection(s) opened"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    StubZoomHandler.total_pages = args.pages
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubZoomHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v2/"
+    zoom_client_module.ZOOM_BASE_URL = base_url
+
+    config = Configuration(file_name=CONFIG_FILE)
+    zoom_client = ZoomClient(config, logging.getLogger("bench_zoom_client_sessions"))
+    zoom_client.access_token = "dummy"
+    zoom_client.access_token_expiration = time.time() + 4000
+    zoom_client.ensure_token_valid = lambda: None
+    # The requests are not paced by the Zoom rate limits, only the connections are compared.
+    zoom_client.rate_limiter.acquire = lambda category: None
+
+    print(f"{args.threads} thread(s) x {args.pages} page(s)")
+    run(
+        "requests.get per page",
+        args.threads,
+        lambda worker_index: bare_requests_worker(base_url, args.pages, worker_index),
+    )
+    run(
+        "ZoomClient pooled sessions",
+        args.threads,
+        lambda worker_index: zoom_client.get(get_end_point(worker_index), "meetings", is_paginated=True),
+    )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""async_sync_zoom module allows to fetch the user dependent Zoom objects with an asyncio event loop.
+It is used instead of the multithreaded SyncZoom.perform_sync when zoom_sync_mode is set to async."""
+import asyncio
+
+from .async_zoom_client import AsyncZoomAPIError, AsyncZoomClient
+from .constant import (CHANNELS, CHATS, FILES, MEETINGS, PAST_MEETINGS,
+                       RECORDINGS, RFC_3339_DATETIME_FORMAT, USERS)
+from .sync_zoom import SyncZoom
+from .utils import constraint_time_range
+from .zoom_channels import ZoomChannels
+from .zoom_chat_messages import TIME_CONSTRAINT_FOR_CHATS, ZoomChatMessages
+from .zoom_meetings import ZoomMeetings
+from .zoom_past_meetings import ZoomPastMeetings
+from .zoom_recordings import ZoomRecordings
+
+
+class AsyncSyncZoom(SyncZoom):
+    """This class allows ingesting the user dependent data from Zoom to Elastic Enterprise Search
+    by keeping up to zoom_async_concurrency requests in flight from a single event loop."""
+
+    def perform_async_sync(self, users):
+        """This method fetches the users, meetings, past_meetings, recordings, channels, chats and files
+        of all the users from Zoom server, appends them to the shared queue and returns list of locally
+        stored details of documents fetched.
+        :param users: list of dictionaries where each dictionary contains details fetched for a user from Zoom
+        :returns: list of dictionary containing the properties (id, type, parent_id, created_at) of
+            all the documents generated for the user dependent zoom objects.
+        """
+        if not users or self.configuration_objects is None:
+            return []
+        loop = asyncio.new_event_loop()
+        try:
+            documents = loop.run_until_complete(self.fetch_users_objects(users))
+        finally:
+            loop.close()
+        return self.get_ids_storage(documents)
+
+    async def fetch_users_objects(self, users):
+        """Fetches the objects of all the users concurrently.
+        :param users: list of dictionaries where each dictionary contains details fetched for a user from Zoom
+        :returns: list of documents generated for the users.
+        """
+        documents = []
+        if USERS in self.configuration_objects:
+            # Appending to the bounded queue blocks while it is full, it is done out of the event loop.
+            documents.extend(
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.fetch_users_and_append_to_queue, users
+                )
+            )
+        async with AsyncZoomClient(self.zoom_client, self.config, self.logger) as client:
+            users_documents = await asyncio.gather(
+                *[self.fetch_user_objects(client, user) for user in users]
+            )
+        for user_documents in users_documents:
+            documents.extend(user_documents)
+        self.logger.info(
+            f"Fetched {len(documents)} documents for {len(users)} users using the async Zoom client."
+        )
+        return documents
+
+    async def fetch_user_objects(self, client, user):
+        """Fetches the independent objects of one user concurrently and appends their documents to the queue.
+        :param client: AsyncZoomClient object.
+        :param user: dictionary containing details fetched for a user from Zoom.
+        :returns: list of documents generated for the user.
+        """
+        fetchers = []
+        if MEETINGS in self.configuration_objects or PAST_MEETINGS in self.configuration_objects:
+            fetchers.append((MEETINGS, self.fetch_meetings(client, user)))
+        if RECORDINGS in self.configuration_objects:
+            fetchers.append((RECORDINGS, self.fetch_recordings(client, user)))
+        if CHANNELS in self.configuration_objects:
+            fetchers.append((CHANNELS, self.fetch_channels(client, user)))
+        if user["id"] in self.all_chat_access:
+            if CHATS in self.configuration_objects:
+                fetchers.append((CHATS, self.fetch_chats(client, user)))
+            if FILES in self.configuration_objects:
+                fetchers.append((FILES, self.fetch_files(client, user)))
+        results = await asyncio.gather(
+            *[fetcher for _, fetcher in fetchers], return_exceptions=True
+        )
+        documents = []
+        loop = asyncio.get_running_loop()
+        for (object_type, _), result in zip(fetchers, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    f"Error while fetching {object_type} for user {user['id']}. Error: {result}"
+                )
+                continue
+            # A full queue would otherwise freeze every request in flight on the event loop.
+            try:
+                await loop.run_in_executor(None, self.queue.append_to_queue, result)
+            except BaseException:
+                # The chats and files are fetched again by the other users sharing them.
+                fetched_ids = {CHATS: self.fetched_chats_ids, FILES: self.fetched_files_ids}.get(object_type)
+                for document in result if fetched_ids else []:
+                    fetched_ids.discard(document["id"])
+                raise
+            documents.extend(result)
+        return documents
+
+    async def fetch_meetings(self, client, user):
+        """Fetches the meetings of the user and the past_meetings instances of those meetings.
+        :param client: AsyncZoomClient object.
+        :param user: dictionary containing details fetched for a user from Zoom.
+        :returns: list of meetings and past_meetings documents.
+        """
+        meetings_object = ZoomMeetings(
+            self.config,
+            self.logger,
+            self.zoom_client,
+            self.zoom_enterprise_search_mappings,
+        )
+        is_meetings_in_objects = MEETINGS in self.configuration_objects
+        checkpoint_object = MEETINGS if is_meetings_in_objects else PAST_MEETINGS
+        meetings_for_user = await client.get(
+            end_point=f"users/{user['id']}/meetings?page_size=300",
+            key=MEETINGS,
+            is_paginated=True,
+        )
+        meetings_list = meetings_object.filter_meetings_from_user_id(
+            user["id"],
+            meetings_for_user,
+            self.objects_time_range[checkpoint_object][0],
+            self.objects_time_range[checkpoint_object][1],
+        )
+        documents = []
+        if is_meetings_in_objects:
+            meetings_schema = self.get_schema_fields(MEETINGS)
+            for meeting in meetings_list:
+                documents.append(
+                    meetings_object.create_meeting_document(
+                        user["id"], meeting, meetings_schema, self.enable_permission
+                    )
+                )
+        if PAST_MEETINGS in self.configuration_objects:
+            past_meetings_object = ZoomPastMeetings(
+                self.config,
+                self.logger,
+                self.zoom_client,
+                self.zoom_enterprise_search_mappings,
+            )
+            past_meetings_schema = self.get_schema_fields(PAST_MEETINGS)
+            past_meetings_documents = await asyncio.gather(
+                *[
+                    self.fetch_past_meeting(
+                        client, past_meetings_object, meeting, past_meetings_schema
+                    )
+                    for meeting in meetings_object.meetings_past_meetings_list
+                ]
+            )
+            documents.extend(
+                document for document in past_meetings_documents if document
+            )
+        return documents
+
+    async def fetch_past_meeting(
+        self, client, past_meetings_object, meeting, past_meetings_schema
+    ):
+        """Fetches the past_meeting instance of the meeting along with its participants.
+        :param client: AsyncZoomClient object.
+        :param past_meetings_object: ZoomPastMeetings object.
+        :param meeting: dictionary containing details fetched for a meeting.
+        :param past_meetings_schema: dictionary of fields to be indexed for past_meetings.
+        :returns: past_meeting document, None if the meeting has no past instance in the time range.
+        """
+        try:
+            past_meeting_details = await client.get(
+                end_point=f"past_meetings/{meeting['id']}", key=PAST_MEETINGS
+            )
+        except AsyncZoomAPIError as exception:
+            if exception.status_code in [404, 400]:
+                self.logger.debug(
+                    f"Meeting with id {meeting['id']} is skipped. Reason: {exception.text}"
+                )
+                return None
+            raise
+        past_meeting_dictionary = past_meetings_object.filter_past_meeting_in_time_range(
+            past_meeting_details,
+            self.objects_time_range[PAST_MEETINGS][0],
+            self.objects_time_range[PAST_MEETINGS][1],
+        )
+        if not past_meeting_dictionary:
+            return None
+        try:
+            participants_for_meeting = await client.get(
+                end_point=f"report/meetings/{meeting['id']}/participants?page_size=300",
+                key="participants",
+                is_paginated=True,
+            )
+        except AsyncZoomAPIError as exception:
+            if exception.status_code != 404:
+                raise
+            participants_for_meeting = []
+        return past_meetings_object.create_past_meeting_document(
+            meeting,
+            past_meeting_dictionary,
+            past_meetings_object.get_participants_details(participants_for_meeting),
+            past_meetings_schema,
+            self.enable_permission,
+        )
+
+    async def fetch_recordings(self, client, user):
+        """Fetches the recordings of the user.
+        :param client: AsyncZoomClient object.
+        :param user: dictionary containing details fetched for a user from Zoom.
+        :returns: list of recordings documents.
+        """
+        recordings_object = ZoomRecordings(
+            self.config,
+            self.logger,
+            self.zoom_client,
+            self.zoom_enterprise_search_mappings,
+        )
+        recordings_schema = self.get_schema_fields(RECORDINGS)
+        start_time = self.objects_time_range[RECORDINGS][0].strftime(RFC_3339_DATETIME_FORMAT)
+        end_time = self.objects_time_range[RECORDINGS][1].strftime(RFC_3339_DATETIME_FORMAT)
+        recordings_list = await client.get(
+            end_point=f"users/{user['id']}/recordings?page_size=300&from={start_time}&to={end_time}",
+            key=MEETINGS,
+            is_paginated=True,
+        )
+        documents = []
+        for meeting in recordings_list:
+            documents.extend(
+                recordings_object.create_recordings_documents(
+                    user["id"], meeting, recordings_schema, self.enable_permission
+                )
+            )
+        return documents
+
+    async def fetch_channels(self, client, user):
+        """Fetches the channels of the user.
+        :param client: AsyncZoomClient object.
+        :param user: dictionary containing details fetched for a user from Zoom.
+        :returns: list of channels documents.
+        """
+        channels_object = ZoomChannels(
+            self.config,
+            self.logger,
+            self.zoom_client,
+            self.zoom_enterprise_search_mappings,
+        )
+        channel_schema = self.get_schema_fields(CHANNELS)
+        channels_list = await client.get(
+            end_point=f"chat/users/{user['id']}/channels?page_size=50",
+            key=CHANNELS,
+            is_paginated=True,
+        )
+        return [
+            channels_object.create_channel_document(
+                user["id"], channel, channel_schema, self.enable_permission
+            )
+            for channel in channels_list
+        ]
+
+    async def fetch_chats(self, client, user):
+        """Fetches the chats of the user, skipping the chats already fetched for another user.
+        :param client: AsyncZoomClient object.
+        :param user: dictionary containing details fetched for a user from Zoom.
+        :returns: list of chats documents.
+        """
+        chats_object = ZoomChatMessages(
+            self.config,
+            self.logger,
+            self.zoom_client,
+            self.zoom_enterprise_search_mappings,
+        )
+        chats_schema = self.get_schema_fields(CHATS)
+        start_time, end_time = constraint_time_range(
+            start_time=self.objects_time_range[CHATS][0],
+            end_time=self.objects_time_range[CHATS][1],
+            time_constraint=TIME_CONSTRAINT_FOR_CHATS,
+            logger=self.logger,
+        )
+        chats_list = await client.get(
+            end_point=(
+                f"chat/users/{user['id']}/messages?page_size=300&search_key=%20"
+                f"&search_type=message&from={start_time}&to={end_time}"
+            ),
+            key="messages",
+            is_paginated=True,
+        )
+        documents = []
+        new_chats_ids = []
+        try:
+            for chat in chats_list:
+                if not self.fetched_chats_ids.add_if_absent(chat["id"]):
+                    continue
+                new_chats_ids.append(chat["id"])
+                documents.append(
+                    chats_object.create_chat_document(
+                        user["id"], chat, chats_schema, self.enable_permission
+                    )
+                )
+        except BaseException:
+            # The chats are fetched again by the other users sharing them.
+            for chat_id in new_chats_ids:
+                self.fetched_chats_ids.discard(chat_id)
+            raise
+        return documents
+
+    async def fetch_files(self, client, user):
+        """Fetches the files sent by the user along with their content, skipping the files already
+        fetched for another user. Content extraction runs in a worker thread as it is blocking.
+        :param client: AsyncZoomClient object.
+        :param user: dictionary containing details fetched for a user from Zoom.
+        :returns: list of files documents.
+        """
+        files_object = ZoomChatMessages(
+            self.config,
+            self.logger,
+            self.zoom_client,
+            self.zoom_enterprise_search_mappings,
+        )
+        files_schema = self.get_schema_fields(FILES)
+        start_time, end_time = constraint_time_range(
+            start_time=self.objects_time_range[FILES][0],
+            end_time=self.objects_time_range[FILES][1],
+            time_constraint=TIME_CONSTRAINT_FOR_CHATS,
+            logger=self.logger,
+        )
+        files_list = await client.get(
+            end_point=(
+                f"chat/users/{user['id']}/messages?page_size=300&search_key=%20&"
+                f"search_type=file&from={start_time}&to={end_time}"
+            ),
+            key="messages",
+            is_paginated=True,
+        )
+        documents = []
+        new_files_ids = []
+        loop = asyncio.get_running_loop()
+        try:
+            for file in files_list:
+                if not self.fetched_files_ids.add_if_absent(file["file_id"]):
+                    continue
+                new_files_ids.append(file["file_id"])
+                content = await client.download(file["download_url"])
+                documents.append(
+                    await loop.run_in_executor(
+                        None,
+                        files_object.create_file_document,
+                        user["id"],
+                        file,
+                        files_schema,
+                        self.enable_permission,
+                        content,
+                    )
+                )
+        except BaseException:
+            # The files are fetched again by the other users sharing them.
+            for file_id in new_files_ids:
+                self.fetched_files_ids.discard(file_id)
+            raise
+        return documents
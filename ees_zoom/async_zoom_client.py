@@ -0,0 +1,183 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""async_zoom_client module allows to call Zoom APIs from an asyncio event loop,
+so a single process can keep many requests in flight while fetching the Zoom objects."""
+import asyncio
+import functools
+import json
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from . import zoom_client
+from .rate_limiter import get_endpoint_category
+from .utils import RetryCountExceededException
+
+
+class AsyncClientUnavailableException(Exception):
+    """Exception raised when the async sync mode is selected but aiohttp is not installed."""
+
+    def __init__(
+        self,
+        message="The async zoom_sync_mode requires the aiohttp package. Install it using: pip install aiohttp",
+    ):
+        super().__init__(message)
+
+
+class AsyncZoomAPIError(Exception):
+    """Exception raised when Zoom responds to an async call with an unsuccessful status code.
+
+    Attributes:
+        status_code -- HTTP status code returned by Zoom
+        text -- body of the response returned by Zoom
+    """
+
+    def __init__(self, url, status_code, text):
+        super().__init__(f"Zoom API call to {url} failed with status {status_code}. Response: {text}")
+        self.status_code = status_code
+        self.text = text
+
+
+class AsyncZoomClient:
+    """This class is used to call different Zoom Apis concurrently from an asyncio event loop.
+    Access token generation is delegated to the synchronous ZoomClient, so both clients share
+    the same token and secrets storage."""
+
+    def __init__(self, zoom_client_object, config, logger):
+        self.zoom_client = zoom_client_object
+        self.logger = logger
+        self.retry_count = int(config.get_value("retry_count"))
+        self.concurrency = config.get_value("zoom_async_concurrency")
+        self.session = None
+        self.semaphore = None
+        self.token_lock = None
+
+    async def __aenter__(self):
+        if aiohttp is None:
+            raise AsyncClientUnavailableException
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.token_lock = asyncio.Lock()
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency)
+        )
+        return self
+
+    async def __aexit__(self, *exception_details):
+        await self.session.close()
+
+    async def ensure_token_valid(self, rejected_token=None):
+        """Refreshes the access token in a worker thread when it is expired or rejected by Zoom. Only one
+        coroutine refreshes the token at a time, the others wait for it and reuse the new token.
+        :param rejected_token: access token Zoom answered with status 401.
+        """
+        if rejected_token is None and self.zoom_client.is_token_valid():
+            # Lock-free in memory check, it only starts the background refresh close to the expiry.
+            self.zoom_client.ensure_token_valid()
+            return
+        async with self.token_lock:
+            if rejected_token is None:
+                refresh = self.zoom_client.ensure_token_valid
+            else:
+                refresh = functools.partial(
+                    self.zoom_client.handle_rejected_token, rejected_token
+                )
+            await asyncio.get_running_loop().run_in_executor(None, refresh)
+
+    async def request(self, url, headers=None, category=None):
+        """Makes a get call to the url, retrying on connection errors, expired tokens and rate limits.
+        :param url: url to call.
+        :param headers: request headers, authorization header is used when not passed.
+        :param category: Zoom rate limit category of the url, the call is not paced when not passed.
+        :returns: tuple of status code and body of the response.
+        """
+        rate_limiter = self.zoom_client.rate_limiter
+        retry = 1
+        while retry <= self.retry_count:
+            if category:
+                wait = rate_limiter.reserve(category)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            request_headers = headers
+            if request_headers is None:
+                await self.ensure_token_valid()
+                request_headers = {
+                    "authorization": f"Bearer {self.zoom_client.access_token}",
+                    "content-type": "application/json",
+                }
+            try:
+                async with self.semaphore:
+                    async with self.session.get(url, headers=request_headers) as response:
+                        status_code = response.status
+                        response_headers = response.headers
+                        body = await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exception:
+                self.logger.exception(
+                    f"Error while creating a connection. Retry count: {retry} out of {self.retry_count}. \
+                        Error: {exception}"
+                )
+                await asyncio.sleep(2**retry)
+                retry += 1
+                continue
+            if status_code == 401 and headers is None:
+                await self.ensure_token_valid(
+                    rejected_token=request_headers["authorization"][len("Bearer "):]
+                )
+                retry += 1
+                continue
+            if category and status_code == 429:
+                rate_limiter.handle_too_many_requests(category, response_headers)
+                retry += 1
+                continue
+            if category and status_code == 200:
+                rate_limiter.update_from_headers(category, response_headers)
+            return status_code, body
+        raise RetryCountExceededException
+
+    async def get(self, end_point, key, is_paginated=False):
+        """Makes get call to Zoom api endpoint
+        :param end_point: endpoint url with query parameters
+        :param key: Response json key to parse on successful get call
+        :param is_paginated: boolean to follow the next_page_token of the responses.
+        :returns api_response: list of dictionary containing response from endpoint.
+        """
+        next_page_token = True
+        api_response = []
+        category = get_endpoint_category(end_point)
+        while next_page_token:
+            url = f"{zoom_client.ZOOM_BASE_URL}{end_point}"
+            if next_page_token is not True:
+                url = f"{url}&next_page_token={next_page_token}"
+            status_code, body = await self.request(url, category=category)
+            if status_code != 200:
+                raise AsyncZoomAPIError(url, status_code, body.decode("utf-8", "replace"))
+            response = json.loads(body)
+            if key == "past_meetings":
+                return response
+            if response.get(key):
+                api_response.extend(response[key])
+            next_page_token = response.get("next_page_token") if is_paginated else None
+        return api_response
+
+    async def download(self, url):
+        """Downloads the content of a file shared in Zoom chats.
+        :param url: file download url.
+        :returns: file content in bytes, None if it could not be downloaded.
+        """
+        try:
+            status_code, body = await self.request(url, headers={})
+        except RetryCountExceededException as exception:
+            self.logger.exception(
+                f"Exception raised while fetching file content from Zoom: {exception}"
+            )
+            return None
+        if status_code != 200:
+            self.logger.error(
+                f"Unable to fetch file content from Zoom. Status code: {status_code}"
+            )
+            return None
+        return body
@@ -17,12 +17,22 @@ try:
 except ImportError:
     from cached_property import cached_property
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (FIRST_COMPLETED, ThreadPoolExecutor,
+                                as_completed, wait)
 
+from .async_sync_zoom import AsyncSyncZoom
+from .checkpointing import Checkpoint
 from .configuration import Configuration
+from .connector_queue import ConnectorQueue
+from .constant import ASYNC_SYNC_MODE, CHANNELS, GROUPS, ROLES, USERS
 from .enterprise_search_wrapper import EnterpriseSearchWrapper
+from .fingerprint_storage import FingerprintStorage
 from .local_storage import LocalStorage
+from .sharding import Shard
+from .sync_enterprise_search import SyncEnterpriseSearch
+from .sync_zoom import SyncZoom
 from .zoom_client import ZoomClient
+from .zoom_roles import RoleIndex, ZoomRoles
 
 
 class BaseCommand:
@@ -100,12 +110,29 @@ class BaseCommand:
         """Get the Zoom client instance for the running command."""
         return ZoomClient(self.config, self.logger)
 
-    def create_and_execute_jobs(self, thread_count, func, args, iterable_list):
+    @cached_property
+    def shard(self):
+        """Get the shard synced by the running command, the whole account when no --shard argument is given."""
+        return getattr(self.args, "shard", None) or Shard()
+
+    @cached_property
+    def role_index(self):
+        """Get the index of the Zoom roles shared by all the objects of the running command."""
+        roles_object = ZoomRoles(
+            self.config, self.logger, self.zoom_client, self.zoom_enterprise_search_mappings
+        )
+        return RoleIndex(roles_object, self.logger, self.config.get_value("zoom_sync_thread_count"))
+
+    def create_and_execute_jobs(
+        self, thread_count, func, args, iterable_list, follow_up_tasks=None
+    ):
         """Apply async calls using multithreading to the targeted function
         :param thread_count: Total number of threads to be spawned
         :param func: The target function on which the async calls would be made
         :param args: Arguments for the targeted function
         :param iterable_list: list to iterate over and create thread
+        :param follow_up_tasks: queue in which the calls put the list elements of the calls depending on them,
+            the follow-up calls share the same threads.
         """
         # If iterable_list is present, then iterate over the list and pass each list element
         # as an argument to the async function, else iterate over number of threads configured
@@ -116,14 +143,20 @@ class BaseCommand:
                     executor.submit(func, *args, list_element): list_element
                     for list_element in iterable_list
                 }
-                for future in as_completed(future_to_path):
-                    path = future_to_path[future]
-                    try:
-                        documents.extend(future.result())
-                    except Exception as exception:
-                        self.logger.exception(
-                            f"Error while fetching in path {path}. Error {exception}"
-                        )
+                while future_to_path:
+                    done, _ = wait(future_to_path, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path = future_to_path.pop(future)
+                        try:
+                            documents.extend(future.result())
+                        except Exception as exception:
+                            self.logger.exception(
+                                f"Error while fetching in path {path}. Error {exception}"
+                            )
+                    # The follow-up calls are queued before the call they depend on completes.
+                    while follow_up_tasks is not None and not follow_up_tasks.empty():
+                        list_element = follow_up_tasks.get()
+                        future_to_path[executor.submit(func, *args, list_element)] = list_element
             return documents
         else:
             generated_documents_ids = set()
@@ -144,7 +177,182 @@ class BaseCommand:
                         )
             return generated_documents_ids, indexed_documents_ids
 
+    def fetch_documents(self, queue, objects_time_range, indexing_type, current_time):
+        """Fetches the documents of the users from Zoom into the queue, with the asyncio event loop in the
+        async sync mode or with the Zoom sync threads otherwise, then puts the checkpoints of the time
+        dependent objects and the end signals of the indexing threads.
+        :param queue: Shared queue to fetch the stored documents
+        :param objects_time_range: Dictionary containing Time range list storing start time and end time for
+        time dependent objects.
+        :param indexing_type: type of the sync, full or incremental, stored with the checkpoints.
+        :param current_time: time stored with the checkpoints.
+        :returns: metadata of the fetched documents.
+        """
+        thread_count = self.config.get_value("zoom_sync_thread_count")
+        try:
+            is_async_sync_mode = (
+                self.config.get_value("zoom_sync_mode") == ASYNC_SYNC_MODE
+            )
+            sync_zoom_class = AsyncSyncZoom if is_async_sync_mode else SyncZoom
+            sync_zoom = sync_zoom_class(
+                self.config,
+                self.logger,
+                self.workplace_search_client,
+                self.zoom_client,
+                objects_time_range,
+                queue,
+                self.zoom_enterprise_search_mappings,
+                self.role_index,
+                self.shard,
+            )
+            try:
+                users = sync_zoom.get_all_users_from_zoom()
+                fetched_roles_id_list = sync_zoom.perform_sync(ROLES, [{}])
+                if is_async_sync_mode:
+                    metadata_of_fetched_documents = sync_zoom.perform_async_sync(users)
+                else:
+                    metadata_of_fetched_documents = self.create_and_execute_jobs(
+                        thread_count,
+                        sync_zoom.perform_sync_task,
+                        (USERS,),
+                        sync_zoom.iter_sync_tasks(USERS, users),
+                        sync_zoom.follow_up_tasks,
+                    )
+                    sync_zoom.user_statistics.save()
+            finally:
+                sync_zoom.close()
+            metadata_of_fetched_documents.extend(fetched_roles_id_list)
+            for object_type in self.config.get_value("objects"):
+                if object_type in [ROLES, CHANNELS, GROUPS]:
+                    continue
+                queue.put_checkpoint(object_type, current_time, indexing_type)
+
+            # Send end signals for each live threads to notify them to close watching the queue
+            # for any incoming documents
+            for _ in range(
+                self.config.get_value("enterprise_search_sync_thread_count")
+            ):
+                queue.end_signal()
+        except Exception as exception:
+            self.logger.error(
+                "Error while Fetching from the Zoom. Checkpoint not saved"
+            )
+            raise exception
+
+        return metadata_of_fetched_documents
+
+    def create_connector_queue(self):
+        """Creates the queue shared by the producer and the consumer. The queue is only bounded when they
+        run concurrently, a bounded queue would otherwise block the producer forever.
+        :returns: ConnectorQueue instance.
+        """
+        if not self.config.get_value("enable_pipelined_sync"):
+            return ConnectorQueue(self.logger)
+        return ConnectorQueue(
+            self.logger,
+            max_documents=self.config.get_value("connector_queue_max_documents"),
+            max_bytes=self.config.get_value("connector_queue_max_size_mb") * 1024 * 1024,
+        )
+
+    def execute_sync(self, start_producer, *producer_args):
+        """Fetches the documents from Zoom and indexes them in the Enterprise Search. When enable_pipelined_sync
+        is set, the indexing threads start at the same time as the producer instead of waiting for the whole fetch.
+        Checkpoints and doc ids are stored once all the documents are indexed.
+        :param start_producer: method fetching the documents into the queue and returning their metadata.
+        :param producer_args: arguments of the producer after the queue.
+        """
+        queue = self.create_connector_queue()
+        if not self.config.get_value("enable_pipelined_sync"):
+            metadata_of_fetched_documents = start_producer(queue, *producer_args)
+            sync_es, indexed_documents_ids = self.start_consumer(queue)
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                producer = executor.submit(
+                    self.run_pipelined_producer, queue, start_producer, producer_args
+                )
+                sync_es, indexed_documents_ids = self.start_consumer(queue)
+                # Unblocks the producer if every indexing thread stopped before the end of the fetch.
+                queue.close()
+                metadata_of_fetched_documents = producer.result()
+        self.store_sync_results(
+            sync_es, indexed_documents_ids, metadata_of_fetched_documents
+        )
+
+    def run_pipelined_producer(self, queue, start_producer, producer_args):
+        """Runs the producer next to the consumer, the consumer is stopped when the producer fails.
+        :param queue: Shared queue to fetch the stored documents
+        :param start_producer: method fetching the documents into the queue and returning their metadata.
+        :param producer_args: arguments of the producer after the queue.
+        :returns: metadata of the fetched documents.
+        """
+        try:
+            return start_producer(queue, *producer_args)
+        except Exception as exception:
+            # The indexing threads would wait for documents forever without their end signals.
+            try:
+                for _ in range(
+                    self.config.get_value("enterprise_search_sync_thread_count")
+                ):
+                    queue.end_signal()
+            except ValueError:
+                pass
+            raise exception
+
+    def start_consumer(self, queue):
+        """This method starts async calls for the consumer which is responsible for indexing documents to the
+        Enterprise Search.
+        :param queue: Shared queue to fetch the stored documents
+        :returns: SyncEnterpriseSearch instance and set of the indexed documents ids.
+        """
+        thread_count = self.config.get_value("enterprise_search_sync_thread_count")
+        sync_es = SyncEnterpriseSearch(
+            self.config,
+            self.logger,
+            self.workplace_search_client,
+            queue,
+            self.fingerprint_storage if self.config.get_value("skip_unchanged_documents") else None,
+        )
+        _, indexed_documents_ids = self.create_and_execute_jobs(
+            thread_count, sync_es.perform_sync, (), None
+        )
+        return sync_es, indexed_documents_ids
+
+    def store_sync_results(self, sync_es, indexed_documents_ids, metadata_of_fetched_documents):
+        """After successful indexing it stores checkpoints of time dependent objects and updates
+        the doc_id according to indexed documents.
+        :param sync_es: SyncEnterpriseSearch instance used by the consumer.
+        :param indexed_documents_ids: set of the indexed documents ids.
+        :param metadata_of_fetched_documents: updated list of dictionary for local storage documents.
+        """
+        checkpoint = Checkpoint(self.config, self.logger, self.shard)
+        for checkpoint_item in sync_es.checkpoints:
+            checkpoint.set_checkpoint(
+                current_time=checkpoint_item[0],
+                index_type=checkpoint_item[1],
+                obj_type=checkpoint_item[2],
+            )
+        self.logger.info(
+            f"SUMMARY : Total {len(indexed_documents_ids)} documents indexed out of "
+            f"{len(sync_es.generated_documents_ids)}, including {sync_es.skipped_documents_count} unchanged "
+            "documents which were not sent again"
+        )
+        if sync_es.error_count:
+            self.logger.debug(
+                f"Total {sync_es.error_count} documents were not successfully indexed due to the errors."
+                " The connector will attempt to index all the documents again in the next full-sync run."
+            )
+        self.local_storage.store_indexed_documents_ids(
+            metadata_of_fetched_documents, indexed_documents_ids
+        )
+        if sync_es.fingerprint_storage:
+            sync_es.fingerprint_storage.save()
+
     @cached_property
     def local_storage(self):
         """Get the object for local storage to fetch and update ids stored locally"""
-        return LocalStorage(self.logger)
+        return LocalStorage(self.logger, self.shard)
+
+    @cached_property
+    def fingerprint_storage(self):
+        """Get the object storing the fingerprints of the documents indexed by the syncs"""
+        return FingerprintStorage(self.logger, self.shard)
@@ -0,0 +1,88 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""batch_size_controller module adapts the number of documents sent in every indexing request to the
+latency, the throughput and the server errors observed for each document type."""
+import threading
+
+from .constant import BATCH_SIZE
+
+MIN_BATCH_SIZE = 10
+# Relative drop of the throughput of a request, compared to the average of the previous requests, which
+# reverses the direction the batch size is moving to.
+THROUGHPUT_TOLERANCE = 0.02
+# Weight of the last request in the average throughput.
+THROUGHPUT_SMOOTHING = 0.5
+
+
+class BatchSizeController:
+    """This class adjusts the batch size of every document type between MIN_BATCH_SIZE and BATCH_SIZE, the
+    maximum number of documents of a Workplace Search indexing request.
+
+    The batch size is halved when a request hit server errors, and reduced by a quarter when a request
+    took longer than the target latency, then grows back. Otherwise, the batch size moves by steps of a tenth,
+    reversing its direction when the throughput, in documents per second, drops. The batch size starts at
+    BATCH_SIZE and stays there as long as the throughput does not drop."""
+
+    def __init__(self, logger, target_latency, min_size=MIN_BATCH_SIZE, max_size=BATCH_SIZE):
+        """
+        :param logger: logger instance.
+        :param target_latency: maximum number of seconds an indexing request should take.
+        :param min_size: minimum batch size.
+        :param max_size: maximum batch size.
+        """
+        self.logger = logger
+        self.target_latency = target_latency
+        self.min_size = min_size
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        # The structure of the states is {'document_type': {'size': 100, 'throughput': 0.0, 'direction': 1}}
+        self.states = {}
+
+    def get_batch_size(self, document_type):
+        """Returns the number of documents to send in the next indexing request of a document type.
+        :param document_type: type of the documents, e.g. meetings.
+        :returns: batch size.
+        """
+        with self.lock:
+            return self.states.get(document_type, {}).get("size", self.max_size)
+
+    def record(self, document_type, documents_count, seconds, errors_count):
+        """Adjusts the batch size of a document type from the outcome of an indexing request.
+        :param document_type: type of the documents, e.g. meetings.
+        :param documents_count: number of documents sent in the request.
+        :param seconds: seconds spent by the request, retries included.
+        :param errors_count: number of server errors and timeouts which made the request be retried.
+        """
+        with self.lock:
+            state = self.states.setdefault(
+                document_type, {"size": self.max_size, "throughput": None, "direction": 1}
+            )
+            size = state["size"]
+            if errors_count or seconds > self.target_latency:
+                new_size = size // 2 if errors_count else size * 3 // 4
+                state["throughput"] = None
+                state["direction"] = 1
+            else:
+                throughput = documents_count / max(seconds, 0.001)
+                average_throughput = state["throughput"]
+                if average_throughput is None:
+                    average_throughput = throughput
+                elif throughput < average_throughput * (1 - THROUGHPUT_TOLERANCE):
+                    state["direction"] = -state["direction"]
+                state["throughput"] = (
+                    THROUGHPUT_SMOOTHING * throughput + (1 - THROUGHPUT_SMOOTHING) * average_throughput
+                )
+                new_size = size + state["direction"] * max(1, size // 10)
+                if new_size < self.min_size:
+                    # The throughput of larger batches can only be compared by growing the batch again.
+                    state["direction"] = 1
+            new_size = min(max(new_size, self.min_size), self.max_size)
+            if new_size != size:
+                state["size"] = new_size
+                self.logger.debug(
+                    f"Batch size of the {document_type} documents changed from {size} to {new_size}. "
+                    f"Last request: {documents_count} documents in {seconds:.2f} seconds with {errors_count} errors."
+                )
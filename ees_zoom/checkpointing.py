@@ -28,9 +28,9 @@ class IncorrectFormatError(Exception):
         checkpoint -- the checkpoint time
     """
 
-    def __init__(self, obj_type, checkpoint, inner_exception):
+    def __init__(self, obj_type, checkpoint, inner_exception, checkpoint_path=CHECKPOINT_PATH):
         super().__init__(
-            f"Start time: {checkpoint} for {obj_type} in the checkpoint file {CHECKPOINT_PATH} is not in the correct format.\
+            f"Start time: {checkpoint} for {obj_type} in the checkpoint file {checkpoint_path} is not in the correct format.\
         Expected format: {RFC_3339_DATETIME_FORMAT}. Remove the checkpoint entry for the {obj_type} \
         or fix the format to continue indexing"
         )
@@ -45,9 +45,11 @@ class Checkpoint:
     file system.
     """
 
-    def __init__(self, config, logger):
+    def __init__(self, config, logger, shard=None):
         self.config = config
         self.logger = logger
+        # Every shard of a sharded sync keeps its own checkpoint file.
+        self.checkpoint_path = shard.get_storage_path(CHECKPOINT_PATH) if shard else CHECKPOINT_PATH
 
     def get_checkpoint(self, current_time, obj_type):
         """This method fetches the checkpoint from the checkpoint file in
@@ -57,18 +59,18 @@ class Checkpoint:
         :param obj_type: key for which checkpoint json file
         """
         self.logger.info(
-            f"Fetching the checkpoint details from the checkpoint file: {CHECKPOINT_PATH} for {obj_type}"
+            f"Fetching the checkpoint details from the checkpoint file: {self.checkpoint_path} for {obj_type}"
         )
 
         start_time = self.config.get_value("start_time")
         end_time = self.config.get_value("end_time")
 
-        if os.path.exists(CHECKPOINT_PATH) and os.path.getsize(CHECKPOINT_PATH) > 0:
+        if os.path.exists(self.checkpoint_path) and os.path.getsize(self.checkpoint_path) > 0:
             self.logger.debug(
                 "Checkpoint file exists and has contents, hence considering the checkpoint time \
                     instead of start_time and end_time"
             )
-            with open(CHECKPOINT_PATH, encoding="UTF-8") as checkpoint_store:
+            with open(self.checkpoint_path, encoding="UTF-8") as checkpoint_store:
                 try:
                     checkpoint_list = json.load(checkpoint_store)
 
@@ -86,11 +88,11 @@ class Checkpoint:
                             end_time = current_time
                         except ValueError as exception:
                             raise IncorrectFormatError(
-                                obj_type, checkpoint_list.get(obj_type), exception
+                                obj_type, checkpoint_list.get(obj_type), exception, self.checkpoint_path
                             )
                 except ValueError as exception:
                     self.logger.exception(
-                        f"Error while parsing the json file of the checkpoint store from path: {CHECKPOINT_PATH}. \
+                        f"Error while parsing the json file of the checkpoint store from path: {self.checkpoint_path}. \
                         Error: {exception}"
                     )
                     self.logger.info(
@@ -99,7 +101,7 @@ class Checkpoint:
 
         else:
             self.logger.debug(
-                f"Checkpoint file does not exist at {CHECKPOINT_PATH}, considering the start_time and \
+                f"Checkpoint file does not exist at {self.checkpoint_path}, considering the start_time and \
                 end_time from the configuration file"
             )
 
@@ -116,28 +118,28 @@ class Checkpoint:
         :param obj_type: object type to set the checkpoint
         """
         try:
-            with open(CHECKPOINT_PATH, encoding="UTF-8") as checkpoint_store:
+            with open(self.checkpoint_path, encoding="UTF-8") as checkpoint_store:
                 checkpoint_list = json.load(checkpoint_store)
                 if checkpoint_list.get(obj_type):
                     self.logger.debug(
                         f"Setting the checkpoint contents: {current_time} for the {obj_type} \
-                            to the checkpoint path: {CHECKPOINT_PATH}"
+                            to the checkpoint path: {self.checkpoint_path}"
                     )
                     checkpoint_list[obj_type] = current_time
                 else:
                     self.logger.debug(
                         f"Setting the checkpoint contents: {self.config.get_value('end_time')} for the {obj_type} \
-                            to the checkpoint path: {CHECKPOINT_PATH}"
+                            to the checkpoint path: {self.checkpoint_path}"
                     )
                     checkpoint_list[obj_type] = self.config.get_value("end_time")
         except Exception as exception:
             if isinstance(exception, FileNotFoundError):
                 self.logger.debug(
-                    f"Checkpoint file not found on path: {CHECKPOINT_PATH}. Generating the checkpoint file"
+                    f"Checkpoint file not found on path: {self.checkpoint_path}. Generating the checkpoint file"
                 )
             else:
                 self.logger.exception(
-                    f"Error while fetching the json file of the checkpoint store from path: {CHECKPOINT_PATH}. \
+                    f"Error while fetching the json file of the checkpoint store from path: {self.checkpoint_path}. \
                         Error: {exception}"
                 )
             if index_type == "incremental":
@@ -146,11 +148,11 @@ class Checkpoint:
                 checkpoint_time = current_time
             self.logger.debug(
                 f"Setting the checkpoint contents: {checkpoint_time} for the {obj_type} \
-                    to the checkpoint path: {CHECKPOINT_PATH}"
+                    to the checkpoint path: {self.checkpoint_path}"
             )
             checkpoint_list = {obj_type: checkpoint_time}
 
-        with open(CHECKPOINT_PATH, "w", encoding="UTF-8") as checkpoint_store:
+        with open(self.checkpoint_path, "w", encoding="UTF-8") as checkpoint_store:
             try:
                 json.dump(checkpoint_list, checkpoint_store, indent=4)
                 self.logger.info(f"Successfully saved the checkpoint for {obj_type}")
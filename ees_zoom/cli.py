@@ -23,12 +23,15 @@ from .deletion_sync_command import DeletionSyncCommand
 from .full_sync_command import FullSyncCommand
 from .incremental_sync_command import IncrementalSyncCommand
 from .permission_sync_command import PermissionSyncCommand
+from .sharding import parse_shard
+from .user_statistics_command import UserStatisticsCommand
 
 CMD_BOOTSTRAP = "bootstrap"
 CMD_FULL_SYNC = "full-sync"
 CMD_INCREMENTAL_SYNC = "incremental-sync"
 CMD_DELETION_SYNC = "deletion-sync"
 CMD_PERMISSION_SYNC = "permission-sync"
+CMD_USER_STATISTICS = "user-statistics"
 
 
 commands = {
@@ -37,9 +40,25 @@ commands = {
     CMD_INCREMENTAL_SYNC: IncrementalSyncCommand,
     CMD_DELETION_SYNC: DeletionSyncCommand,
     CMD_PERMISSION_SYNC: PermissionSyncCommand,
+    CMD_USER_STATISTICS: UserStatisticsCommand,
 }
 
 
+def add_shard_argument(parser):
+    """Adds the --shard argument to the parser of a command.
+    :param parser: parser of the command.
+    """
+    parser.add_argument(
+        "-s",
+        "--shard",
+        required=False,
+        type=parse_shard,
+        metavar="INDEX/COUNT",
+        help="Sync only the users of the shard INDEX out of COUNT shards, e.g. 0/4. "
+        "The shard 0 also syncs the roles and groups",
+    )
+
+
 def _parser():
     """Get a configured parser for the module.
     This method will initialize argument parser with a list
@@ -71,10 +90,19 @@ def _parser():
         metavar="ENTERPRISE_SEARCH_ADMIN_USER_NAME",
         help="Username of the workplace search admin account",
     )
-    subparsers.add_parser(CMD_FULL_SYNC)
-    subparsers.add_parser(CMD_INCREMENTAL_SYNC)
-    subparsers.add_parser(CMD_DELETION_SYNC)
+    for command_name in [CMD_FULL_SYNC, CMD_INCREMENTAL_SYNC, CMD_DELETION_SYNC]:
+        add_shard_argument(subparsers.add_parser(command_name))
     subparsers.add_parser(CMD_PERMISSION_SYNC)
+    user_statistics = subparsers.add_parser(CMD_USER_STATISTICS)
+    add_shard_argument(user_statistics)
+    user_statistics.add_argument(
+        "-t",
+        "--top",
+        required=False,
+        type=int,
+        metavar="USERS_COUNT",
+        help="Number of the most expensive users to show, all the users by default",
+    )
     return parser
 
 
@@ -3,21 +3,131 @@
 # or more contributor license agreements. Licensed under the Elastic License 2.0;
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
-import multiprocessing
+import collections
+import queue
 import threading
-from multiprocessing.queues import Queue
-from .constant import BATCH_SIZE
+import time
 
-from .utils import split_documents_into_equal_chunks
+from .constant import BATCH_SIZE
+from .utils import encode_document, split_documents_into_equal_chunks
 
 
-class ConnectorQueue(Queue):
-    """Class to support additional queue operations specific to the connector"""
+class ConnectorQueue:
+    """Class to support additional queue operations specific to the connector.
+    The producers and the consumers are threads of the same process, so the messages are handed over
+    in memory without being pickled. The queue can be bounded by the number of documents and by their
+    size, producers then block until the consumers catch up. Checkpoints and end signals are never blocked."""
 
-    def __init__(self, logger):
-        ctx = multiprocessing.get_context()
+    def __init__(self, logger, max_documents=0, max_bytes=0):
+        """
+        :param logger: logger instance.
+        :param max_documents: maximum number of documents waiting in the queue, 0 for no limit.
+        :param max_bytes: maximum size in bytes of the documents waiting in the queue, 0 for no limit.
+        """
         self.logger = logger
-        super(ConnectorQueue, self).__init__(ctx=ctx)
+        self.max_documents = max_documents
+        self.max_bytes = max_bytes
+        self.messages = collections.deque()
+        self.documents_count = 0
+        self.documents_size = 0
+        self.is_closed = False
+        self.condition = threading.Condition(threading.Lock())
+
+    def get_message_weight(self, message):
+        """Returns the number of documents and the size of a message counted against the limits of the queue.
+        :param message: message put in the queue.
+        :returns: tuple of documents count and size in bytes.
+        """
+        if not isinstance(message, dict) or message.get("type") != "document_list":
+            return 0, 0
+        documents = message.get("data") or []
+        if not self.max_bytes:
+            return len(documents), 0
+        # The size is measured as the consumer measures its batches, which reuses the encoded documents.
+        encoded_documents = [encode_document(document) for document in documents]
+        message["encoded_data"] = encoded_documents
+        return len(documents), sum(len(encoded_document) for encoded_document in encoded_documents)
+
+    def is_full(self, documents_count, size):
+        """Checks if a message of the given weight has to wait for the consumers.
+        A message is always accepted in an empty queue, so a document larger than the limit is not blocked forever.
+        :param documents_count: number of documents in the message.
+        :param size: size in bytes of the documents in the message.
+        :returns: boolean whether the message exceeds the limits of the queue.
+        """
+        if not self.documents_count or not documents_count:
+            return False
+        if self.max_documents and self.documents_count + documents_count > self.max_documents:
+            return True
+        return bool(self.max_bytes and self.documents_size + size > self.max_bytes)
+
+    def put(self, message, block=True, timeout=None):
+        """Puts a message in the queue, waiting for free space when the queue is bounded.
+        :param message: message to put in the queue.
+        :param block: boolean whether to wait for free space.
+        :param timeout: maximum number of seconds to wait, None to wait without limit.
+
+        Raises:
+            queue.Full: when the queue is still full after waiting.
+            ValueError: when the queue is closed, before or while waiting.
+        """
+        documents_count, size = self.get_message_weight(message)
+        with self.condition:
+            if self.is_closed:
+                raise ValueError("Queue is closed")
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self.is_full(documents_count, size):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise queue.Full
+                self.condition.wait(remaining)
+                if self.is_closed:
+                    raise ValueError("Queue is closed")
+            self.messages.append((message, documents_count, size))
+            self.documents_count += documents_count
+            self.documents_size += size
+            self.condition.notify_all()
+
+    def get(self, block=True, timeout=None):
+        """Removes and returns the oldest message of the queue, waiting for one when it is empty.
+        :param block: boolean whether to wait for a message.
+        :param timeout: maximum number of seconds to wait, None to wait without limit.
+        :returns: the oldest message of the queue.
+
+        Raises:
+            queue.Empty: when no message arrived while waiting.
+        """
+        with self.condition:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self.messages:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise queue.Empty
+                self.condition.wait(remaining)
+            message, documents_count, size = self.messages.popleft()
+            self.documents_count -= documents_count
+            self.documents_size -= size
+            self.condition.notify_all()
+        return message
+
+    def qsize(self):
+        """Returns the number of messages waiting in the queue."""
+        with self.condition:
+            return len(self.messages)
+
+    def empty(self):
+        """Checks if no message is waiting in the queue."""
+        return not self.qsize()
+
+    def close(self):
+        """Indicates that no more messages will be put in the queue, the waiting messages can still be read.
+        The producers waiting for free space stop waiting and raise ValueError."""
+        with self.condition:
+            self.is_closed = True
+            self.condition.notify_all()
+
+    def join_thread(self):
+        """Kept for compatibility with multiprocessing queues, no feeder thread has to be joined."""
 
     def end_signal(self):
         """Send an terminate signal to indicate the queue can be closed"""
@@ -18,3 +18,5 @@ MEETINGS = "meetings"
 PAST_MEETINGS = "past_meetings"
 RECORDINGS = "recordings"
 CHANNELS = "channels"
+THREADED_SYNC_MODE = "threaded"
+ASYNC_SYNC_MODE = "async"
@@ -14,6 +14,11 @@ import requests
 from dateutil.relativedelta import relativedelta
 from iteration_utilities import unique_everseen
 
+try:
+    from functools import cached_property
+except ImportError:
+    from cached_property import cached_property
+
 from .base_command import BaseCommand
 from .constant import (BATCH_SIZE, CHANNELS, CHATS, FILES, GROUPS, MEETINGS,
                        PAST_MEETINGS, RECORDINGS, RFC_3339_DATETIME_FORMAT,
@@ -21,6 +26,7 @@ from .constant import (BATCH_SIZE, CHANNELS, CHATS, FILES, GROUPS, MEETINGS,
 from .sync_zoom import SyncZoom
 from .utils import (get_current_time,
                     split_documents_into_equal_chunks)
+from .zoom_client import ZoomClient
 
 MULTITHREADED_OBJECTS_FOR_DELETION = "multithreaded_objects_for_deletion"
 ROLES_FOR_DELETION = "roles_for_deletion"
@@ -47,6 +53,12 @@ class DeletionSyncCommand(BaseCommand):
         self.end_time = get_current_time()
         self.global_deletion_ids = []
 
+    @cached_property
+    def zoom_client(self):
+        """Get the Zoom client instance for the deletion sync. The deletion sync checks whether the objects
+        still exist in Zoom, so it never reads the responses from the response cache."""
+        return ZoomClient(self.config, self.logger, use_response_cache=False)
+
     def delete_documents(self, ids_list, storage_with_collection):
         """Deletes the documents of specified ids from Workplace Search
         :param ids_list: list of ids to delete the documents from Workplace Search
@@ -59,6 +71,10 @@ class DeletionSyncCommand(BaseCommand):
                 self.workplace_search_client.delete_documents(
                     document_ids=chunk,
                 )
+            # A deleted document is indexed again if it shows up again, even unchanged. The fingerprints are
+            # removed even when skip_unchanged_documents is disabled, as it may be enabled again later.
+            self.fingerprint_storage.remove(ids_list)
+            self.fingerprint_storage.save()
             document_id_index = 0
             size_of_collection = len(storage_with_collection["global_keys"])
             while document_id_index < size_of_collection:
@@ -200,15 +216,20 @@ class DeletionSyncCommand(BaseCommand):
                 objects_time_range,
                 {},
                 {},
+                self.role_index,
+                self.shard,
             )
-            partitioned_users_buckets = sync_zoom.get_all_users_from_zoom()
-            _ = sync_zoom.perform_sync(ROLES_FOR_DELETION, [{}])
-            global_keys = self.create_and_execute_jobs(
-                self.zoom_sync_thread_count,
-                sync_zoom.perform_sync,
-                (MULTITHREADED_OBJECTS_FOR_DELETION,),
-                partitioned_users_buckets,
-            )
+            try:
+                users = sync_zoom.get_all_users_from_zoom()
+                _ = sync_zoom.perform_sync(ROLES_FOR_DELETION, [{}])
+                global_keys = self.create_and_execute_jobs(
+                    self.zoom_sync_thread_count,
+                    sync_zoom.perform_sync_task,
+                    (MULTITHREADED_OBJECTS_FOR_DELETION,),
+                    sync_zoom.iter_sync_tasks(MULTITHREADED_OBJECTS_FOR_DELETION, users),
+                )
+            finally:
+                sync_zoom.close()
         except Exception:
             self.logger.error(
                 f"Error while checking objects: {CHANNELS}, {RECORDINGS}, {CHATS} and {FILES} for deletion from zoom."
@@ -365,3 +386,4 @@ class DeletionSyncCommand(BaseCommand):
         storage_with_collection["delete_keys"] = []
         self.logger.info("Updating the local storage")
         self.local_storage.update_storage(storage_with_collection)
+        self.zoom_client.log_statistics()
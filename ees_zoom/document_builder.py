@@ -0,0 +1,101 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""document_builder module builds the Enterprise Search documents from the pages fetched from Zoom
+in worker processes, so building the documents of a large account uses all the cores instead
+of competing for the GIL with the threads fetching the pages."""
+import logging
+import multiprocessing
+
+from .constant import CHATS, MEETINGS, RECORDINGS
+from .zoom_chat_messages import ZoomChatMessages
+from .zoom_meetings import ZoomMeetings
+from .zoom_recordings import ZoomRecordings
+
+# Method creating the document of an item of a page fetched from Zoom, and whether it returns a list of documents.
+DOCUMENT_CREATORS = {
+    MEETINGS: ("create_meeting_document", False),
+    RECORDINGS: ("create_recordings_documents", True),
+    CHATS: ("create_chat_document", False),
+}
+
+# Objects creating the documents in a worker process, set once by initialize_worker.
+worker_objects = {}
+
+
+def initialize_worker(config, zoom_enterprise_search_mappings):
+    """Creates the objects creating the documents in a worker process.
+    :param config: Configuration object.
+    :param zoom_enterprise_search_mappings: dictionary containing Zoom -> Enterprise search user_id mappings.
+    """
+    logger = logging.getLogger(__name__)
+    for object_type, zoom_class in [
+        (MEETINGS, ZoomMeetings),
+        (RECORDINGS, ZoomRecordings),
+        (CHATS, ZoomChatMessages),
+    ]:
+        worker_objects[object_type] = zoom_class(config, logger, None, zoom_enterprise_search_mappings)
+
+
+def create_documents_in_worker(object_type, user_id, items, schema, enable_permission):
+    """Creates the documents of the items of a page fetched from Zoom in a worker process.
+    :param object_type: MEETINGS, RECORDINGS or CHATS.
+    :param user_id: String of Zoom user id.
+    :param items: list of dictionaries fetched from Zoom.
+    :param schema: dictionary of fields to be indexed for the object type.
+    :param enable_permission: boolean to check if permission sync is enabled or not.
+    :returns: list of documents.
+    """
+    method_name, is_list = DOCUMENT_CREATORS[object_type]
+    create_document = getattr(worker_objects[object_type], method_name)
+    documents = []
+    for item in items:
+        if is_list:
+            documents.extend(create_document(user_id, item, schema, enable_permission))
+        else:
+            documents.append(create_document(user_id, item, schema, enable_permission))
+    return documents
+
+
+class DocumentBuilder:
+    """This class creates the documents of the pages fetched by the sync threads in a pool of worker
+    processes. The calling thread waits for the documents of its page without holding the GIL, so the
+    other threads keep fetching pages meanwhile."""
+
+    def __init__(self, config, logger, zoom_enterprise_search_mappings, process_count):
+        """
+        :param config: Configuration object.
+        :param logger: logger instance.
+        :param zoom_enterprise_search_mappings: dictionary containing Zoom -> Enterprise search user_id mappings.
+        :param process_count: number of worker processes.
+        """
+        self.logger = logger
+        # The workers are spawned rather than forked, as forking a process running threads is unsafe.
+        self.pool = multiprocessing.get_context("spawn").Pool(
+            process_count,
+            initializer=initialize_worker,
+            initargs=(config, zoom_enterprise_search_mappings),
+        )
+        self.logger.info(f"Building the documents in {process_count} worker processes.")
+
+    def create_documents(self, object_type, user_id, items, schema, enable_permission):
+        """Creates the documents of the items of a page fetched from Zoom in a worker process.
+        :param object_type: MEETINGS, RECORDINGS or CHATS.
+        :param user_id: String of Zoom user id.
+        :param items: list of dictionaries fetched from Zoom.
+        :param schema: dictionary of fields to be indexed for the object type.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :returns: list of documents.
+        """
+        if not items:
+            return []
+        return self.pool.apply_async(
+            create_documents_in_worker, (object_type, user_id, items, schema, enable_permission)
+        ).get()
+
+    def close(self):
+        """Stops the worker processes once they built the documents requested."""
+        self.pool.close()
+        self.pool.join()
@@ -222,11 +222,13 @@ class EnterpriseSearchWrapper:
             ServiceUnavailableError,
         )
     )
-    def index_documents(self, documents, timeout):
+    def index_documents(self, documents, timeout, on_error=None):
         """Indexes one or more new documents into a custom content source, or updates one
         or more existing documents
-        :param documents: list of documents to be indexed
+        :param documents: list of documents to be indexed, or bytes of the JSON encoded documents sent as is.
+            The encoded documents are sent again as is when the request is retried
         :param timeout: Timeout in seconds
+        :param on_error: function called with the server errors and timeouts the request is retried for
         """
         try:
             responses = self.workplace_search_client.index_documents(
@@ -243,6 +245,8 @@ class EnterpriseSearchWrapper:
             self.logger.exception(
                 f"Error while indexing the documents. Error: {exception}"
             )
+            if on_error:
+                on_error(exception)
             raise exception
         except Exception as exception:
             self.logger.exception(f"Error while indexing the documents. Error: {exception}")
@@ -0,0 +1,147 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""fingerprint_storage module persists a fingerprint of the content of every indexed document, so the syncs
+only send to Enterprise Search the documents which changed since they were last indexed."""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Advisory file locks are not available on Windows, the syncs are then only coordinated in process.
+    fcntl = None
+
+FINGERPRINTS_PATH = os.path.join(os.path.dirname(__file__), "doc_fingerprints.json")
+
+
+def get_document_fingerprint(encoded_document):
+    """Returns the fingerprint of the content of a document. The encoded document holds every field sent to
+    Enterprise Search, e.g. the title, the body, the url and the _allow_permissions.
+    :param encoded_document: bytes of the JSON encoded document.
+    :returns: hexadecimal digest of the document.
+    """
+    return hashlib.blake2b(encoded_document, digest_size=16).hexdigest()
+
+
+class FingerprintStorage:
+    """This class stores the fingerprint of every document indexed into Enterprise Search, next to the doc_id.json.
+    The syncs and the deletion sync run as separate processes, so the fingerprints recorded and removed by a
+    command are merged into the stored ones while holding an advisory lock, and the file is replaced atomically.
+
+    The structure of the doc_fingerprints.json is {'document_id': 'fingerprint'}"""
+
+    def __init__(self, logger, shard=None):
+        self.logger = logger
+        # Every shard of a sharded sync keeps the fingerprints of its own documents.
+        self.fingerprints_path = (
+            shard.get_storage_path(FINGERPRINTS_PATH) if shard else FINGERPRINTS_PATH
+        )
+        self.lock = threading.Lock()
+        self.fingerprints = None
+        # Changes of the running command, not stored yet.
+        self.recorded_fingerprints = {}
+        self.removed_ids = set()
+
+    @contextmanager
+    def file_lock(self):
+        """Holds the exclusive advisory lock shared by all the processes updating the fingerprints."""
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.fingerprints_path}.lock", "a", encoding="utf-8") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def read_fingerprints(self):
+        """Reads the stored fingerprints.
+        :returns: dictionary of the fingerprints by document id, empty when they can not be read.
+        """
+        try:
+            with open(self.fingerprints_path, encoding="utf-8") as fingerprints_file:
+                return json.load(fingerprints_file)
+        except FileNotFoundError:
+            self.logger.debug("Document fingerprints were not found.")
+        except ValueError as exception:
+            self.logger.exception(
+                f"Error while parsing the document fingerprints from path: {self.fingerprints_path}. "
+                f"Error: {exception}"
+            )
+        return {}
+
+    def load_fingerprints(self):
+        """Returns the fingerprints stored by the previous syncs, they are read once.
+        :returns: dictionary of the fingerprints by document id.
+        """
+        with self.lock:
+            if self.fingerprints is None:
+                self.fingerprints = self.read_fingerprints()
+            return self.fingerprints
+
+    def is_unchanged(self, document_id, fingerprint):
+        """Checks if a document was indexed with the same content by a previous sync.
+        :param document_id: id of the document.
+        :param fingerprint: fingerprint of the document.
+        :returns: boolean whether the document is unchanged.
+        """
+        return self.load_fingerprints().get(str(document_id)) == fingerprint
+
+    def record(self, document_id, fingerprint):
+        """Records the fingerprint of a document indexed by the running sync.
+        :param document_id: id of the document.
+        :param fingerprint: fingerprint of the document.
+        """
+        fingerprints = self.load_fingerprints()
+        with self.lock:
+            fingerprints[str(document_id)] = fingerprint
+            self.recorded_fingerprints[str(document_id)] = fingerprint
+            self.removed_ids.discard(str(document_id))
+
+    def remove(self, document_ids):
+        """Removes the fingerprints of documents deleted from Enterprise Search, so they are indexed again if
+        they show up again.
+        :param document_ids: list of ids of the deleted documents.
+        """
+        fingerprints = self.load_fingerprints()
+        with self.lock:
+            for document_id in document_ids:
+                fingerprints.pop(str(document_id), None)
+                self.recorded_fingerprints.pop(str(document_id), None)
+                self.removed_ids.add(str(document_id))
+
+    def save(self):
+        """Applies the fingerprints recorded and removed by the running command to the stored fingerprints,
+        which may have been updated by another command since they were loaded."""
+        with self.lock:
+            if not self.recorded_fingerprints and not self.removed_ids:
+                return
+            with self.file_lock():
+                fingerprints = self.read_fingerprints()
+                for document_id in self.removed_ids:
+                    fingerprints.pop(document_id, None)
+                fingerprints.update(self.recorded_fingerprints)
+                file_descriptor, temporary_path = tempfile.mkstemp(
+                    dir=os.path.dirname(self.fingerprints_path), prefix=".doc_fingerprints-", suffix=".json"
+                )
+                try:
+                    with os.fdopen(file_descriptor, "w", encoding="utf-8") as fingerprints_file:
+                        json.dump(fingerprints, fingerprints_file)
+                    os.replace(temporary_path, self.fingerprints_path)
+                except Exception as exception:
+                    self.logger.exception(
+                        f"Error while updating the document fingerprints. Error: {exception}"
+                    )
+                    if os.path.exists(temporary_path):
+                        os.remove(temporary_path)
+                    return
+            self.recorded_fingerprints = {}
+            self.removed_ids = set()
@@ -12,11 +12,7 @@
 from datetime import datetime
 
 from .base_command import BaseCommand
-from .checkpointing import Checkpoint
-from .connector_queue import ConnectorQueue
-from .constant import CHANNELS, GROUPS, RFC_3339_DATETIME_FORMAT, ROLES, USERS
-from .sync_enterprise_search import SyncEnterpriseSearch
-from .sync_zoom import SyncZoom
+from .constant import CHANNELS, GROUPS, RFC_3339_DATETIME_FORMAT, ROLES
 from .utils import get_current_time
 
 INDEXING_TYPE = "full"
@@ -33,7 +29,6 @@ class FullSyncCommand(BaseCommand):
         self.logger.debug("Starting the full sync..")
         current_time = get_current_time()
         objects_time_range = {}
-        thread_count = self.config.get_value("zoom_sync_thread_count")
         for object_type in self.config.get_value("objects"):
             if object_type in [ROLES, CHANNELS, GROUPS]:
                 continue
@@ -52,83 +47,12 @@ class FullSyncCommand(BaseCommand):
                 ),
             ]
             objects_time_range[object_type] = start_time_end_time_list
-        try:
-            sync_zoom = SyncZoom(
-                self.config,
-                self.logger,
-                self.workplace_search_client,
-                self.zoom_client,
-                objects_time_range,
-                queue,
-                self.zoom_enterprise_search_mappings,
-            )
-            partitioned_users_lists = sync_zoom.get_all_users_from_zoom()
-            fetched_roles_id_list = sync_zoom.perform_sync(ROLES, [{}])
-            metadata_of_fetched_documents = self.create_and_execute_jobs(
-                thread_count,
-                sync_zoom.perform_sync,
-                (USERS,),
-                partitioned_users_lists,
-            )
-            metadata_of_fetched_documents.extend(fetched_roles_id_list)
-            for object_type in self.config.get_value("objects"):
-                if object_type in [ROLES, CHANNELS, GROUPS]:
-                    continue
-                queue.put_checkpoint(object_type, current_time, INDEXING_TYPE)
-
-            # Send end signals for each live threads to notify them to close watching the queue
-            # for any incoming documents
-            for _ in range(
-                self.config.get_value("enterprise_search_sync_thread_count")
-            ):
-                queue.end_signal()
-        except Exception as exception:
-            self.logger.error(
-                "Error while Fetching from the Zoom. Checkpoint not saved"
-            )
-            raise exception
-
-        return metadata_of_fetched_documents
-
-    def start_consumer(self, queue, metadata_of_fetched_documents):
-        """This method starts async calls for the consumer which is responsible for indexing documents to the
-        Enterprise Search.After successful indexing it stores checkpoints of time dependent objects and updates
-        the doc_id according to indexed documents.
-        :param queue: Shared queue to fetch the stored documents
-        :param metadata_of_fetched_documents: updated list of dictionary for local storage documents.
-        """
-        checkpoint = Checkpoint(self.config, self.logger)
-        thread_count = self.config.get_value("enterprise_search_sync_thread_count")
-        sync_es = SyncEnterpriseSearch(
-            self.config, self.logger, self.workplace_search_client, queue
-        )
-
-        generated_documents_ids, indexed_documents_ids = self.create_and_execute_jobs(
-            thread_count, sync_es.perform_sync, (), None
-        )
-        for checkpoint_item in sync_es.checkpoints:
-            checkpoint.set_checkpoint(
-                current_time=checkpoint_item[0],
-                index_type=checkpoint_item[1],
-                obj_type=checkpoint_item[2],
-            )
-        self.logger.info(
-            f"SUMMARY : Total {len(indexed_documents_ids)} documents indexed out of {len(generated_documents_ids)}"
-        )
-        if sync_es.error_count:
-            self.logger.debug(
-                f"Total {sync_es.error_count} documents were not successfully indexed due to the errors."
-                " The connector will attempt to index all the documents again in the next full-sync run."
-            )
-        self.local_storage.store_indexed_documents_ids(
-            metadata_of_fetched_documents, indexed_documents_ids
-        )
+        return self.fetch_documents(queue, objects_time_range, INDEXING_TYPE, current_time)
 
     def execute(self):
         """This function execute the full sync."""
         current_time = get_current_time()
         self.logger.info(f"Indexing started at: {current_time}")
-        queue = ConnectorQueue(self.logger)
-        metadata_of_fetched_documents = self.start_producer(queue)
-        self.start_consumer(queue, metadata_of_fetched_documents)
+        self.execute_sync(self.start_producer)
         self.logger.info(f"Indexing ended at: {get_current_time()}")
+        self.zoom_client.log_statistics()
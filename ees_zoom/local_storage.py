@@ -26,18 +26,20 @@ class LocalStorage:
     Use this class to perform read/write operations to the doc_id.json file(Local Storage)
     """
 
-    def __init__(self, logger):
+    def __init__(self, logger, shard=None):
         self.logger = logger
+        # Every shard of a sharded sync keeps the ids of its own documents.
+        self.ids_path = shard.get_storage_path(IDS_PATH) if shard else IDS_PATH
 
     def load_storage(self):
         """This method fetches the contents of doc_id.json(local ids storage)"""
         try:
-            with open(IDS_PATH, encoding="utf-8") as ids_file:
+            with open(self.ids_path, encoding="utf-8") as ids_file:
                 try:
                     return json.load(ids_file)
                 except ValueError as exception:
                     self.logger.exception(
-                        f"Error while parsing the json file of the ids store from path: {IDS_PATH}. Error: {exception}"
+                        f"Error while parsing the json file of the ids store from path: {self.ids_path}. Error: {exception}"
                     )
                     return {"global_keys": []}
         except FileNotFoundError:
@@ -48,7 +50,7 @@ class LocalStorage:
         """This method is used to update the ids stored in doc_id.json file
         :param ids: updated ids to be stored in the doc_id.json file
         """
-        with open(IDS_PATH, "w", encoding="utf-8") as ids_file:
+        with open(self.ids_path, "w", encoding="utf-8") as ids_file:
             try:
                 json.dump(ids, ids_file, indent=4)
             except ValueError as exception:
@@ -11,7 +11,6 @@
 import os
 
 from .base_command import BaseCommand
-from .zoom_roles import ZoomRoles
 
 
 class PermissionSyncDisabledException(Exception):
@@ -73,21 +72,17 @@ class PermissionSyncCommand(BaseCommand):
 
     def set_permissions_list(self, mappings):
         """Method fetches roles and its members from zoom along with list of permissions associated with each
-        role and adds fetched permissions to enterprise search users.
+        role and adds the permissions of the roles of each mapped user to its enterprise search users.
         :param mappings: Zoom-Enterprise search mapping dictionary
         """
-        roles_obj = ZoomRoles(self.config, self.logger, self.zoom_client, mappings)
-        roles_obj.set_list_of_roles_from_zoom()
-        for role in roles_obj.roles_list:
-            role_permissions = roles_obj.fetch_role_permissions(role["id"])
-            role_members_ids = roles_obj.fetch_members_of_role(role["id"])
-            for zoom_user, enterprise_search_users in mappings.items():
-                if zoom_user in role_members_ids:
-                    for enterprise_search_user in enterprise_search_users:
-                        role_permissions.append(enterprise_search_user)
-                        self.workplace_search_client.add_permissions(
-                            enterprise_search_user, role_permissions
-                        )
+        for zoom_user, enterprise_search_users in mappings.items():
+            if zoom_user not in self.role_index.get_users_roles():
+                continue
+            role_permissions = self.role_index.get_user_privileges(zoom_user)
+            for enterprise_search_user in enterprise_search_users:
+                self.workplace_search_client.add_permissions(
+                    enterprise_search_user, role_permissions + [enterprise_search_user]
+                )
 
     def execute(self):
         """Runs the permission indexing logic.
@@ -104,6 +99,7 @@ class PermissionSyncCommand(BaseCommand):
         ):
             self.remove_all_permissions()
             self.set_permissions_list(self.zoom_enterprise_search_mappings)
+            self.zoom_client.log_statistics()
         else:
             self.logger.error(
                 f"Could not find the users mapping file at the location: {self.user_mapping} or the file is empty."
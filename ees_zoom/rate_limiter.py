@@ -0,0 +1,205 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""rate_limiter module paces the Zoom API calls of all the sync threads with one token bucket
+per Zoom rate limit category, so the connector runs at the highest sustainable request rate."""
+import re
+import threading
+import time
+from datetime import datetime
+
+from .constant import RFC_3339_DATETIME_FORMAT
+
+LIGHT = "light"
+MEDIUM = "medium"
+HEAVY = "heavy"
+RESOURCE_INTENSIVE = "resource_intensive"
+
+# Requests per second allowed by Zoom for each category on Pro accounts.
+DEFAULT_RATE_LIMITS = {
+    LIGHT: 30,
+    MEDIUM: 20,
+    HEAVY: 10,
+    RESOURCE_INTENSIVE: 5,
+}
+
+# Zoom API categories of the endpoints used by the connector, matched against the endpoint path.
+ENDPOINT_CATEGORIES = [
+    (re.compile(r"^report/"), HEAVY),
+    (re.compile(r"^past_meetings/[^/?]+$"), LIGHT),
+    (re.compile(r"^(users|meetings|groups|roles)/[^/?]+$"), LIGHT),
+]
+
+RATE_LIMIT_CATEGORY_HEADER = "X-RateLimit-Category"
+RATE_LIMIT_TYPE_HEADER = "X-RateLimit-Type"
+RATE_LIMIT_LIMIT_HEADER = "X-RateLimit-Limit"
+RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
+RETRY_AFTER_HEADER = "Retry-After"
+PER_SECOND_LIMIT_TYPE = "QPS"
+# Pause used when Zoom answers with 429 without telling when to retry.
+DEFAULT_RETRY_AFTER = 1
+
+
+def get_endpoint_category(end_point):
+    """Returns the Zoom rate limit category of the endpoint.
+    :param end_point: endpoint url relative to the Zoom API base url, with or without query parameters.
+    :returns: name of the rate limit category.
+    """
+    path = end_point.split("?", 1)[0]
+    for pattern, category in ENDPOINT_CATEGORIES:
+        if pattern.search(path):
+            return category
+    return MEDIUM
+
+
+def get_configured_rate_limit(config, category):
+    """Returns the requests per second allowed for the category, as configured or by default.
+    :param config: Configuration object.
+    :param category: name of the rate limit category.
+    :returns: requests allowed per second.
+    """
+    return (config.get_value("zoom_rate_limits") or {}).get(category, DEFAULT_RATE_LIMITS[category])
+
+
+def parse_retry_after(value, now=None):
+    """Converts the value of the Retry-After header into the number of seconds to wait.
+    Zoom sends seconds for the per second limits and a timestamp once a daily limit is reached.
+    :param value: value of the Retry-After header.
+    :param now: epoch time used as reference, current time by default.
+    :returns: seconds to wait, None if the value could not be parsed.
+    """
+    if not value:
+        return None
+    now = time.time() if now is None else now
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_time = datetime.strptime(value, RFC_3339_DATETIME_FORMAT)
+    except ValueError:
+        return None
+    return max((retry_time - datetime(1970, 1, 1)).total_seconds() - now, 0)
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second. Callers reserve a token and get back
+    the time to wait for it, so the sleep happens outside the lock and the waiting callers
+    are spread evenly instead of waking up together."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def refill(self, now):
+        """Adds the tokens accumulated since the last update. Must be called with the lock held.
+        :param now: monotonic time.
+        """
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def reserve(self):
+        """Takes one token from the bucket.
+        :returns: seconds the caller has to wait before sending its request.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.refill(now)
+            self.tokens -= 1
+            wait = 0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(wait, self.paused_until - now)
+
+    def set_rate(self, rate):
+        """Updates the refill rate of the bucket with the limit announced by Zoom.
+        :param rate: requests allowed per second.
+        """
+        with self.lock:
+            self.refill(time.monotonic())
+            self.rate = rate
+            self.capacity = rate
+            self.tokens = min(self.tokens, self.capacity)
+
+    def pause(self, seconds):
+        """Stops handing out tokens for the given number of seconds.
+        :param seconds: seconds to pause the bucket for.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.refill(now)
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = min(self.tokens, 0)
+
+
+class RateLimiter:
+    """This class keeps one token bucket per Zoom rate limit category and adapts them
+    to the X-RateLimit-* and Retry-After headers returned by Zoom."""
+
+    def __init__(self, config, logger):
+        self.logger = logger
+        self.buckets = {
+            category: TokenBucket(get_configured_rate_limit(config, category))
+            for category in DEFAULT_RATE_LIMITS
+        }
+        self.throttled_requests_count = 0
+        self.lock = threading.Lock()
+
+    def reserve(self, category):
+        """Reserves a request slot in the bucket of the category.
+        :param category: name of the rate limit category.
+        :returns: seconds to wait before sending the request.
+        """
+        return self.buckets[category].reserve()
+
+    def acquire(self, category):
+        """Blocks the calling thread until a request of the category can be sent.
+        :param category: name of the rate limit category.
+        """
+        wait = self.reserve(category)
+        if wait > 0:
+            time.sleep(wait)
+
+    def update_from_headers(self, category, headers):
+        """Adapts the bucket of the category to the rate limit headers of a successful response.
+        :param category: name of the rate limit category.
+        :param headers: response headers.
+        """
+        bucket = self.buckets[category]
+        limit = str(headers.get(RATE_LIMIT_LIMIT_HEADER) or "")
+        remaining = str(headers.get(RATE_LIMIT_REMAINING_HEADER) or "")
+        limit_type = str(headers.get(RATE_LIMIT_TYPE_HEADER) or PER_SECOND_LIMIT_TYPE)
+        if limit_type != PER_SECOND_LIMIT_TYPE:
+            # Daily limits are only enforced once Zoom reports them exhausted.
+            return
+        if limit.isdigit() and int(limit) > 0 and int(limit) != bucket.rate:
+            self.logger.debug(
+                f"Updating the {category} rate limit from {bucket.rate} to {limit} requests per second."
+            )
+            bucket.set_rate(int(limit))
+        if remaining == "0":
+            bucket.pause(1)
+
+    def handle_too_many_requests(self, category, headers):
+        """Pauses the bucket of the category after Zoom rejected a request with status 429.
+        :param category: name of the rate limit category.
+        :param headers: response headers.
+        :returns: seconds the bucket is paused for.
+        """
+        with self.lock:
+            self.throttled_requests_count += 1
+        wait = parse_retry_after(headers.get(RETRY_AFTER_HEADER))
+        if wait is None:
+            wait = DEFAULT_RETRY_AFTER
+        self.logger.warning(
+            f"Zoom rate limit reached for {headers.get(RATE_LIMIT_CATEGORY_HEADER) or category} APIs "
+            f"({headers.get(RATE_LIMIT_TYPE_HEADER) or PER_SECOND_LIMIT_TYPE}). Pausing these calls for {wait} seconds."
+        )
+        self.buckets[category].pause(wait)
+        return wait
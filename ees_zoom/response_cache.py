@@ -0,0 +1,176 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""response_cache module persists the responses of the slow-changing Zoom endpoints in a SQLite
+database, so back-to-back commands reuse them instead of downloading identical data again."""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+RESPONSE_CACHE_PATH = os.path.join(os.path.dirname(__file__), "response_cache.db")
+
+# Cacheable endpoints, matched against the endpoint path, and the name of their TTL setting.
+CACHEABLE_ENDPOINTS = [
+    (re.compile(r"^users$"), "users"),
+    (re.compile(r"^roles$"), "roles"),
+    (re.compile(r"^roles/[^/]+$"), "role_privileges"),
+    (re.compile(r"^roles/[^/]+/members$"), "role_members"),
+    (re.compile(r"^groups$"), "groups"),
+]
+
+# Seconds a cached response is served without contacting Zoom.
+DEFAULT_TTLS = {
+    "users": 900,
+    "roles": 3600,
+    "role_privileges": 3600,
+    "role_members": 900,
+    "groups": 3600,
+}
+
+
+class ResponseCache:
+    """This class stores the pages of Zoom responses in a SQLite database with a TTL per endpoint,
+    the validators (ETag, Last-Modified) returned by Zoom for conditional revalidation and
+    a least recently used eviction once the database grows above the configured size."""
+
+    def __init__(self, config, logger):
+        self.logger = logger
+        self.path = config.get_value("zoom_response_cache_path") or RESPONSE_CACHE_PATH
+        self.max_size = config.get_value("zoom_response_cache_max_size_mb") * 1024 * 1024
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(config.get_value("zoom_response_cache_ttl") or {})
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (cache_key TEXT PRIMARY KEY, pages TEXT NOT NULL, "
+            "etag TEXT, last_modified TEXT, stored_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+            "size INTEGER NOT NULL)"
+        )
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def get_ttl(self, end_point):
+        """Returns the time to live of the responses of the endpoint.
+        :param end_point: endpoint url relative to the Zoom API base url, with or without query parameters.
+        :returns: seconds a response is kept fresh, 0 if the endpoint is not cached.
+        """
+        path = end_point.split("?", 1)[0]
+        for pattern, ttl_name in CACHEABLE_ENDPOINTS:
+            if pattern.search(path):
+                return self.ttls.get(ttl_name) or 0
+        return 0
+
+    def get(self, cache_key):
+        """Returns the cached entry of the key and marks it as recently used.
+        :param cache_key: key of the cached response.
+        :returns: dictionary with the pages, validators and stored_at time, None if not cached.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT pages, etag, last_modified, stored_at FROM responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE cache_key = ?",
+                (time.time(), cache_key),
+            )
+        return {
+            "pages": json.loads(row[0]),
+            "etag": row[1],
+            "last_modified": row[2],
+            "stored_at": row[3],
+        }
+
+    def is_fresh(self, entry, end_point):
+        """Checks if the cached entry can be served without contacting Zoom.
+        :param entry: cached entry returned by get.
+        :param end_point: endpoint url relative to the Zoom API base url.
+        :returns: boolean whether the entry is younger than the TTL of the endpoint.
+        """
+        return time.time() - entry["stored_at"] < self.get_ttl(end_point)
+
+    def put(self, cache_key, pages, etag=None, last_modified=None):
+        """Stores the pages of a response and evicts the least recently used entries above the size limit.
+        :param cache_key: key of the cached response.
+        :param pages: list of the json responses of every page.
+        :param etag: ETag header of the response.
+        :param last_modified: Last-Modified header of the response.
+        """
+        serialized_pages = json.dumps(pages, separators=(",", ":"))
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    serialized_pages,
+                    etag,
+                    last_modified,
+                    now,
+                    now,
+                    len(serialized_pages),
+                ),
+            )
+            self.evict()
+
+    def touch(self, cache_key):
+        """Restarts the TTL of an entry after Zoom confirmed it is still valid.
+        :param cache_key: key of the cached response.
+        """
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE cache_key = ?",
+                (now, now, cache_key),
+            )
+
+    def evict(self):
+        """Deletes the least recently used entries until the cache fits in its size limit.
+        Must be called with the lock held."""
+        total_size = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total_size <= self.max_size:
+            return
+        evicted_count = 0
+        for cache_key, size in self.connection.execute(
+            "SELECT cache_key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if total_size <= self.max_size:
+                break
+            self.connection.execute(
+                "DELETE FROM responses WHERE cache_key = ?", (cache_key,)
+            )
+            total_size -= size
+            evicted_count += 1
+        self.logger.debug(f"Evicted {evicted_count} response(s) from the Zoom response cache.")
+
+    def record(self, is_hit, is_revalidated=False):
+        """Updates the hit and miss counters.
+        :param is_hit: boolean whether the response was served from the cache.
+        :param is_revalidated: boolean whether Zoom confirmed the cached response with status 304.
+        """
+        with self.lock:
+            if is_hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if is_revalidated:
+                self.revalidations += 1
+
+    def log_statistics(self):
+        """Logs the hit and miss counters of the cache."""
+        self.logger.info(
+            f"Zoom response cache: {self.hits} hit(s) including {self.revalidations} revalidated, "
+            f"{self.misses} miss(es)."
+        )
@@ -222,12 +222,130 @@ schema = {
         "default": 5,
         "min": 1,
     },
+    "zoom_prefetch_depth": {
+        "required": False,
+        "type": "integer",
+        "default": 0,
+        "min": 0,
+    },
+    "zoom_response_cache_enabled": {
+        "required": False,
+        "type": "boolean",
+        "default": False,
+    },
+    "zoom_response_cache_path": {
+        "required": False,
+        "type": "string",
+        "nullable": True,
+    },
+    "zoom_response_cache_max_size_mb": {
+        "required": False,
+        "type": "integer",
+        "default": 100,
+        "min": 1,
+    },
+    "zoom_response_cache_ttl": {
+        "required": False,
+        "type": "dict",
+        "nullable": True,
+        "keysrules": {
+            "type": "string",
+            "allowed": ["users", "roles", "role_privileges", "role_members", "groups"],
+        },
+        "valuesrules": {"type": "integer", "min": 0},
+    },
+    "zoom_rate_limits": {
+        "required": False,
+        "type": "dict",
+        "nullable": True,
+        "keysrules": {
+            "type": "string",
+            "allowed": ["light", "medium", "heavy", "resource_intensive"],
+        },
+        "valuesrules": {"type": "integer", "min": 1},
+    },
+    "zoom_past_meetings_concurrency": {
+        "required": False,
+        "type": "integer",
+        "nullable": True,
+        "min": 1,
+    },
+    "zoom_dedup_bloom_filter_capacity": {
+        "required": False,
+        "type": "integer",
+        "default": 0,
+        "min": 0,
+    },
+    "zoom_dedup_bloom_filter_error_rate": {
+        "required": False,
+        "type": "float",
+        "default": 0.001,
+        "min": 0.000001,
+        "max": 0.5,
+    },
+    "zoom_sync_mode": {
+        "required": False,
+        "type": "string",
+        "default": "threaded",
+        "allowed": ["threaded", "async"],
+    },
+    "zoom_async_concurrency": {
+        "required": False,
+        "type": "integer",
+        "default": 100,
+        "min": 1,
+    },
+    "document_builder_process_count": {
+        "required": False,
+        "type": "integer",
+        "default": 0,
+        "min": 0,
+    },
     "enterprise_search_sync_thread_count": {
         "required": False,
         "type": "integer",
         "default": 5,
         "min": 1,
     },
+    "enterprise_search_max_in_flight_requests": {
+        "required": False,
+        "type": "integer",
+        "default": 1,
+        "min": 1,
+    },
+    "enable_adaptive_batch_size": {
+        "required": False,
+        "type": "boolean",
+        "default": False,
+    },
+    "enterprise_search_target_latency": {
+        "required": False,
+        "type": "float",
+        "default": 10.0,
+        "min": 0.1,
+    },
+    "skip_unchanged_documents": {
+        "required": False,
+        "type": "boolean",
+        "default": False,
+    },
+    "enable_pipelined_sync": {
+        "required": False,
+        "type": "boolean",
+        "default": False,
+    },
+    "connector_queue_max_documents": {
+        "required": False,
+        "type": "integer",
+        "default": 10000,
+        "min": 0,
+    },
+    "connector_queue_max_size_mb": {
+        "required": False,
+        "type": "integer",
+        "default": 0,
+        "min": 0,
+    },
     "zoom.user_mapping": {
         "required": False,
         "type": "string",
@@ -6,20 +6,47 @@
 
 import json
 import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Advisory file locks are not available on Windows, the syncs are then only coordinated in process.
+    fcntl = None
 
 SECRETS_JSON_PATH = os.path.join(os.path.dirname(__file__), "secrets.json")
+SECRETS_LOCK_PATH = f"{SECRETS_JSON_PATH}.lock"
 REFRESH_TOKEN_FIELD = "zoom.refresh_token"
 ACCESS_TOKEN_FIELD = "zoom.access_token"
 EXPIRATION_TIME_FIELD = "zoom.access_token_expiry_time"
 
 
 class SecretsStorage:
-    """This Class handles the fetching and storing of refresh token to and from the secrets storage."""
+    """This Class handles the fetching and storing of refresh token to and from the secrets storage.
+    The connector commands run as separate processes sharing the same refresh token, so the token is
+    rotated while holding an advisory lock on SECRETS_LOCK_PATH and the secrets file is replaced
+    atomically, readers never see a partially written file."""
 
     def __init__(self, config, logger) -> None:
         self.config = config
         self.logger = logger
 
+    @contextmanager
+    def lock(self):
+        """Holds the exclusive advisory lock shared by all the processes using the secrets storage.
+        The lock is not reentrant, it must be taken once around reading, rotating and storing the token.
+        """
+        if fcntl is None:
+            yield
+            return
+        with open(SECRETS_LOCK_PATH, "a", encoding="UTF-8") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
     def get_secrets(self):
         """The module returns a dictionary containing refresh token, access token,and expiration time
         of access token(UTC format) from the secrets storage.
@@ -38,15 +65,24 @@ class SecretsStorage:
 
     def set_secrets(self, secrets):
         """The module stores a dictionary containing refresh token, access token and expiration time
-        of access token(UTC format) in to local secrets storage.
+        of access token(UTC format) in to local secrets storage. The secrets are written to a temporary
+        file which then replaces the secrets storage.
         :param secrets: a dictionary containing refresh token, access token and expiration time
         of access token(UTC format) to store in secrets storage.
         """
-        with open(SECRETS_JSON_PATH, "w", encoding="UTF-8") as secrets_store:
-            try:
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(SECRETS_JSON_PATH), prefix=".secrets-", suffix=".json"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="UTF-8") as secrets_store:
                 json.dump(secrets, secrets_store, indent=4)
-                self.logger.info("Successfully saved the Refresh token in secrets")
-            except Exception as exception:
-                self.logger.exception(
-                    f"Error while updating the secrets storage.\nError: {exception}"
-                )
+                secrets_store.flush()
+                os.fsync(secrets_store.fileno())
+            os.replace(temporary_path, SECRETS_JSON_PATH)
+            self.logger.info("Successfully saved the Refresh token in secrets")
+        except Exception as exception:
+            self.logger.exception(
+                f"Error while updating the secrets storage.\nError: {exception}"
+            )
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
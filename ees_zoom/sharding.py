@@ -0,0 +1,81 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""sharding module splits the sync of a Zoom account between several connector instances.
+
+    Every instance is started with --shard i/N and syncs the users whose id hashes to its shard, along
+    with their meetings, past-meetings, recordings, channels, chats and files. The account wide objects,
+    roles and groups, are synced by the shard 0. Each shard keeps its own checkpoint and doc_id files.
+"""
+import argparse
+import hashlib
+import os
+
+
+class Shard:
+    """This class represents the part of the Zoom account synced by a connector instance."""
+
+    def __init__(self, index=0, count=1):
+        """
+        :param index: index of the shard, from 0 to count - 1.
+        :param count: number of shards the account is split into.
+        """
+        self.index = index
+        self.count = count
+
+    def __str__(self):
+        return f"{self.index}/{self.count}"
+
+    @property
+    def is_account_shard(self):
+        """Checks if the shard syncs the account wide objects, roles and groups."""
+        return self.index == 0
+
+    def owns_user(self, user_id):
+        """Checks if the objects of a user are synced by the shard. The partition is stable across
+        processes and hosts, as it only depends on the user id and the number of shards.
+        :param user_id: String of Zoom user id.
+        :returns: boolean whether the user belongs to the shard.
+        """
+        if self.count == 1:
+            return True
+        digest = hashlib.md5(str(user_id).encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % self.count == self.index
+
+    def filter_users(self, users):
+        """Returns the users synced by the shard.
+        :param users: list of dictionaries where each dictionary contains details fetched for a user from Zoom.
+        :returns: list of the users belonging to the shard.
+        """
+        return [user for user in users if self.owns_user(user["id"])]
+
+    def get_storage_path(self, path):
+        """Returns the path of a storage file of the shard, the path itself when the account is not sharded.
+        :param path: path of the storage file, e.g. checkpoint.json.
+        :returns: path of the storage file of the shard, e.g. checkpoint.shard-0-of-4.json.
+        """
+        if self.count == 1:
+            return path
+        root, extension = os.path.splitext(path)
+        return f"{root}.shard-{self.index}-of-{self.count}{extension}"
+
+
+def parse_shard(value):
+    """Parses the value of the --shard argument.
+    :param value: string formatted as index/count, e.g. 0/4.
+    :returns: Shard object.
+
+    Raises:
+        argparse.ArgumentTypeError: when the value is not a valid shard.
+    """
+    try:
+        index, count = [int(part) for part in value.split("/")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard: {value}. Expected format: index/count, e.g. 0/4.")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(
+            f"Invalid shard: {value}. The index must be between 0 and {max(count, 1) - 1}."
+        )
+    return Shard(index, count)
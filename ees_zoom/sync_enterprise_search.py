@@ -7,21 +7,143 @@
     It's possible to run full syncs and incremental syncs with this module.
 """
 import threading
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from iteration_utilities import unique_everseen
-
-
+from .batch_size_controller import BatchSizeController
 from .constant import BATCH_SIZE
-from .utils import (split_by_max_cumulative_length,
-                    split_documents_into_equal_chunks)
+from .fingerprint_storage import get_document_fingerprint
+from .utils import encode_document, encode_documents
 
 CONNECTION_TIMEOUT = 60
+# Size in bytes of the brackets of the JSON array and of the comma separating two documents.
+ARRAY_OVERHEAD = 2
+SEPARATOR_OVERHEAD = 1
+
+
+class DocumentBatcher:
+    """This class collects the documents pulled from the queue into batches to be indexed. Every document
+    is measured once, by the size of its JSON encoding, and a running total closes the batch when it reaches
+    the documents count or the size limit. A document found twice in a batch is only indexed once.
+    The body of the indexing request of a batch is assembled from the encoded documents, so the documents
+    are not encoded again by the Enterprise Search client, nor when the request is retried."""
+
+    def __init__(self, max_documents, max_bytes):
+        """
+        :param max_documents: maximum number of documents in a batch.
+        :param max_bytes: maximum size in bytes of the JSON encoded batch.
+        """
+        self.max_documents = max_documents
+        self.max_bytes = max_bytes
+        self.documents = []
+        self.encoded_documents = []
+        self.unique_documents = set()
+        self.size = ARRAY_OVERHEAD
+
+    def add(self, document, encoded_document=None):
+        """Adds a document to the batch. The batch is closed before the document when the document does not fit
+        in it, and after the document when it reaches the documents count. The body of a document larger than
+        the size limit is dropped, as it could never be indexed.
+        :param document: dictionary of the document.
+        :param encoded_document: bytes of the JSON encoded document, when it was already encoded.
+        :returns: list of the closed batches, each batch being a tuple of the list of documents
+            and the body of their indexing request.
+        """
+        if encoded_document is None:
+            encoded_document = encode_document(document)
+        if encoded_document in self.unique_documents:
+            return []
+        document_size = len(encoded_document) + SEPARATOR_OVERHEAD
+        if ARRAY_OVERHEAD + document_size > self.max_bytes:
+            document = dict(document, body=None)
+            encoded_document = encode_document(document)
+            document_size = len(encoded_document) + SEPARATOR_OVERHEAD
+        batches = []
+        if self.documents and self.size + document_size > self.max_bytes:
+            batches.append(self.flush())
+        self.documents.append(document)
+        self.encoded_documents.append(encoded_document)
+        self.unique_documents.add(encoded_document)
+        self.size += document_size
+        if len(self.documents) >= self.max_documents:
+            batches.append(self.flush())
+        return batches
+
+    def flush(self):
+        """Closes the batch.
+        :returns: tuple of the list of the documents of the batch, empty when no document was added since
+            the last batch, and the body of their indexing request.
+        """
+        batch = self.documents, encode_documents(self.encoded_documents)
+        self.documents = []
+        self.encoded_documents = []
+        self.unique_documents = set()
+        self.size = ARRAY_OVERHEAD
+        return batch
+
+
+class InFlightRequests:
+    """This class keeps the indexing requests of an indexing thread in flight, up to a maximum number of
+    requests. The indexing threads share the SyncEnterpriseSearch instance, so every thread has its own."""
+
+    def __init__(self, max_requests):
+        """
+        :param max_requests: maximum number of requests in flight.
+        """
+        self.max_requests = max_requests
+        self.executor = ThreadPoolExecutor(max_workers=max_requests)
+        # The structure of the pending requests is {future: number of documents sent by the request}
+        self.pending_requests = {}
+
+    def submit(self, function, documents, *args):
+        """Sends a request, waiting for a request to complete when the maximum number of requests is in flight.
+        :param function: function sending the request.
+        :param documents: list of the documents sent by the request, the first argument of the function.
+        :param args: other arguments of the function.
+        :returns: list of the responses of the completed requests.
+        """
+        self.pending_requests[self.executor.submit(function, documents, *args)] = len(documents)
+        if len(self.pending_requests) < self.max_requests:
+            return []
+        return self.get_completed_responses(FIRST_COMPLETED)
+
+    def get_completed_responses(self, return_when):
+        """Waits for the requests in flight.
+        :param return_when: FIRST_COMPLETED to wait for a request, ALL_COMPLETED to wait for all of them.
+        :returns: list of the responses of the completed requests, in the order they completed.
+        """
+        if not self.pending_requests:
+            return []
+        completed_requests, _ = wait(self.pending_requests, return_when=return_when)
+        for future in completed_requests:
+            del self.pending_requests[future]
+        return [future.result() for future in completed_requests]
+
+    def get_pending_documents_count(self):
+        """Returns the number of documents sent by the requests in flight.
+        :returns: number of documents.
+        """
+        return sum(self.pending_requests.values())
+
+    def close(self):
+        """Cancels the requests not sent yet and stops the executor."""
+        for future in self.pending_requests:
+            future.cancel()
+        self.executor.shutdown()
 
 
 class SyncEnterpriseSearch:
     """This class contains common logic for indexing to workplace search"""
 
-    def __init__(self, config, logger, workplace_search_client, queue):
+    def __init__(self, config, logger, workplace_search_client, queue, fingerprint_storage=None):
+        """
+        :param config: Configuration object.
+        :param logger: logger instance.
+        :param workplace_search_client: EnterpriseSearchWrapper instance.
+        :param queue: Shared queue to fetch the stored documents.
+        :param fingerprint_storage: FingerprintStorage of the documents indexed by the previous syncs,
+            None to index all the documents.
+        """
         self.config = config
         self.logger = logger
         self.workplace_search_client = workplace_search_client
@@ -37,73 +159,177 @@ class SyncEnterpriseSearch:
         self.checkpoints = []
         self.error_count = 0
         self.max_allowed_bytes = 10000000
+        self.max_in_flight_requests = config.get_value("enterprise_search_max_in_flight_requests")
+        self.batch_size_controller = (
+            BatchSizeController(logger, config.get_value("enterprise_search_target_latency"))
+            if config.get_value("enable_adaptive_batch_size")
+            else None
+        )
+        self.fingerprint_storage = fingerprint_storage
+        # Fingerprints of the documents sent to Enterprise Search, recorded once they are indexed.
+        self.sent_fingerprints = {}
+        self.skipped_documents_count = 0
+
+    def process_responses(self, responses):
+        """Records the documents indexed and the documents rejected by an indexing request.
+        :param responses: dictionary of the results of the indexing request
+        """
+        documents_indexed = 0
+        for document in responses["results"]:
+            if not document["errors"]:
+                documents_indexed += 1
+                self.indexed_documents_ids.add(document["id"])
+                fingerprint = self.sent_fingerprints.pop(str(document["id"]), None)
+                if fingerprint:
+                    self.fingerprint_storage.record(document["id"], fingerprint)
+            else:
+                # The fingerprint of a rejected document is not recorded, the next sync sends it again.
+                self.sent_fingerprints.pop(str(document["id"]), None)
+                self.error_count += 1
+                self.logger.error(
+                    f"Unable to index the document with id: {document['id']} Error {document['errors']}"
+                )
+        self.total_document_indexed += documents_indexed
 
-    def index_documents(self, documents):
+    def index_documents(self, documents, body=None):
         """This method indexes the documents to the Enterprise Search.
         :param documents: list of documents to be indexed
+        :param body: bytes of the JSON encoded documents sent as the body of the request, when already encoded
         """
         self.total_documents_found += len(documents)
         if documents:
-            documents_indexed = 0
-            responses = self.workplace_search_client.index_documents(
-                documents,
-                CONNECTION_TIMEOUT,
-            )
-            for document in responses["results"]:
-                if not document["errors"]:
-                    documents_indexed += 1
-                    self.indexed_documents_ids.add(document["id"])
-                else:
-                    self.error_count += 1
-                    self.logger.error(
-                        f"Unable to index the document with id: {document['id']} Error {document['errors']}"
-                    )
-            self.total_document_indexed += documents_indexed
+            responses = self.send_request(documents, documents if body is None else body)
+            self.process_responses(responses)
+
+    def send_request(self, documents, body):
+        """Sends an indexing request and records its latency and its server errors in the batch size controller.
+        :param documents: list of documents to be indexed
+        :param body: bytes of the JSON encoded documents sent as the body of the request
+        :returns: dictionary of the results of the indexing request
+        """
+        if not self.batch_size_controller:
+            return self.workplace_search_client.index_documents(body, CONNECTION_TIMEOUT)
+        errors = []
+        start_time = time.monotonic()
+        responses = self.workplace_search_client.index_documents(
+            body, CONNECTION_TIMEOUT, on_error=errors.append
+        )
+        self.batch_size_controller.record(
+            documents[0].get("type"), len(documents), time.monotonic() - start_time, len(errors)
+        )
+        return responses
+
+    def index_batch(self, documents, body, in_flight_requests=None):
+        """Indexes a batch of documents closed by the batcher. With several requests in flight, the responses
+        of the requests completed meanwhile are processed.
+        :param documents: list of documents to be indexed
+        :param body: bytes of the JSON encoded documents sent as the body of the request
+        :param in_flight_requests: InFlightRequests of the indexing thread, None to wait for the response
+        """
+        if not documents:
+            return
+        for document in documents:
+            self.generated_documents_ids.add(document["id"])
+        if not in_flight_requests:
+            self.index_documents(documents, body)
+            return
+        self.total_documents_found += len(documents)
+        for responses in in_flight_requests.submit(self.send_request, documents, body):
+            self.process_responses(responses)
+
+    def skip_unchanged_document(self, document, encoded_document):
+        """Checks if a document was indexed with the same content by a previous sync. An unchanged document
+        counts as indexed, so it stays in the local storage of the indexed documents.
+        :param document: dictionary of the document.
+        :param encoded_document: bytes of the JSON encoded document.
+        :returns: boolean whether the document is skipped.
+        """
+        fingerprint = get_document_fingerprint(encoded_document)
+        if self.fingerprint_storage.is_unchanged(document["id"], fingerprint):
+            self.generated_documents_ids.add(document["id"])
+            self.indexed_documents_ids.add(document["id"])
+            self.skipped_documents_count += 1
+            return True
+        self.sent_fingerprints[str(document["id"])] = fingerprint
+        return False
+
+    def get_batcher(self, batchers, document_type):
+        """Returns the batcher of a document type, sized by the batch size controller.
+        :param batchers: dictionary of the batchers of the indexing thread by document type
+        :param document_type: type of the documents, e.g. meetings
+        :returns: DocumentBatcher instance
+        """
+        batcher = batchers.get(document_type)
+        if not batcher:
+            batcher = batchers[document_type] = DocumentBatcher(BATCH_SIZE, self.max_allowed_bytes)
+        if self.batch_size_controller:
+            batcher.max_documents = self.batch_size_controller.get_batch_size(document_type)
+        return batcher
+
+    def flush_batchers(self, batchers, in_flight_requests):
+        """Indexes the documents of all the batchers of the indexing thread.
+        :param batchers: dictionary of the batchers of the indexing thread by document type
+        :param in_flight_requests: InFlightRequests of the indexing thread, None to wait for the responses
+        """
+        for batcher in batchers.values():
+            documents, body = batcher.flush()
+            self.index_batch(documents, body, in_flight_requests)
 
     def perform_sync(self):
         """Pull documents from the queue and synchronize it to the Enterprise Search."""
+        # Every document type is batched separately, as their batch sizes are adapted separately.
+        batchers = {}
+        in_flight_requests = (
+            InFlightRequests(self.max_in_flight_requests) if self.max_in_flight_requests > 1 else None
+        )
         try:
             signal_open = True
             while signal_open:
-                documents_to_index = []
-                while len(documents_to_index) < BATCH_SIZE and len(str(documents_to_index)) < self.max_allowed_bytes:
-                    documents = self.queue.get()
-                    if documents.get("type") == "signal_close":
-                        self.logger.info(
-                            f"Found an end signal in the queue. Closing Thread ID {threading.get_ident()}"
-                        )
-                        signal_open = False
-                        break
-                    elif documents.get("type") == "checkpoint":
-                        self.checkpoints.append(
-                            [
-                                documents.get("data")[0],
-                                documents.get("data")[1],
-                                documents.get("data")[2],
-                            ]
-                        )
-                        break
-                    else:
-                        documents_to_index.extend(documents.get("data"))
-                # This loop is to ensure if the last document fetched from the queue exceeds the size of
-                # documents_to_index to more than the permitted chunk size, then we split the documents as per the limit
-                documents_to_index = list(unique_everseen(documents_to_index))
-                for document_list in split_documents_into_equal_chunks(
-                    documents_to_index, BATCH_SIZE
-                ):
-                    for document in document_list:
-                        self.generated_documents_ids.add(document["id"])
-                    for documents in split_by_max_cumulative_length(
-                        document_list, self.max_allowed_bytes
-                    ):
-                        self.index_documents(documents)
+                message = self.queue.get()
+                if message.get("type") == "signal_close":
+                    self.logger.info(
+                        f"Found an end signal in the queue. Closing Thread ID {threading.get_ident()}"
+                    )
+                    signal_open = False
+                    self.flush_batchers(batchers, in_flight_requests)
+                elif message.get("type") == "checkpoint":
+                    self.checkpoints.append(
+                        [
+                            message.get("data")[0],
+                            message.get("data")[1],
+                            message.get("data")[2],
+                        ]
+                    )
+                    self.flush_batchers(batchers, in_flight_requests)
+                else:
+                    # The documents are already encoded when the queue measured them.
+                    encoded_documents = message.get("encoded_data") or [None] * len(message.get("data"))
+                    for document, encoded_document in zip(message.get("data"), encoded_documents):
+                        if self.fingerprint_storage:
+                            encoded_document = encoded_document or encode_document(document)
+                            if self.skip_unchanged_document(document, encoded_document):
+                                continue
+                        batcher = self.get_batcher(batchers, document.get("type"))
+                        for batch_documents, body in batcher.add(document, encoded_document):
+                            self.index_batch(batch_documents, body, in_flight_requests)
+            if in_flight_requests:
+                for responses in in_flight_requests.get_completed_responses(ALL_COMPLETED):
+                    self.process_responses(responses)
         except Exception as exception:
+            pending_documents_count = sum(len(batcher.documents) for batcher in batchers.values())
+            if in_flight_requests:
+                pending_documents_count += in_flight_requests.get_pending_documents_count()
             self.logger.error(
-                f"Error while indexing {len(documents)} documents into Workplace Search. Error: {exception}"
+                f"Error while indexing into Workplace Search, {pending_documents_count} documents pending in the "
+                f"batches and in flight. Error: {exception}"
             )
             raise exception
+        finally:
+            if in_flight_requests:
+                in_flight_requests.close()
         self.logger.info(
             f"Thread: [{threading.get_ident()}] Total {self.total_document_indexed} documents "
-            f"indexed out of: {self.total_documents_found} till now.."
+            f"indexed out of: {self.total_documents_found} till now, {self.skipped_documents_count} unchanged "
+            "documents skipped.."
         )
         return self.generated_documents_ids, self.indexed_documents_ids
@@ -6,24 +6,45 @@
 """sync_zoom module allows to sync data to Elastic Enterprise Search.
 It's possible to run full syncs and incremental syncs with this module."""
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 
 from .adapter import DEFAULT_SCHEMA
-from .constant import (CHANNELS, CHATS, FILES, GROUPS, MEETINGS, PAST_MEETINGS,
-                       RECORDINGS, ROLES, USERS)
-from .utils import split_list_into_buckets
+from .constant import (BATCH_SIZE, CHANNELS, CHATS, FILES, GROUPS, MEETINGS,
+                       PAST_MEETINGS, RECORDINGS, ROLES, USERS)
+from .document_builder import DocumentBuilder
+from .rate_limiter import HEAVY, get_configured_rate_limit
+from .sharding import Shard
+from .user_statistics import UserStatistics
+from .utils import (SharedIdSet, split_documents_into_equal_chunks,
+                    split_list_into_buckets)
 from .zoom_channels import ZoomChannels
 from .zoom_groups import ZoomGroups
 from .zoom_chat_messages import ZoomChatMessages
 from .zoom_meetings import ZoomMeetings
 from .zoom_past_meetings import ZoomPastMeetings
 from .zoom_recordings import ZoomRecordings
-from .zoom_roles import ZoomRoles
+from .zoom_roles import CHAT_MESSAGE_READ_PERMISSION, RoleIndex, ZoomRoles
 from .zoom_users import ZoomUsers
 
 MULTITHREADED_OBJECTS_FOR_DELETION = "multithreaded_objects_for_deletion"
+# Objects fetched by the follow-up tasks of a task, the past-meetings are fetched from the meetings.
+DEPENDENT_OBJECTS = {MEETINGS: [PAST_MEETINGS]}
+# Number of meetings of which the past-meetings are fetched by a single task.
+PAST_MEETINGS_TASK_SIZE = 20
 ROLES_FOR_DELETION = "roles_for_deletion"
 
 
+def get_chat_access_enabled_users(users, chat_access_user_ids):
+    """Returns the ids of the users having read access to chat messages.
+    :param users: list of dictionaries where each dictionary contains details fetched for a user from Zoom.
+    :param chat_access_user_ids: set of the userIDs having read access to chat messages.
+    :returns: list of userIDs in the order of the users.
+    """
+    return [user["id"] for user in users if user["id"] in chat_access_user_ids]
+
+
 class SyncZoom:
     """This class allows ingesting data from Zoom to Elastic Enterprise Search."""
 
@@ -36,6 +57,8 @@ class SyncZoom:
         objects_time_range,
         queue,
         zoom_enterprise_search_mappings,
+        role_index=None,
+        shard=None,
     ):
         self.config = config
         self.logger = logger
@@ -47,6 +70,45 @@ class SyncZoom:
         self.configuration_objects = config.get_value("objects")
         self.enable_permission = config.get_value("enable_document_permission")
         self.zoom_sync_thread_count = config.get_value("zoom_sync_thread_count")
+        # Chats and files are shared between users, the tasks of all the users skip the ones already fetched.
+        bloom_filter_capacity = config.get_value("zoom_dedup_bloom_filter_capacity")
+        bloom_filter_error_rate = config.get_value("zoom_dedup_bloom_filter_error_rate")
+        self.fetched_chats_ids = SharedIdSet(bloom_filter_capacity, bloom_filter_error_rate)
+        self.fetched_files_ids = SharedIdSet(bloom_filter_capacity, bloom_filter_error_rate)
+        # The deletion sync deletes the documents of the chats and files it did not fetch, so it keeps the exact
+        # ids: skipping a chat or a file which was never fetched would delete a document still existing in Zoom.
+        self.existing_chats_ids = SharedIdSet(is_exact=True)
+        self.existing_files_ids = SharedIdSet(is_exact=True)
+        self.shard = shard or Shard()
+        self.user_statistics = UserStatistics(logger, self.shard)
+        # Set of the users having read access to chat messages, resolved with the roles.
+        self.all_chat_access = set()
+        document_builder_process_count = config.get_value("document_builder_process_count")
+        self.document_builder = (
+            DocumentBuilder(config, logger, zoom_enterprise_search_mappings, document_builder_process_count)
+            if document_builder_process_count
+            else None
+        )
+        # The roles are resolved once for the chat access and the roles documents.
+        self.role_index = role_index or RoleIndex(
+            ZoomRoles(config, logger, zoom_client, zoom_enterprise_search_mappings),
+            logger,
+            self.zoom_sync_thread_count,
+        )
+        # Tasks which can only start once another task completed, such as the past-meetings of fetched meetings.
+        self.follow_up_tasks = Queue()
+        # The past-meetings calls of all the tasks share these threads, the participants are fetched from the
+        # report APIs which are in the heavy rate limit category.
+        past_meetings_concurrency = config.get_value("zoom_past_meetings_concurrency")
+        self.past_meetings_executor = ThreadPoolExecutor(
+            max_workers=past_meetings_concurrency or get_configured_rate_limit(config, HEAVY)
+        )
+
+    def close(self):
+        """Stops the threads fetching the past-meetings and the processes building the documents."""
+        self.past_meetings_executor.shutdown()
+        if self.document_builder is not None:
+            self.document_builder.close()
 
     def get_schema_fields(self, document_name):
         """Returns the schema of all the include fields or exclude fields specified in the configuration file.
@@ -76,19 +138,70 @@ class SyncZoom:
         return adapter_schema
 
     def get_all_users_from_zoom(self):
-        """Connects to the Zoom and returns the list of all the users from Zoom after
-        partitioning them into equal buckets."""
+        """Connects to the Zoom and returns the list of all the users from Zoom synced by the shard."""
         users_object = ZoomUsers(
             self.config,
             self.logger,
             self.zoom_client,
             self.zoom_enterprise_search_mappings,
         )
-        partitioned_users_lists = split_list_into_buckets(
-            documents=users_object.get_users_list(),
-            total_buckets=self.zoom_sync_thread_count,
-        )
-        return partitioned_users_lists
+        users = users_object.get_users_list()
+        if self.shard.count == 1:
+            return users
+        shard_users = self.shard.filter_users(users)
+        self.logger.info(f"Shard {self.shard} syncs {len(shard_users)} users out of {len(users)}.")
+        return shard_users
+
+    def get_users_object_types(self, parent_object):
+        """Returns the user dependent objects to fetch, meetings standing for both meetings and past-meetings
+        as the past-meetings are fetched from the meetings of the user.
+        :param parent_object: USERS for indexing or MULTITHREADED_OBJECTS_FOR_DELETION for deletion.
+        :returns: list of object types.
+        """
+        object_types = []
+        if parent_object == USERS:
+            if USERS in self.configuration_objects:
+                object_types.append(USERS)
+            if MEETINGS in self.configuration_objects or PAST_MEETINGS in self.configuration_objects:
+                object_types.append(MEETINGS)
+        for object_type in [RECORDINGS, CHANNELS, CHATS, FILES]:
+            if object_type in self.configuration_objects:
+                object_types.append(object_type)
+        return object_types
+
+    def iter_sync_tasks(self, parent_object, users):
+        """Yields one task per user and object type, so the threads picking the tasks from the shared
+        executor queue stay busy until the last task regardless of how the work is spread between users.
+        The tasks are ordered from the most expensive to the cheapest according to the user statistics of
+        the previous syncs, the tasks of the users never synced keep their order after them.
+        The users documents are built from the already fetched users, so they form a single first task.
+        :param parent_object: USERS for indexing or MULTITHREADED_OBJECTS_FOR_DELETION for deletion.
+        :param users: list of dictionaries where each dictionary contains details fetched for a user from Zoom
+        :yields: tuple of object type and list of users.
+        """
+        if not users or self.configuration_objects is None:
+            return
+        sync_tasks = []
+        for object_type in self.get_users_object_types(parent_object):
+            if object_type == USERS:
+                yield (USERS, users)
+                continue
+            for user in users:
+                sync_tasks.append((object_type, [user]))
+        # sort is stable, the tasks without statistics keep their order.
+        sync_tasks.sort(key=self.get_sync_task_cost, reverse=True)
+        yield from sync_tasks
+
+    def get_sync_task_cost(self, sync_task):
+        """Returns the seconds spent by the previous sync on a task and on the tasks depending on it.
+        :param sync_task: tuple of object type and list of users.
+        :returns: seconds spent, 0 if the user was never synced.
+        """
+        object_type, users = sync_task[:2]
+        cost = 0
+        for object_type in [object_type] + DEPENDENT_OBJECTS.get(object_type, []):
+            cost += self.user_statistics.get_cost(users[0]["id"], object_type) or 0
+        return cost
 
     def fetch_users_and_append_to_queue(self, partitioned_users_list):
         """This method fetches the users from Zoom server and
@@ -115,15 +228,15 @@ class SyncZoom:
         self.queue.append_to_queue(users_data)
         return users_data
 
-    def get_meetings(
+    def iter_meetings(
         self, partitioned_users_list, meetings_object, is_meetings_in_objects
     ):
-        """This method fetches the meetings from Zoom server.
+        """This method fetches the meetings from Zoom server page by page.
         :param partitioned_users_list: list of dictionaries where each dictionary contains details fetched for
         a user from Zoom
         :param meetings_object: ZoomMeetings Object.
         :param is_meetings_in_objects: boolean whether meetings object is in objects list.
-        :returns: list of meetings documents.
+        :yields: list of meetings documents of one page.
         """
         if is_meetings_in_objects:
             checkpoint_object = MEETINGS
@@ -131,39 +244,44 @@ class SyncZoom:
         else:
             checkpoint_object = PAST_MEETINGS
             meetings_schema = {}
-        fetched_documents = meetings_object.get_meetings_details_documents(
+        yield from meetings_object.iter_meetings_details_documents(
             users_data=partitioned_users_list,
             meetings_schema=meetings_schema,
             start_time=self.objects_time_range[checkpoint_object][0],
             end_time=self.objects_time_range[checkpoint_object][1],
             is_meetings_in_objects=is_meetings_in_objects,
             enable_permission=self.enable_permission,
+            document_builder=self.document_builder,
         )
-        meetings_data = fetched_documents["data"]
-        return meetings_data
 
-    def get_past_meetings(self, meetings_object):
-        """This method fetches the past-meetings from Zoom server.
-        :param meetings_object: ZoomMeetings Object.
-        :returns: list of past-meetings documents.
+    def iter_past_meetings(self, meetings_data, past_meetings_object=None):
+        """This method fetches the past-meetings from Zoom server, the meetings being fetched concurrently.
+        :param meetings_data: list of meetings of which the past-meetings are fetched.
+        :param past_meetings_object: ZoomPastMeetings object counting the calls made by the executor threads.
+        :yields: list of past-meetings documents, as their calls complete.
         """
-        past_meetings_object = ZoomPastMeetings(
-            self.config,
-            self.logger,
-            self.zoom_client,
-            self.zoom_enterprise_search_mappings,
-        )
-        past_meetings_schema = self.get_schema_fields(PAST_MEETINGS)
-        fetched_documents = []
-        fetched_documents = past_meetings_object.get_past_meetings_details_documents(
-            meetings_data=meetings_object.meetings_past_meetings_list,
-            past_meetings_schema=past_meetings_schema,
+        if past_meetings_object is None:
+            past_meetings_object = ZoomPastMeetings(
+                self.config,
+                self.logger,
+                self.zoom_client,
+                self.zoom_enterprise_search_mappings,
+            )
+        past_meetings_documents = []
+        for past_meeting_document in past_meetings_object.iter_past_meetings_details_documents(
+            meetings_data=meetings_data,
+            past_meetings_schema=self.get_schema_fields(PAST_MEETINGS),
             start_time=self.objects_time_range[PAST_MEETINGS][0],
             end_time=self.objects_time_range[PAST_MEETINGS][1],
             enable_permission=self.enable_permission,
-        )
-        past_meetings_data = fetched_documents["data"]
-        return past_meetings_data
+            executor=self.past_meetings_executor,
+        ):
+            past_meetings_documents.append(past_meeting_document)
+            if len(past_meetings_documents) == BATCH_SIZE:
+                yield past_meetings_documents
+                past_meetings_documents = []
+        if past_meetings_documents:
+            yield past_meetings_documents
 
     def fetch_roles_and_append_to_queue(self, roles_object):
         """This method fetches the roles from Zoom server and
@@ -173,9 +291,8 @@ class SyncZoom:
         """
         roles_document_list = []
         roles_schema = self.get_schema_fields(ROLES)
-        roles_object.set_list_of_roles_from_zoom()
         roles_list = split_list_into_buckets(
-            roles_object.roles_list, self.zoom_sync_thread_count
+            self.role_index.get_roles(), self.zoom_sync_thread_count
         )
         for roles in roles_list:
             fetched_documents = roles_object.get_roles_details_documents(
@@ -206,12 +323,11 @@ class SyncZoom:
         self.queue.append_to_queue(groups_data)
         return groups_data
 
-    def get_recordings(self, partitioned_users_list):
-        """This method fetches the recordings from Zoom server.
+    def iter_recordings(self, partitioned_users_list):
+        """This method fetches the recordings from Zoom server page by page.
         :param partitioned_users_list: list of users for which recordings will be fetched.
-        :returns: list of recordings documents.
+        :yields: list of recordings documents of one page.
         """
-        fetched_documents = []
         recordings_schema = self.get_schema_fields(RECORDINGS)
         recordings_object = ZoomRecordings(
             self.config,
@@ -219,15 +335,14 @@ class SyncZoom:
             self.zoom_client,
             self.zoom_enterprise_search_mappings,
         )
-        fetched_documents = recordings_object.get_recordings_details_documents(
+        yield from recordings_object.iter_recordings_details_documents(
             users_data=partitioned_users_list,
             recordings_schema=recordings_schema,
             start_time=self.objects_time_range[RECORDINGS][0],
             end_time=self.objects_time_range[RECORDINGS][1],
             enable_permission=self.enable_permission,
+            document_builder=self.document_builder,
         )
-        recording_data = fetched_documents["data"]
-        return recording_data
 
     def get_channels(self, partitioned_users_list):
         """This method fetches the channels from Zoom server.
@@ -265,23 +380,23 @@ class SyncZoom:
             return []
         try:
             documents_to_index = []
-            ids_storage = []
             if parent_object == ROLES or parent_object == ROLES_FOR_DELETION:
-                roles_object = ZoomRoles(
-                    self.config,
-                    self.logger,
-                    self.zoom_client,
-                    self.zoom_enterprise_search_mappings,
+                roles_object = self.role_index.roles_object
+                self.all_chat_access = self.role_index.get_users_with_privilege(
+                    CHAT_MESSAGE_READ_PERMISSION
                 )
-                self.all_chat_access = roles_object.fetch_user_ids_with_chat_access()
-                if ROLES in self.configuration_objects and parent_object != ROLES_FOR_DELETION:
+                # The roles and groups are account wide, they are only synced by the shard 0.
+                is_account_objects_synced = parent_object != ROLES_FOR_DELETION and self.shard.is_account_shard
+                if ROLES in self.configuration_objects and is_account_objects_synced:
                     self.logger.info(
                         f"Thread: [{threading.get_ident()}] fetching {ROLES}."
                     )
                     documents_to_index.extend(
-                        self.fetch_roles_and_append_to_queue(roles_object)
+                        self.get_ids_storage(
+                            self.fetch_roles_and_append_to_queue(roles_object)
+                        )
                     )
-                if GROUPS in self.configuration_objects and parent_object != ROLES_FOR_DELETION:
+                if GROUPS in self.configuration_objects and is_account_objects_synced:
                     self.logger.info(
                         f"Thread: [{threading.get_ident()}] fetching {GROUPS}."
                     )
@@ -291,111 +406,190 @@ class SyncZoom:
                         self.zoom_client,
                     )
                     documents_to_index.extend(
-                        self.fetch_groups_and_append_to_queue(groups_object)
-                    )
-
-            elif parent_object == USERS or parent_object == MULTITHREADED_OBJECTS_FOR_DELETION:
-                if USERS in self.configuration_objects and parent_object != MULTITHREADED_OBJECTS_FOR_DELETION:
-                    self.logger.info(
-                        f"Thread: [{threading.get_ident()}] fetching {USERS}."
-                    )
-                    documents_to_index.extend(
-                        self.fetch_users_and_append_to_queue(partitioned_users_list)
-                    )
-                if (
-                    parent_object != MULTITHREADED_OBJECTS_FOR_DELETION and (
-                        MEETINGS in self.configuration_objects or PAST_MEETINGS in self.configuration_objects
-                    )
-                ):
-                    is_meetings_in_objects = False
-                    if MEETINGS in self.configuration_objects:
-                        is_meetings_in_objects = True
-                        self.logger.info(
-                            f"Thread: [{threading.get_ident()}] fetching {MEETINGS}."
+                        self.get_ids_storage(
+                            self.fetch_groups_and_append_to_queue(groups_object)
                         )
-                    meetings_object = ZoomMeetings(
-                        self.config,
-                        self.logger,
-                        self.zoom_client,
-                        self.zoom_enterprise_search_mappings,
                     )
-                    meetings_documents = self.get_meetings(
-                        partitioned_users_list,
-                        meetings_object,
-                        is_meetings_in_objects,
-                    )
-                    documents_to_index.extend(meetings_documents)
-                    self.queue.append_to_queue(meetings_documents)
-                if PAST_MEETINGS in self.configuration_objects and parent_object != MULTITHREADED_OBJECTS_FOR_DELETION:
-                    self.logger.info(
-                        f"Thread: [{threading.get_ident()}] fetching {PAST_MEETINGS}."
-                    )
-                    past_meetings_documents = self.get_past_meetings(meetings_object)
-                    documents_to_index.extend(past_meetings_documents)
-                    self.queue.append_to_queue(past_meetings_documents)
-                if RECORDINGS in self.configuration_objects:
-                    recordings_documents = self.get_recordings(
-                        partitioned_users_list,
-                    )
-                    documents_to_index.extend(recordings_documents)
-                    if parent_object != MULTITHREADED_OBJECTS_FOR_DELETION:
-                        self.queue.append_to_queue(recordings_documents)
-                if CHANNELS in self.configuration_objects:
-                    channels_documents = self.get_channels(
-                        partitioned_users_list,
-                    )
-                    documents_to_index.extend(channels_documents)
-                    if parent_object != MULTITHREADED_OBJECTS_FOR_DELETION:
-                        self.queue.append_to_queue(channels_documents)
 
-                if CHATS in self.configuration_objects or FILES in self.configuration_objects:
-                    user_ids_list = []
-                    for user in partitioned_users_list:
-                        user_ids_list.append(user["id"])
-                    chat_access_enabled_users = [
-                        user_id
-                        for user_id in self.all_chat_access
-                        if user_id in user_ids_list
-                    ]
-                    chats_files_object = ZoomChatMessages(
-                        self.config,
-                        self.logger,
-                        self.zoom_client,
-                        self.zoom_enterprise_search_mappings,
+            elif parent_object == USERS or parent_object == MULTITHREADED_OBJECTS_FOR_DELETION:
+                for object_type in self.get_users_object_types(parent_object):
+                    self.fetch_users_objects(
+                        parent_object, object_type, partitioned_users_list, documents_to_index
                     )
-                    if CHATS in self.configuration_objects:
-                        fetched_documents = []
-                        chats_schema = self.get_schema_fields(CHATS)
-                        fetched_documents = chats_files_object.get_chat_messages(
-                            users_data=chat_access_enabled_users,
-                            chats_schema=chats_schema,
-                            start_time=self.objects_time_range[CHATS][0],
-                            end_time=self.objects_time_range[CHATS][1],
-                            enable_permission=self.enable_permission,
-                        )
-                        chats_documents = fetched_documents["data"]
-                        documents_to_index.extend(chats_documents)
-                        if parent_object != MULTITHREADED_OBJECTS_FOR_DELETION:
-                            self.queue.append_to_queue(chats_documents)
-                    if FILES in self.configuration_objects:
-                        fetched_documents = []
-                        files_schema = self.get_schema_fields(FILES)
-                        fetched_documents = chats_files_object.get_files_details_documents(
-                            users=chat_access_enabled_users,
-                            files_schema=files_schema,
-                            start_time=self.objects_time_range[FILES][0],
-                            end_time=self.objects_time_range[FILES][1],
-                            enable_permission=self.enable_permission,
-                        )
-                        files_documents = fetched_documents["data"]
-                        documents_to_index.extend(files_documents)
-                        if parent_object != MULTITHREADED_OBJECTS_FOR_DELETION:
-                            self.queue.append_to_queue(files_documents)
         except Exception as exception:
             self.logger.error(
                 f"{[threading.get_ident()]} Error while fetching objects. Error: {exception}"
             )
-        for document in documents_to_index:
+        return documents_to_index
+
+    def perform_sync_task(self, parent_object, sync_task):
+        """This method fetches one object type for the users of a task yielded by iter_sync_tasks, appends
+        the documents to the shared queue and returns list of locally stored details of documents fetched.
+        :param parent_object: USERS for indexing or MULTITHREADED_OBJECTS_FOR_DELETION for deletion.
+        :param sync_task: tuple of object type and list of users, followed by the meetings for the
+            past-meetings tasks.
+        :returns: list of dictionary containing the properties (id, type, parent_id, created_at) of
+            the documents generated for the task.
+        """
+        object_type, users = sync_task[:2]
+        documents_to_index = []
+        start_time = time.time()
+        api_calls_count = self.zoom_client.get_thread_api_calls_count()
+        past_meetings_object = None
+        try:
+            if object_type == PAST_MEETINGS:
+                past_meetings_object = ZoomPastMeetings(
+                    self.config,
+                    self.logger,
+                    self.zoom_client,
+                    self.zoom_enterprise_search_mappings,
+                )
+                for past_meetings_documents in self.iter_past_meetings(sync_task[2], past_meetings_object):
+                    self.append_documents(past_meetings_documents, documents_to_index)
+            else:
+                self.fetch_users_objects(
+                    parent_object, object_type, users, documents_to_index, is_follow_up_deferred=True
+                )
+        except Exception as exception:
+            self.logger.error(
+                f"{[threading.get_ident()]} Error while fetching {object_type}. Error: {exception}"
+            )
+        if object_type != USERS and parent_object == USERS:
+            api_calls_count = self.zoom_client.get_thread_api_calls_count() - api_calls_count
+            if past_meetings_object is not None:
+                # The past-meetings calls are made by the threads of past_meetings_executor.
+                api_calls_count += past_meetings_object.executor_api_calls_count
+            self.user_statistics.record(
+                user_id=users[0]["id"],
+                object_type=object_type,
+                api_calls=api_calls_count,
+                documents=len(documents_to_index),
+                seconds=time.time() - start_time,
+            )
+        return documents_to_index
+
+    def fetch_users_objects(
+        self, parent_object, object_type, users, documents_to_index, is_follow_up_deferred=False
+    ):
+        """This method fetches the documents of one user dependent object type for the users and appends them
+        to the shared queue.
+        :param parent_object: USERS for indexing or MULTITHREADED_OBJECTS_FOR_DELETION for deletion.
+        :param object_type: object type returned by get_users_object_types.
+        :param users: list of dictionaries where each dictionary contains details fetched for a user from Zoom
+        :param documents_to_index: list of dictionary containing the properties of the documents fetched so far.
+        :param is_follow_up_deferred: boolean to put the past-meetings tasks depending on the fetched meetings
+            in follow_up_tasks instead of fetching them right away.
+        """
+        is_append_to_queue = parent_object != MULTITHREADED_OBJECTS_FOR_DELETION
+        if object_type == USERS:
+            self.logger.info(f"Thread: [{threading.get_ident()}] fetching {USERS}.")
+            documents_to_index.extend(
+                self.get_ids_storage(self.fetch_users_and_append_to_queue(users))
+            )
+        elif object_type == MEETINGS:
+            is_meetings_in_objects = False
+            if MEETINGS in self.configuration_objects:
+                is_meetings_in_objects = True
+                self.logger.info(
+                    f"Thread: [{threading.get_ident()}] fetching {MEETINGS}."
+                )
+            meetings_object = ZoomMeetings(
+                self.config,
+                self.logger,
+                self.zoom_client,
+                self.zoom_enterprise_search_mappings,
+            )
+            for meetings_documents in self.iter_meetings(
+                users,
+                meetings_object,
+                is_meetings_in_objects,
+            ):
+                self.append_documents(meetings_documents, documents_to_index)
+            if PAST_MEETINGS in self.configuration_objects:
+                meetings_data = meetings_object.meetings_past_meetings_list
+                if is_follow_up_deferred:
+                    # The past-meetings only depend on the meetings, they are fanned out to the idle threads.
+                    for meetings_chunk in split_documents_into_equal_chunks(
+                        meetings_data, PAST_MEETINGS_TASK_SIZE
+                    ):
+                        self.follow_up_tasks.put((PAST_MEETINGS, users, meetings_chunk))
+                    return
+                self.logger.info(
+                    f"Thread: [{threading.get_ident()}] fetching {PAST_MEETINGS}."
+                )
+                for past_meetings_documents in self.iter_past_meetings(meetings_data):
+                    self.append_documents(past_meetings_documents, documents_to_index)
+        elif object_type == RECORDINGS:
+            for recordings_documents in self.iter_recordings(users):
+                self.append_documents(
+                    recordings_documents, documents_to_index, is_append_to_queue
+                )
+        elif object_type == CHANNELS:
+            self.append_documents(
+                self.get_channels(users),
+                documents_to_index,
+                is_append_to_queue,
+            )
+        elif object_type in [CHATS, FILES]:
+            chat_access_enabled_users = get_chat_access_enabled_users(users, self.all_chat_access)
+            if not chat_access_enabled_users:
+                return
+            chats_files_object = ZoomChatMessages(
+                self.config,
+                self.logger,
+                self.zoom_client,
+                self.zoom_enterprise_search_mappings,
+            )
+            if object_type == CHATS:
+                chats_schema = self.get_schema_fields(CHATS)
+                for chats_documents in chats_files_object.iter_chat_messages_documents(
+                    users_data=chat_access_enabled_users,
+                    chats_schema=chats_schema,
+                    start_time=self.objects_time_range[CHATS][0],
+                    end_time=self.objects_time_range[CHATS][1],
+                    enable_permission=self.enable_permission,
+                    chats_documents_ids=(
+                        self.fetched_chats_ids if is_append_to_queue else self.existing_chats_ids
+                    ),
+                    document_builder=self.document_builder,
+                ):
+                    self.append_documents(
+                        chats_documents, documents_to_index, is_append_to_queue
+                    )
+            else:
+                files_schema = self.get_schema_fields(FILES)
+                for files_documents in chats_files_object.iter_files_details_documents(
+                    users=chat_access_enabled_users,
+                    files_schema=files_schema,
+                    start_time=self.objects_time_range[FILES][0],
+                    end_time=self.objects_time_range[FILES][1],
+                    enable_permission=self.enable_permission,
+                    files_documents_ids=(
+                        self.fetched_files_ids if is_append_to_queue else self.existing_files_ids
+                    ),
+                ):
+                    self.append_documents(
+                        files_documents, documents_to_index, is_append_to_queue
+                    )
+
+    def append_documents(self, documents, ids_storage, is_append_to_queue=True):
+        """Appends the documents to the shared queue and keeps only their properties for the local storage,
+        so the documents are released as soon as they are handed over to the queue.
+        :param documents: list of documents generated for the zoom objects.
+        :param ids_storage: list of dictionary containing the properties of the documents fetched so far.
+        :param is_append_to_queue: boolean to append the documents to the queue, false while running deletion sync.
+        """
+        if is_append_to_queue:
+            self.queue.append_to_queue(documents)
+        ids_storage.extend(self.get_ids_storage(documents))
+
+    def get_ids_storage(self, documents):
+        """Returns the properties of the documents which are stored in the local storage.
+        :param documents: list of documents generated for the zoom objects.
+        :returns: list of dictionary containing the properties (id, type, parent_id, created_at) of documents.
+        """
+        ids_storage = []
+        for document in documents:
             ids_storage.append(
                 {
                     "id": str(document["id"]),
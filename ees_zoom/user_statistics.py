@@ -0,0 +1,115 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""user_statistics module persists the cost of fetching the objects of each user from Zoom, so the next
+sync can schedule the most expensive users first and finish without a long tail."""
+import json
+import os
+import tempfile
+import threading
+
+from .utils import get_current_time
+
+USER_STATISTICS_PATH = os.path.join(os.path.dirname(__file__), "user_statistics.json")
+STATISTICS_FIELDS = ["api_calls", "documents", "seconds"]
+
+
+class UserStatistics:
+    """This class stores, for every user and user dependent object type, the number of Zoom API calls,
+    the number of documents and the seconds spent by the last sync which fetched them.
+
+    The structure of the user_statistics.json is {'user_id': {'object_type': {'api_calls': 0, 'documents': 0,
+    'seconds': 0.0, 'updated_at': 'time'}}}"""
+
+    def __init__(self, logger, shard=None):
+        self.logger = logger
+        # Every shard of a sharded sync keeps the statistics of its own users.
+        self.statistics_path = (
+            shard.get_storage_path(USER_STATISTICS_PATH) if shard else USER_STATISTICS_PATH
+        )
+        self.lock = threading.Lock()
+        self.statistics = None
+        self.recorded_statistics = {}
+
+    def load_statistics(self):
+        """Returns the statistics stored by the previous syncs, they are read once.
+        :returns: dictionary of the statistics of every user.
+        """
+        with self.lock:
+            if self.statistics is None:
+                self.statistics = {}
+                try:
+                    with open(self.statistics_path, encoding="utf-8") as statistics_file:
+                        self.statistics = json.load(statistics_file)
+                except FileNotFoundError:
+                    self.logger.debug("User statistics were not found.")
+                except ValueError as exception:
+                    self.logger.exception(
+                        f"Error while parsing the user statistics from path: {self.statistics_path}. Error: {exception}"
+                    )
+            return self.statistics
+
+    def get_cost(self, user_id, object_type):
+        """Returns the seconds spent by the previous sync to fetch an object type of a user.
+        :param user_id: String of Zoom user id.
+        :param object_type: user dependent object type.
+        :returns: seconds spent, None if the user was never synced.
+        """
+        return self.load_statistics().get(user_id, {}).get(object_type, {}).get("seconds")
+
+    def record(self, user_id, object_type, api_calls, documents, seconds):
+        """Records the cost of fetching an object type of a user during the running sync, the costs of the
+        tasks sharing an object type and a user are summed.
+        :param user_id: String of Zoom user id.
+        :param object_type: user dependent object type.
+        :param api_calls: number of Zoom API calls.
+        :param documents: number of documents generated.
+        :param seconds: seconds spent.
+        """
+        with self.lock:
+            object_statistics = self.recorded_statistics.setdefault(user_id, {}).setdefault(
+                object_type, {"api_calls": 0, "documents": 0, "seconds": 0}
+            )
+            object_statistics["api_calls"] += api_calls
+            object_statistics["documents"] += documents
+            object_statistics["seconds"] = round(object_statistics["seconds"] + seconds, 3)
+            object_statistics["updated_at"] = get_current_time()
+
+    def save(self):
+        """Stores the statistics recorded during the running sync over the ones of the previous syncs."""
+        if not self.recorded_statistics:
+            return
+        statistics = self.load_statistics()
+        with self.lock:
+            for user_id, objects_statistics in self.recorded_statistics.items():
+                statistics.setdefault(user_id, {}).update(objects_statistics)
+            self.recorded_statistics = {}
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=os.path.dirname(self.statistics_path), prefix=".user_statistics-", suffix=".json"
+            )
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as statistics_file:
+                    json.dump(statistics, statistics_file, indent=4)
+                os.replace(temporary_path, self.statistics_path)
+            except Exception as exception:
+                self.logger.exception(
+                    f"Error while updating the user statistics. Error: {exception}"
+                )
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+
+    def get_users_summary(self):
+        """Returns the statistics of every user summed over the object types, most expensive user first.
+        :returns: list of tuples of user id and dictionary of the summed statistics.
+        """
+        summary = []
+        for user_id, objects_statistics in self.load_statistics().items():
+            user_summary = {field: 0 for field in STATISTICS_FIELDS}
+            for object_statistics in objects_statistics.values():
+                for field in STATISTICS_FIELDS:
+                    user_summary[field] += object_statistics.get(field, 0)
+            summary.append((user_id, user_summary))
+        summary.sort(key=lambda user: user[1]["seconds"], reverse=True)
+        return summary
@@ -0,0 +1,47 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""This module allows to inspect the per user statistics stored by the syncs.
+
+    It prints the users whose objects took the longest to fetch from Zoom during
+    the last syncs, along with the cost of each of their object types.
+"""
+
+from .base_command import BaseCommand
+from .user_statistics import UserStatistics
+
+
+class UserStatisticsCommand(BaseCommand):
+    """This class prints the user statistics used to order the sync of the users."""
+
+    def execute(self):
+        """This function prints the most expensive users, the number of users being set by the --top argument."""
+        user_statistics = UserStatistics(self.logger, self.shard)
+        users_summary = user_statistics.get_users_summary()
+        if not users_summary:
+            print("No user statistics found, they are stored by the full-sync and incremental-sync commands.")
+            return
+        top = getattr(self.args, "top", None) or len(users_summary)
+        statistics = user_statistics.load_statistics()
+        print(f"{'user / object type':<40}{'seconds':>12}{'api calls':>12}{'documents':>12}")
+        for user_id, user_summary in users_summary[:top]:
+            print(self.format_row(user_id, user_summary))
+            objects_statistics = sorted(
+                statistics[user_id].items(),
+                key=lambda object_statistics: object_statistics[1].get("seconds", 0),
+                reverse=True,
+            )
+            for object_type, object_statistics in objects_statistics:
+                print(self.format_row(f"  {object_type}", object_statistics))
+        print(f"{min(top, len(users_summary))} user(s) out of {len(users_summary)} shown.")
+
+    def format_row(self, name, statistics):
+        """Formats a line of the user statistics table.
+        :param name: user id or object type.
+        :param statistics: dictionary of the api calls, documents and seconds.
+        :returns: formatted line.
+        """
+        seconds, api_calls, documents = [statistics.get(field, 0) for field in ["seconds", "api_calls", "documents"]]
+        return f"{name:<40}{seconds:>12.2f}{api_calls:>12}{documents:>12}"
@@ -5,9 +5,13 @@
 #
 """This module contains un-categorized utility methods.
 """
+import hashlib
+import json
+import math
+import threading
 import time
 import urllib.parse
-from datetime import datetime
+from datetime import date, datetime
 
 import tika
 from requests.exceptions import ReadTimeout
@@ -16,6 +20,11 @@ from urllib3.exceptions import ReadTimeoutError
 
 from .constant import RFC_3339_DATETIME_FORMAT
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 TIKA_TIMEOUT = 60  # Timeout in seconds
 
 
@@ -111,6 +120,97 @@ def split_list_into_buckets(documents, total_buckets):
         return []
 
 
+class BloomFilter:
+    """Fixed size bit array remembering the digests added to it. It never forgets a digest, but may report
+    a digest which was never added as present with a probability bounded by the error rate, as long as
+    no more than capacity digests are added."""
+
+    def __init__(self, capacity, error_rate):
+        """
+        :param capacity: number of digests the filter is sized for.
+        :param error_rate: probability of reporting a digest which was never added as present.
+        """
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, digest):
+        """Sets the bits of the digest.
+        :param digest: 16 bytes digest of the id.
+        :returns: boolean whether one of the bits was not set, i.e. the digest was not present.
+        """
+        first = int.from_bytes(digest[:8], "little")
+        # An odd step visits distinct positions of the bit array for every hash.
+        second = int.from_bytes(digest[8:], "little") | 1
+        is_added = False
+        for index in range(self.hash_count):
+            position = (first + index * second) % self.size
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                is_added = True
+        return is_added
+
+
+class SharedIdSet:
+    """Set of ids shared by the threads fetching the documents, used to skip the documents already fetched
+    by another thread. Checking and adding an id is done atomically.
+
+    Only a 128 bits digest of every id is kept, or the id itself for an exact set. With a bloom filter
+    capacity, a BloomFilter sits in front of the digests: the ids it reports as new are added without looking
+    up the set, the ids it reports as maybe present are checked against the set, so a document which was never
+    fetched is never skipped."""
+
+    def __init__(self, bloom_filter_capacity=0, bloom_filter_error_rate=0.001, is_exact=False):
+        """
+        :param bloom_filter_capacity: number of ids the bloom filter is sized for, 0 for no bloom filter.
+        :param bloom_filter_error_rate: probability of looking up the set for an id which was never added.
+        :param is_exact: boolean to keep the ids instead of their digests, the bloom filter capacity is ignored.
+        """
+        self.is_exact = is_exact
+        self.ids = set()
+        self.bloom_filter = (
+            BloomFilter(bloom_filter_capacity, bloom_filter_error_rate)
+            if bloom_filter_capacity and not is_exact
+            else None
+        )
+        self.lock = threading.Lock()
+
+    def get_key(self, document_id):
+        """Returns the key of the id kept in the set.
+        :param document_id: id of the document.
+        :returns: the id as a string for an exact set, its digest otherwise.
+        """
+        if self.is_exact:
+            return str(document_id)
+        return hashlib.blake2b(str(document_id).encode("utf-8"), digest_size=16).digest()
+
+    def add_if_absent(self, document_id):
+        """Adds the id to the set unless it is already present.
+        :param document_id: id of the document.
+        :returns: boolean whether the id was added, False when another thread already fetched the document.
+        """
+        key = self.get_key(document_id)
+        with self.lock:
+            # The bloom filter only answers that an id is new, a maybe present id is checked in the set.
+            is_added = (self.bloom_filter is not None and self.bloom_filter.add(key)) or key not in self.ids
+            if is_added:
+                self.ids.add(key)
+            return is_added
+
+    def discard(self, document_id):
+        """Removes the id from the set, so the document is fetched again by the next thread which sees it,
+        e.g. when its document could not be created or queued.
+        :param document_id: id of the document.
+        """
+        key = self.get_key(document_id)
+        with self.lock:
+            self.ids.discard(key)
+
+    def __len__(self):
+        return len(self.ids)
+
+
 def split_documents_into_equal_chunks(documents, chunk_size):
     """This method splits a list or dictionary into equal chunks size
     :param documents: List or Dictionary to be partitioned into chunks
@@ -133,6 +233,41 @@ def get_current_time():
     return (datetime.utcnow()).strftime(RFC_3339_DATETIME_FORMAT)
 
 
+def encode_json_default(value):
+    """Encodes the values the json module can not encode, the dates as orjson does.
+    :param value: value to be encoded.
+    :returns: string encoding the value.
+    """
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_document(document):
+    """Returns the JSON encoding of a document, as it is sent in the body of an indexing request.
+    The document is encoded with orjson when it is installed, with the json module otherwise.
+    :param document: dictionary of the document.
+    :returns: bytes of the JSON encoded document.
+    """
+    if orjson:
+        try:
+            return orjson.dumps(document, default=encode_json_default)
+        except TypeError:
+            # orjson rejects the documents the json module accepts, e.g. with integers beyond 64 bits.
+            pass
+    return json.dumps(
+        document, default=encode_json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def encode_documents(encoded_documents):
+    """Assembles the body of an indexing request from the JSON encoded documents.
+    :param encoded_documents: list of bytes of the JSON encoded documents.
+    :returns: bytes of the JSON array of the documents.
+    """
+    return b"[" + b",".join(encoded_documents) + b"]"
+
+
 def split_by_max_cumulative_length(documents, allowed_size):
     """This method splits a list or dictionary into list based on allowed size limit.
     :param documents: List or Dictionary to be partitioned into chunks
@@ -62,20 +62,11 @@ class ZoomChannels:
                 if len(channels_list) <= 0:
                     continue
                 for channel in channels_list:
-                    channels_dict = {"type": CHANNELS}
-                    for ws_field, zoom_fields in channel_schema.items():
-                        channels_dict[ws_field] = channel[zoom_fields]
-                    channels_dict["body"] = f"{channel['channel_settings']}"
-                    channels_dict[
-                        "url"
-                    ] = f"https://zoom.us/account/imchannel/old#/member/{channel['id']}"
-                    if enable_permission:
-                        permission_list = ["ChatChannel:Read"]
-                        permission_list.extend(
-                            self.zoom_enterprise_search_mappings.get(user["id"], [])
+                    channel_documents.append(
+                        self.create_channel_document(
+                            user["id"], channel, channel_schema, enable_permission
                         )
-                        channels_dict["_allow_permissions"] = permission_list
-                    channel_documents.append(channels_dict)
+                    )
             self.logger.info(
                 f"Thread: [{threading.get_ident()}] {len(channel_documents)} number(s) of Channels "
                 f"documents generated."
@@ -91,3 +82,28 @@ class ZoomChannels:
                 f"Error occurred while preparing document for channels : {exception}"
             )
             raise exception
+
+    def create_channel_document(
+        self, user_id, channel, channel_schema, enable_permission
+    ):
+        """This function will create a document for the channel of the user to index in workplace search
+        :param user_id: String of Zoom user id.
+        :param channel: dictionary containing details fetched for a channel from Zoom.
+        :param channel_schema: dictionary of fields available in include fields and DEFAULT_SCHEMA.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :returns: dictionary of channel document.
+        """
+        channels_dict = {"type": CHANNELS}
+        for ws_field, zoom_fields in channel_schema.items():
+            channels_dict[ws_field] = channel[zoom_fields]
+        channels_dict["body"] = f"{channel['channel_settings']}"
+        channels_dict[
+            "url"
+        ] = f"https://zoom.us/account/imchannel/old#/member/{channel['id']}"
+        if enable_permission:
+            permission_list = ["ChatChannel:Read"]
+            permission_list.extend(
+                self.zoom_enterprise_search_mappings.get(user_id, [])
+            )
+            channels_dict["_allow_permissions"] = permission_list
+        return channels_dict
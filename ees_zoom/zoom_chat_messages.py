@@ -13,7 +13,7 @@ import requests
 from dateutil.relativedelta import relativedelta
 
 from .constant import CHATS, FILES
-from .utils import constraint_time_range, extract, retry
+from .utils import SharedIdSet, constraint_time_range, extract, retry
 
 TIME_CONSTRAINT_FOR_CHATS = (datetime.utcnow()) + relativedelta(days=-180)
 CHATS_URL = "https://zoom.us/account/archivemsg/search#/list"
@@ -73,9 +73,39 @@ class ZoomChatMessages:
         :param enable_permission: boolean to check if permission sync is enabled or not.
         :returns: dictionary containing type of data along with the data.
         """
+        chats_documents = []
+        for chats_documents_page in self.iter_chat_messages_documents(
+            users_data, chats_schema, start_time, end_time, enable_permission
+        ):
+            chats_documents.extend(chats_documents_page)
+        return {"type": CHATS, "data": chats_documents}
+
+    def iter_chat_messages_documents(
+        self,
+        users_data,
+        chats_schema,
+        start_time,
+        end_time,
+        enable_permission,
+        chats_documents_ids=None,
+        document_builder=None,
+    ):
+        """This method will iterate over list of users and will yield the chats documents of each
+        page fetched from Zoom, so only one page of chats is held in memory at a time.
+        :param users_data: list of dictionaries where each dictionary contains details fetched for a user from Zoom.
+        :param chats_schema: dictionary of fields to be indexed for Chats.
+        :param start_time: datetime object for lower limit for data fetching.
+        :param end_time: datetime object for upper limit for data fetching.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :param chats_documents_ids: SharedIdSet of the chats already fetched by the other threads.
+        :param document_builder: DocumentBuilder creating the documents in worker processes, None to create
+            them in the calling thread.
+        :yields: list of chats documents generated from one page of chats.
+        """
         try:
-            chats_documents = []
-            chats_documents_ids = []
+            if chats_documents_ids is None:
+                chats_documents_ids = SharedIdSet()
+            chats_count = 0
             start_time, end_time = constraint_time_range(
                 start_time=start_time, end_time=end_time, time_constraint=TIME_CONSTRAINT_FOR_CHATS, logger=self.logger
             )
@@ -84,34 +114,63 @@ class ZoomChatMessages:
                     f"Thread: [{threading.get_ident()}] Attempting to extract"
                     f" chat(s) of user {user}"
                 )
-                chats_list = self.get_chats_from_user_id(user, start_time, end_time)
-                for chat in chats_list:
+                url = (
+                    f"chat/users/{user}/messages?page_size=300&search_key=%20"
+                    f"&search_type=message&from={start_time}&to={end_time}"
+                )
+                for chats_page in self.zoom_client.iter_pages(
+                    end_point=url, key="messages"
+                ):
                     # skipping the chat if it's already fetched by any previous user id.
-                    if chat["id"] in chats_documents_ids:
-                        continue
-                    chat_document = {"type": CHATS, "parent_id": user}
-                    for ws_field, zoom_fields in chats_schema.items():
-                        chat_document[ws_field] = chat[zoom_fields]
-                    chat_document["body"] = f"Message : {chat['message']}"
-                    chat_document["url"] = CHATS_URL
-                    if enable_permission:
-                        permission_list = ["ChatMessage:Read"]
-                        permission_list.extend(
-                            self.zoom_enterprise_search_mappings.get(user, [])
-                        )
-                        chat_document["_allow_permissions"] = permission_list
-                    chats_documents.append(chat_document)
-                    chats_documents_ids.append(chat_document["id"])
+                    new_chats = [chat for chat in chats_page if chats_documents_ids.add_if_absent(chat["id"])]
+                    try:
+                        if document_builder is not None:
+                            chats_documents = document_builder.create_documents(
+                                CHATS, user, new_chats, chats_schema, enable_permission
+                            )
+                        else:
+                            chats_documents = [
+                                self.create_chat_document(user, chat, chats_schema, enable_permission)
+                                for chat in new_chats
+                            ]
+                        chats_count += len(chats_documents)
+                        # The caller queues the documents before resuming the generator.
+                        yield chats_documents
+                    except BaseException:
+                        # The chats are fetched again by the other users sharing them.
+                        for chat in new_chats:
+                            chats_documents_ids.discard(chat["id"])
+                        raise
             self.logger.info(
-                f"Thread: [{threading.get_ident()}] Fetched total {len(chats_documents)} chat(s) documents."
+                f"Thread: [{threading.get_ident()}] Fetched total {chats_count} chat(s) documents."
             )
-            return {"type": CHATS, "data": chats_documents}
         except Exception as exception:
             self.logger.error(
                 f"Error {exception} occurred while generating chat(s) documents."
             )
             raise
 
+    def create_chat_document(self, user_id, chat, chats_schema, enable_permission):
+        """This method will create a document for the chat sent by the user ready to be indexed.
+        :param user_id: String of Zoom user id.
+        :param chat: dictionary containing details fetched for a chat from Zoom.
+        :param chats_schema: dictionary of fields to be indexed for Chats.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :returns: dictionary of chat document.
+        """
+        chat_document = {"type": CHATS, "parent_id": user_id}
+        for ws_field, zoom_fields in chats_schema.items():
+            chat_document[ws_field] = chat[zoom_fields]
+        chat_document["body"] = f"Message : {chat['message']}"
+        chat_document["url"] = CHATS_URL
+        if enable_permission:
+            permission_list = ["ChatMessage:Read"]
+            permission_list.extend(
+                self.zoom_enterprise_search_mappings.get(user_id, [])
+            )
+            chat_document["_allow_permissions"] = permission_list
+        return chat_document
+
     def get_files_from_user_id(self, user_id, start_time, end_time):
         """This method will fetch all the files sent by the user, save it in the list.
         :param user_id: string of the user ID.
@@ -149,7 +208,9 @@ class ZoomChatMessages:
         """
         attachment_content_response = None
         try:
-            attachment_content_response = requests.get(file_download_url)
+            attachment_content_response = self.zoom_client.session.get(
+                file_download_url
+            )
         except (
             requests.exceptions.HTTPError,
             requests.exceptions.ConnectionError,
@@ -181,56 +242,86 @@ class ZoomChatMessages:
         :param enable_permission: boolean to check if permission sync is enabled or not.
         :returns: dictionary containing type of data along with the data.
         """
+        files_documents = []
+        for files_documents_page in self.iter_files_details_documents(
+            users, files_schema, start_time, end_time, enable_permission
+        ):
+            files_documents.extend(files_documents_page)
+        return {"type": FILES, "data": files_documents}
+
+    def iter_files_details_documents(
+        self,
+        users,
+        files_schema,
+        start_time,
+        end_time,
+        enable_permission,
+        files_documents_ids=None,
+    ):
+        """This method will iterate over list of users and will yield the files documents of each
+        page fetched from Zoom, so only one page of files and their content is held in memory at a time.
+        :param users: list of dictionaries containing User details.
+        :param files_schema: dictionary of fields to be indexed for Files.
+        :param start_time: datetime object for lower limit for data fetching.
+        :param end_time: datetime object for upper limit for data fetching.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :param files_documents_ids: SharedIdSet of the files already fetched by the other threads.
+        :yields: list of files documents generated from one page of files.
+        """
         try:
             start_time, end_time = constraint_time_range(
                 start_time=start_time, end_time=end_time, time_constraint=TIME_CONSTRAINT_FOR_CHATS, logger=self.logger
             )
-            files_documents = []
+            if files_documents_ids is None:
+                files_documents_ids = SharedIdSet()
+            files_documents_count = 0
             for user in users:
                 self.logger.info(
                     f"Thread: [{threading.get_ident()}] Attempting to extract file(s) for user {user}."
                 )
-                file_list = self.get_files_from_user_id(user, start_time, end_time)
+                url = (
+                    f"chat/users/{user}/messages?page_size=300&search_key=%20&"
+                    f"search_type=file&from={start_time}&to={end_time}"
+                )
+                files_count = 0
+                for files_page in self.zoom_client.iter_pages(
+                    end_point=url, key="messages"
+                ):
+                    files_count += len(files_page)
+                    files_documents = []
+                    new_files_ids = []
+                    try:
+                        for file in files_page:
+                            # skipping the file if it's already fetched by any previous user id.
+                            if not files_documents_ids.add_if_absent(file["file_id"]):
+                                continue
+                            new_files_ids.append(file["file_id"])
+                            attachment_content_response = self.fetch_file_content(
+                                file["download_url"]
+                            )
+                            files_documents.append(
+                                self.create_file_document(
+                                    user,
+                                    file,
+                                    files_schema,
+                                    enable_permission,
+                                    attachment_content_response,
+                                )
+                            )
+                        files_documents_count += len(files_documents)
+                        # The caller queues the documents before resuming the generator.
+                        yield files_documents
+                    except BaseException:
+                        # The files are fetched again by the other users sharing them.
+                        for file_id in new_files_ids:
+                            files_documents_ids.discard(file_id)
+                        raise
                 self.logger.info(
-                    f"Thread: [{threading.get_ident()}] Fetched total : {len(file_list)} file(s) for {user}."
+                    f"Thread: [{threading.get_ident()}] Fetched total : {files_count} file(s) for {user}."
                 )
-                for file in file_list:
-                    # skipping the file if it's already fetched by any previous user id.
-                    if any(
-                        document["id"] == file["file_id"]
-                        for document in files_documents
-                    ):
-                        continue
-                    file_document = {"type": FILES, "parent_id": user}
-                    for ws_field, zoom_fields in files_schema.items():
-                        file_document[ws_field] = file[zoom_fields]
-                    attachment_content_response = self.fetch_file_content(
-                        file["download_url"]
-                    )
-                    content = ""
-                    if attachment_content_response:
-                        file_name = file.get("file_name", "file_id")
-                        self.logger.info(f"Fetching Content of file : {file_name}")
-                        content = extract(
-                            attachment_content_response,
-                            file_name,
-                            self.logger,
-                            retry_count=2,
-                        )
-                    file_document[
-                        "body"
-                    ] = f"Sender : {file['sender']}\nFile Content : {content}"
-                    if enable_permission:
-                        permission_list = ["ChatMessage:Read"]
-                        permission_list.extend(
-                            self.zoom_enterprise_search_mappings.get(user, [])
-                        )
-                        file_document["_allow_permissions"] = permission_list
-                    files_documents.append(file_document)
             self.logger.info(
-                f"Thread: [{threading.get_ident()}] Fetched total {len(files_documents)} file(s) documents."
+                f"Thread: [{threading.get_ident()}] Fetched total {files_documents_count} file(s) documents."
             )
-            return {"type": FILES, "data": files_documents}
         except KeyError as key_error_exception:
             self.logger.error(
                 f"Error {key_error_exception} occurred while generating file(s) documents."
@@ -241,3 +332,41 @@ class ZoomChatMessages:
                 f"Error {exception} occurred while generating file(s) documents."
             )
             raise
+
+    def create_file_document(
+        self,
+        user_id,
+        file,
+        files_schema,
+        enable_permission,
+        attachment_content_response,
+    ):
+        """This method will create a document for the file sent by the user ready to be indexed.
+        :param user_id: string of the user ID.
+        :param file: dictionary containing details fetched for a file from Zoom.
+        :param files_schema: dictionary of fields to be indexed for Files.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :param attachment_content_response: downloaded content of the file.
+        :returns: dictionary of file document.
+        """
+        file_document = {"type": FILES, "parent_id": user_id}
+        for ws_field, zoom_fields in files_schema.items():
+            file_document[ws_field] = file[zoom_fields]
+        content = ""
+        if attachment_content_response:
+            file_name = file.get("file_name", "file_id")
+            self.logger.info(f"Fetching Content of file : {file_name}")
+            content = extract(
+                attachment_content_response,
+                file_name,
+                self.logger,
+                retry_count=2,
+            )
+        file_document["body"] = f"Sender : {file['sender']}\nFile Content : {content}"
+        if enable_permission:
+            permission_list = ["ChatMessage:Read"]
+            permission_list.extend(
+                self.zoom_enterprise_search_mappings.get(user_id, [])
+            )
+            file_document["_allow_permissions"] = permission_list
+        return file_document
@@ -6,13 +6,20 @@
 """zoom_client modules allows to generate access token for Zoom Oauth app,
 with this access token is useful for running various Zoom APIs."""
 import base64
+import copy
 import json
+import queue
+import re
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import requests
 import requests.exceptions
+from requests.adapters import HTTPAdapter
 
+from .rate_limiter import RateLimiter, get_endpoint_category
+from .response_cache import ResponseCache
 from .secrets_storage import SecretsStorage
 from .utils import retry
 
@@ -21,6 +28,18 @@ ZOOM_BASE_URL = "https://api.zoom.us/v2/"
 REFRESH_TOKEN_FIELD = "zoom.refresh_token"
 ACCESS_TOKEN_FIELD = "zoom.access_token"
 EXPIRATION_TIME_FIELD = "zoom.access_token_expiry_time"
+# Number of distinct hosts (api.zoom.us, zoom.us and the file download host) kept in each session's pool.
+POOLED_HOSTS_COUNT = 4
+# Seconds a prefetching thread waits for room in the page buffer before checking if the caller stopped reading.
+PREFETCH_POLL_INTERVAL = 0.5
+PREFETCH_END = object()
+# Account wide endpoints requested by many tasks of a command: the roles, the privileges and members of a role,
+# the users and the groups. Their responses are kept for the lifetime of the command.
+MEMOIZED_END_POINTS = re.compile(r"(roles(/[^/?]+(/members)?)?|users|groups)(\?|$)")
+# Seconds an access token generated by Zoom is used for.
+TOKEN_LIFETIME = 3500
+# Seconds before the expiry of the access token at which it is rotated in background.
+TOKEN_REFRESH_MARGIN = 300
 
 
 class AccessTokenGenerationException(Exception):
@@ -36,10 +55,29 @@ class AccessTokenGenerationException(Exception):
 lock = threading.Lock()
 
 
+def is_token_usable(access_token, expiration, min_validity=0, rejected_token=None):
+    """Checks if an access token can be sent to Zoom.
+    :param access_token: access token to check.
+    :param expiration: time at which the access token expires.
+    :param min_validity: number of seconds the token must still be valid for.
+    :param rejected_token: access token Zoom answered with status 401, never considered usable.
+    :returns: boolean whether the access token can be used.
+    """
+    if not access_token or not expiration or access_token == rejected_token:
+        return False
+    return time.time() < expiration - min_validity
+
+
 class ZoomClient:
     """This class is used to generate the access token to call different Zoom Apis."""
 
-    def __init__(self, config, logger):
+    def __init__(self, config, logger, use_response_cache=True):
+        """
+        :param config: Configuration object.
+        :param logger: Logger object.
+        :param use_response_cache: boolean to read and store the responses in the response cache when
+            zoom_response_cache_enabled is set, False for the commands which need the current state of Zoom.
+        """
         self.retry_count = int(config.get_value("retry_count"))
         self.client_id = config.get_value("zoom.client_id")
         self.client_secret = config.get_value("zoom.client_secret")
@@ -50,6 +88,44 @@ class ZoomClient:
         self.config_file_path = config.file_name
         self.access_token_expiration = time.time()
         self.is_token_generated = False
+        self.token_refresh_thread = None
+        self.token_refresh_thread_lock = threading.Lock()
+        self.thread_local = threading.local()
+        self.rate_limiter = RateLimiter(config, logger)
+        self.prefetch_depth = config.get_value("zoom_prefetch_depth") or 0
+        self.prefetch_thread_count = config.get_value("zoom_sync_thread_count")
+        self.prefetch_executor = None
+        self.prefetch_executor_lock = threading.Lock()
+        self.single_flight_calls = {}
+        self.single_flight_lock = threading.Lock()
+        self.saved_calls_count = 0
+        self.response_cache = None
+        if use_response_cache and config.get_value("zoom_response_cache_enabled"):
+            self.response_cache = ResponseCache(config, logger)
+
+    @property
+    def session(self):
+        """Returns the requests session bound to the calling thread.
+        Each worker thread reuses its own session, so the TCP+TLS connections to Zoom
+        are kept alive across requests instead of being opened for every call. A thread
+        sends one request at a time, so the default number of connections per host is enough.
+        :returns session: requests.Session object with pooled HTTPAdapter mounted.
+        """
+        session = getattr(self.thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOLED_HOSTS_COUNT)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self.thread_local.session = session
+        return session
+
+    def get_thread_api_calls_count(self):
+        """Returns the number of Zoom API calls made by the calling thread, used to measure the cost of a task.
+        The calls made by the prefetch threads are not included.
+        :returns: number of calls.
+        """
+        return getattr(self.thread_local, "api_calls_count", 0)
 
     def get_headers(self):
         """generates header to fetch refresh token from zoom.
@@ -72,6 +148,7 @@ class ZoomClient:
         Raises the Exception accordingly.
         :param json_data: json response from Zoom.
         :param http_error: Exception raised from requests module.
+        :returns: True when the token should be loaded again as a sync not sharing the lock may have rotated it.
 
         Raises:
             AccessTokenGenerationException: Custom Exception for handling 4xx error.
@@ -81,11 +158,7 @@ class ZoomClient:
         if reason in ["Invalid Token!", "Invalid authorization code"]:
             if not self.is_token_generated:
                 self.is_token_generated = True
-                # sleep to wait for secret storage update process while running cronjob with multiple syncs.
-                time.sleep(1)
-                lock.release()
-                self.ensure_token_valid()
-                return
+                return True
             invalid_field = "zoom.authorization_code"
             secrets = {
                 REFRESH_TOKEN_FIELD: "",
@@ -105,6 +178,56 @@ class ZoomClient:
             f"Solution: Please update the {invalid_field} in zoom_connector.yml."
         )
 
+    def is_token_valid(self, min_validity=0, rejected_token=None):
+        """Checks the access token kept in memory without taking any lock.
+        :param min_validity: number of seconds the token must still be valid for.
+        :param rejected_token: access token Zoom answered with status 401, never considered valid.
+        :returns: boolean whether the token in memory can be used.
+        """
+        return is_token_usable(
+            getattr(self, "access_token", None),
+            self.access_token_expiration,
+            min_validity,
+            rejected_token,
+        )
+
+    def ensure_token_valid(self):
+        """This module makes sure a valid access token is available before calling Zoom.
+        The token is kept in memory and checked without any lock or disk access, it is only loaded
+        from the secrets storage or generated when it is missing or expired. A background refresh
+        is started once the token gets close to its expiry, so the API calls never wait for it."""
+        if self.is_token_valid():
+            if not self.is_token_valid(min_validity=TOKEN_REFRESH_MARGIN):
+                self.start_background_token_refresh()
+            return
+        self.refresh_access_token()
+
+    def handle_rejected_token(self, rejected_token):
+        """Replaces the access token after Zoom rejected it with status 401.
+        :param rejected_token: access token sent with the rejected request.
+        """
+        self.refresh_access_token(rejected_token=rejected_token)
+
+    def start_background_token_refresh(self):
+        """Starts the thread rotating the access token before it expires, unless one is already running."""
+        with self.token_refresh_thread_lock:
+            if self.token_refresh_thread and self.token_refresh_thread.is_alive():
+                return
+            self.token_refresh_thread = threading.Thread(
+                target=self.refresh_token_in_background, daemon=True
+            )
+            self.token_refresh_thread.start()
+
+    def refresh_token_in_background(self):
+        """Rotates the access token expiring in less than TOKEN_REFRESH_MARGIN seconds."""
+        try:
+            self.refresh_access_token(min_validity=TOKEN_REFRESH_MARGIN)
+        except Exception as exception:
+            self.logger.warning(
+                f"Error while refreshing the Zoom access token in background, it will be refreshed again "
+                f"before it expires. Error: {exception}"
+            )
+
     @retry(
         exception_list=(
             requests.exceptions.ConnectionError,
@@ -112,23 +235,39 @@ class ZoomClient:
             requests.exceptions.RequestException,
         )
     )
-    def ensure_token_valid(self):
-        """This module generates access token and refresh token using stored refresh token.
-        If refresh token is not stored then uses authorization code."""
-        lock.acquire()
-        secrets = self.secrets_storage.get_secrets()
-        refresh_token = ""
-
-        if secrets:
-            self.access_token_expiration = secrets.get(EXPIRATION_TIME_FIELD, "")
-            refresh_token = secrets.get(REFRESH_TOKEN_FIELD, "")
-
-        if self.access_token_expiration and time.time() < self.access_token_expiration:
-            self.is_token_generated = False
-            self.access_token = secrets.get(ACCESS_TOKEN_FIELD, "")
-            lock.release()
-            return
+    def refresh_access_token(self, min_validity=0, rejected_token=None):
+        """This module loads the access token from the secrets storage, or generates access token and
+        refresh token using stored refresh token when the stored access token expires in less than
+        min_validity seconds or was rejected by Zoom. If refresh token is not stored then uses authorization code.
+        :param min_validity: number of seconds the loaded token must still be valid for.
+        :param rejected_token: access token Zoom answered with status 401.
+        """
+        with lock:
+            # Another thread may have refreshed the token while this one was waiting for the lock.
+            if self.is_token_valid(min_validity, rejected_token):
+                return
+            # The other connector processes wait here while one of them rotates the token, then
+            # read the rotated token instead of calling Zoom with the refresh token it replaced.
+            with self.secrets_storage.lock():
+                secrets = self.secrets_storage.get_secrets() or {}
+                access_token = secrets.get(ACCESS_TOKEN_FIELD, "")
+                expiration = secrets.get(EXPIRATION_TIME_FIELD) or 0
+                if is_token_usable(access_token, expiration, min_validity, rejected_token):
+                    self.is_token_generated = False
+                    self.access_token = access_token
+                    self.access_token_expiration = expiration
+                    return
+                is_reload_needed = self.generate_access_token(
+                    secrets.get(REFRESH_TOKEN_FIELD, "")
+                )
+        if is_reload_needed:
+            self.refresh_access_token(min_validity, rejected_token)
 
+    def generate_access_token(self, refresh_token):
+        """This module generates access token and refresh token from Zoom and stores them in the secrets storage.
+        :param refresh_token: stored refresh token, the authorization code is used when it is empty.
+        :returns: True when the token should be loaded again as a sync not sharing the lock may have rotated it.
+        """
         self.logger.info(
             f"Generating the access token and updating refresh token for the client ID: {self.client_id}..."
         )
@@ -138,7 +277,7 @@ class ZoomClient:
         else:
             url = f"{ZOOM_AUTH_BASE_URL}authorization_code&code={self.authorization_code}&redirect_uri={self.redirect_uri}"
         try:
-            response = requests.post(
+            response = self.session.post(
                 url=url,
                 headers=self.get_headers(),
             )
@@ -146,22 +285,26 @@ class ZoomClient:
             response.raise_for_status()
             if response and response.status_code == requests.codes.ok:
                 refresh_token = json_data["refresh_token"]
-                self.access_token = json_data["access_token"]
-                self.access_token_expiration = time.time() + 3500
+                access_token = json_data["access_token"]
+                expiration = time.time() + TOKEN_LIFETIME
+                # The token is published before its expiration, so lock-free readers never pair
+                # a new expiration with the previous token.
+                self.access_token = access_token
+                self.access_token_expiration = expiration
                 secrets = {
                     REFRESH_TOKEN_FIELD: refresh_token,
-                    ACCESS_TOKEN_FIELD: self.access_token,
-                    EXPIRATION_TIME_FIELD: self.access_token_expiration,
+                    ACCESS_TOKEN_FIELD: access_token,
+                    EXPIRATION_TIME_FIELD: expiration,
                 }
                 self.secrets_storage.set_secrets(secrets)
         except requests.exceptions.HTTPError as http_error:
-            if response.status_code in [400, 401]:
-                self.handle_4xx_error(json_data, http_error)
+            if response.status_code in [400, 401] and self.handle_4xx_error(
+                json_data, http_error
+            ):
+                return True
             self.logger.exception(f"HTTPError: {http_error}")
             raise http_error
-        finally:
-            if lock.locked():
-                lock.release()
+        return False
 
     @retry(
         exception_list=(
@@ -169,43 +312,268 @@ class ZoomClient:
             requests.exceptions.Timeout,
         )
     )
-    def get(self, end_point, key, is_paginated=False):
-        """Makes get call to Zoom api endpoint
+    def get_response(self, url, key, category, conditional_headers=None):
+        """Makes get call to one page of a Zoom api endpoint
+
+        :param url: url of the page with query parameters
+        :param key: Response json key to parse on successful get call
+        :param category: Zoom rate limit category of the endpoint
+        :param conditional_headers: If-None-Match/If-Modified-Since headers to revalidate a cached response
+        :returns response: requests.Response object with status 200, or 304 for a conditional request.
+        """
+        throttled_count = 0
+        while True:
+            headers = {
+                "authorization": f"Bearer {self.access_token}",
+                "content-type": "application/json",
+            }
+            if conditional_headers:
+                headers.update(conditional_headers)
+            self.rate_limiter.acquire(category)
+            self.thread_local.api_calls_count = self.get_thread_api_calls_count() + 1
+            response = self.session.get(url=url, headers=headers)
+
+            if response.status_code == 429 and throttled_count < self.retry_count:
+                # The same page is requested again once the rate limit window has passed.
+                throttled_count += 1
+                self.rate_limiter.handle_too_many_requests(category, response.headers)
+                continue
+            if response.status_code == 304 and conditional_headers:
+                return response
+            if response and response.status_code == 200:
+                self.rate_limiter.update_from_headers(category, response.headers)
+                return response
+            # Getting error code 400 but the zoom api documentation is suggesting error code 300
+            elif key == "privileges" and response.status_code in [300, 400]:
+                raise requests.exceptions.HTTPError(response=response)
+            elif response.status_code == 401:
+                self.handle_rejected_token(headers["authorization"][len("Bearer "):])
+            else:
+                response.raise_for_status()
+
+    def get_page(self, url, key, category):
+        """Makes get call to one page of a Zoom api endpoint
+
+        :param url: url of the page with query parameters
+        :param key: Response json key to parse on successful get call
+        :param category: Zoom rate limit category of the endpoint
+        :returns response: dictionary containing the json response of the page.
+        """
+        return json.loads(self.get_response(url, key, category).text)
+
+    def iter_pages(self, end_point, key, is_paginated=True, prefetch_depth=None):
+        """Yields the records of a Zoom api endpoint page by page, so callers can process
+        each page before the next one is fetched instead of holding the whole history in memory.
+        When prefetching is enabled, up to prefetch_depth pages are requested ahead in a background
+        thread while the caller is still processing the current page.
 
         :param end_point: endpoint url with query parameters
         :param key: Response json key to parse on successful get call
-        :returns api_response: list of dictionary containing response from endpoint.
+        :param is_paginated: boolean to follow the next_page_token of the responses.
+        :param prefetch_depth: number of pages to fetch ahead, zoom_prefetch_depth by default.
+        :yields page: list of dictionary containing the records of one page.
         """
         # Set access token either from secrets storage or fetch new one from Zoom in case it is expired
         self.ensure_token_valid()
+        if self.response_cache and self.response_cache.get_ttl(end_point):
+            yield from self.fetch_cached_pages(end_point, key, is_paginated)
+            return
+        if prefetch_depth is None:
+            prefetch_depth = self.prefetch_depth
+        pages = self.fetch_pages(end_point, key, is_paginated)
+        if is_paginated and prefetch_depth > 0:
+            pages = self.prefetch_pages(pages, prefetch_depth)
+        yield from pages
+
+    def fetch_pages(self, end_point, key, is_paginated):
+        """Yields the records of a Zoom api endpoint page by page, requesting a page only once
+        the previous one is consumed.
+
+        :param end_point: endpoint url with query parameters
+        :param key: Response json key to parse on successful get call
+        :param is_paginated: boolean to follow the next_page_token of the responses.
+        :yields page: list of dictionary containing the records of one page.
+        """
+        category = get_endpoint_category(end_point)
         next_page_token = True
-        api_response = []
 
         while next_page_token:
             url = f"{ZOOM_BASE_URL}{end_point}"
             if next_page_token is not True:
                 url = f"{url}&next_page_token={next_page_token}"
-            headers = {
-                "authorization": f"Bearer {self.access_token}",
-                "content-type": "application/json",
-            }
+            response = self.get_page(url, key, category)
+            yield response.get(key) or []
+            next_page_token = response.get("next_page_token") if is_paginated else None
 
-            response = requests.get(url=url, headers=headers)
+    def fetch_cached_pages(self, end_point, key, is_paginated):
+        """Yields the records of a cacheable Zoom api endpoint page by page. Fresh responses are served
+        from the response cache, stale single page responses are revalidated with the validators returned
+        by Zoom and the other responses are fetched again and stored in the cache.
 
-            if response and response.status_code == 200:
-                response = json.loads(response.text)
-                if key == "past_meetings":
-                    return response
-                if response.get(key):
-                    api_response.extend(response[key])
-                next_page_token = (
-                    response.get("next_page_token") if is_paginated else None
+        :param end_point: endpoint url with query parameters
+        :param key: Response json key to parse on successful get call
+        :param is_paginated: boolean to follow the next_page_token of the responses.
+        :yields page: list of dictionary containing the records of one page.
+        """
+        cache_key = f"{end_point}|{is_paginated}"
+        entry = self.response_cache.get(cache_key)
+        if entry and self.response_cache.is_fresh(entry, end_point):
+            self.response_cache.record(is_hit=True)
+            for page in entry["pages"]:
+                yield page.get(key) or []
+            return
+        conditional_headers = {}
+        if entry and len(entry["pages"]) == 1:
+            if entry["etag"]:
+                conditional_headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                conditional_headers["If-Modified-Since"] = entry["last_modified"]
+        category = get_endpoint_category(end_point)
+        pages = []
+        next_page_token = True
+
+        while next_page_token:
+            url = f"{ZOOM_BASE_URL}{end_point}"
+            if next_page_token is not True:
+                url = f"{url}&next_page_token={next_page_token}"
+                conditional_headers = None
+            response = self.get_response(url, key, category, conditional_headers)
+            if response.status_code == 304:
+                self.response_cache.touch(cache_key)
+                self.response_cache.record(is_hit=True, is_revalidated=True)
+                yield entry["pages"][0].get(key) or []
+                return
+            if not pages:
+                validators = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            page = json.loads(response.text)
+            pages.append(page)
+            yield page.get(key) or []
+            next_page_token = page.get("next_page_token") if is_paginated else None
+        self.response_cache.record(is_hit=False)
+        self.response_cache.put(cache_key, pages, *validators)
+
+    def log_statistics(self):
+        """Logs the number of Zoom calls saved by sharing responses and the counters of the response cache
+        when it is enabled."""
+        self.logger.info(
+            f"{self.saved_calls_count} Zoom API call(s) saved by reusing responses fetched during this run."
+        )
+        if self.response_cache:
+            self.response_cache.log_statistics()
+
+    def get_prefetch_executor(self):
+        """Returns the thread pool running the prefetching of pages. The pool threads keep their
+        thread-local sessions, so prefetched requests reuse the pooled connections as well.
+        :returns prefetch_executor: ThreadPoolExecutor object.
+        """
+        with self.prefetch_executor_lock:
+            if self.prefetch_executor is None:
+                self.prefetch_executor = ThreadPoolExecutor(
+                    max_workers=self.prefetch_thread_count,
+                    thread_name_prefix="zoom_prefetch",
                 )
-            # Getting error code 400 but the zoom api documentation is suggesting error code 300
-            elif key == "privileges" and response.status_code in [300, 400]:
-                raise requests.exceptions.HTTPError(response=response)
-            elif response.status_code == 401:
-                self.ensure_token_valid()
+            return self.prefetch_executor
+
+    def prefetch_pages(self, pages, prefetch_depth):
+        """Consumes the pages generator in a background thread, buffering up to prefetch_depth pages
+        ahead of the caller. Errors raised while fetching are raised again in the caller thread.
+
+        :param pages: generator of pages of a Zoom api endpoint.
+        :param prefetch_depth: maximum number of pages waiting to be consumed.
+        :yields page: list of dictionary containing the records of one page.
+        """
+        prefetched_pages = queue.Queue(maxsize=prefetch_depth)
+        stop_event = threading.Event()
+
+        def put(item):
+            while not stop_event.is_set():
+                try:
+                    prefetched_pages.put(item, timeout=PREFETCH_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def prefetch():
+            try:
+                for page in pages:
+                    if not put((page, None)):
+                        return
+            except Exception as exception:
+                put((None, exception))
+                return
+            put((PREFETCH_END, None))
+
+        self.get_prefetch_executor().submit(prefetch)
+        try:
+            while True:
+                page, exception = prefetched_pages.get()
+                if exception is not None:
+                    raise exception
+                if page is PREFETCH_END:
+                    return
+                yield page
+        finally:
+            stop_event.set()
+
+    def iter_items(self, end_point, key, is_paginated=True):
+        """Yields the records of a Zoom api endpoint one by one.
+
+        :param end_point: endpoint url with query parameters
+        :param key: Response json key to parse on successful get call
+        :param is_paginated: boolean to follow the next_page_token of the responses.
+        :yields item: dictionary containing one record of the endpoint.
+        """
+        for page in self.iter_pages(end_point, key, is_paginated):
+            yield from page
+
+    def get(self, end_point, key, is_paginated=False):
+        """Makes get call to Zoom api endpoint. Concurrent calls to the same endpoint share one in-flight
+        request. The successful responses of the account wide endpoints matching MEMOIZED_END_POINTS, which
+        are requested by many tasks, are also kept for the lifetime of the command.
+
+        :param end_point: endpoint url with query parameters
+        :param key: Response json key to parse on successful get call
+        :returns api_response: list of dictionary containing response from endpoint.
+        """
+        request_key = (end_point, key, is_paginated)
+        is_memoized = bool(MEMOIZED_END_POINTS.match(end_point))
+        with self.single_flight_lock:
+            call = self.single_flight_calls.get(request_key)
+            is_leader = call is None
+            if is_leader:
+                call = self.single_flight_calls[request_key] = {"future": Future(), "waiters": 0}
             else:
-                response.raise_for_status()
-        return api_response
+                call["waiters"] += 1
+                self.saved_calls_count += 1
+        if not is_leader:
+            # Every caller gets its own copy, as the callers update the returned records.
+            return copy.deepcopy(call["future"].result())
+        try:
+            api_response = self.fetch(end_point, key, is_paginated)
+        except BaseException as exception:
+            # Errors are not memoized, only the calls already waiting for this request receive them.
+            with self.single_flight_lock:
+                del self.single_flight_calls[request_key]
+            call["future"].set_exception(exception)
+            raise
+        with self.single_flight_lock:
+            if not is_memoized:
+                del self.single_flight_calls[request_key]
+            is_shared = is_memoized or call["waiters"]
+        call["future"].set_result(api_response)
+        return copy.deepcopy(api_response) if is_shared else api_response
+
+    def fetch(self, end_point, key, is_paginated=False):
+        """Makes get call to Zoom api endpoint without sharing the response with other callers.
+
+        :param end_point: endpoint url with query parameters
+        :param key: Response json key to parse on successful get call
+        :returns api_response: list of dictionary containing response from endpoint.
+        """
+        if key == "past_meetings":
+            self.ensure_token_valid()
+            return self.get_page(
+                f"{ZOOM_BASE_URL}{end_point}", key, get_endpoint_category(end_point)
+            )
+        return list(self.iter_items(end_point, key, is_paginated))
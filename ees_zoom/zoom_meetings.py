@@ -11,6 +11,13 @@ import threading
 
 from .constant import MEETINGS, RFC_3339_DATETIME_FORMAT
 
+MEETING_TYPE_ENUM_TO_NAME_MAPPING = {
+    "1": "An instant meeting",
+    "2": "A scheduled meeting",
+    "3": "A recurring meeting with no fixed time",
+    "8": "A recurring meeting with fixed time",
+}
+
 
 class ZoomMeetings:
     """Class is responsible to fetch all meetings and create documents for each.
@@ -46,6 +53,21 @@ class ZoomMeetings:
                 f"Unknown error occurred while fetching meetings from Zoom: {exception}"
             )
             raise exception
+        return self.filter_meetings_from_user_id(
+            user_id, meetings_for_user, start_time, end_time
+        )
+
+    def filter_meetings_from_user_id(
+        self, user_id, meetings_for_user, start_time, end_time
+    ):
+        """Method will add all the fetched meetings of the user in class object for fetching past-meetings
+        and will return those meetings which falls in between start_time and end_time.
+        :param user_id: string of the user ID.
+        :param meetings_for_user: list of meetings fetched from Zoom for user_id.
+        :param start_time: datetime object for lower limit for data fetching.
+        :param end_time: datetime object for upper limit for data fetching.
+        :returns: List of valid meetings for user_id.
+        """
         self.meetings_past_meetings_list.extend(meetings_for_user)
         meetings_list = []
         for meeting in meetings_for_user:
@@ -54,9 +76,9 @@ class ZoomMeetings:
             )
             if meeting_date >= start_time and meeting_date <= end_time:
                 meetings_list.append(meeting)
-        self.logger.info(
-            f"Thread: [{threading.get_ident()}] Fetched total : {len(meetings_list)} "
-            f"number(s) of meetings for {user_id}."
+        self.logger.debug(
+            f"Thread: [{threading.get_ident()}] Fetched : {len(meetings_list)} "
+            f"number(s) of meetings in the time range for {user_id}."
         )
         return meetings_list
 
@@ -79,46 +101,68 @@ class ZoomMeetings:
         :param enable_permission: boolean to check if permission sync is enabled or not.
         :returns: dictionary containing type of data along with the data.
         """
+        meetings_documents = []
+        for meetings_documents_page in self.iter_meetings_details_documents(
+            users_data,
+            meetings_schema,
+            start_time,
+            end_time,
+            is_meetings_in_objects,
+            enable_permission,
+        ):
+            meetings_documents.extend(meetings_documents_page)
+        return {"type": MEETINGS, "data": meetings_documents}
+
+    def iter_meetings_details_documents(
+        self,
+        users_data,
+        meetings_schema,
+        start_time,
+        end_time,
+        is_meetings_in_objects,
+        enable_permission,
+        document_builder=None,
+    ):
+        """This method will iterate over list of users and will yield the meetings documents of each
+        page fetched from Zoom. All the fetched meetings are still kept in the class object for fetching
+        past-meetings.
+        :param users_data: list of dictionaries where each dictionary contains details fetched for a user from Zoom
+        :param meetings_schema: dictionary of fields to be indexed for meetings.
+        :param start_time: datetime object for lower limit for data fetching.
+        :param end_time: datetime object for upper limit for data fetching.
+        :param is_meetings_in_objects: boolean to check the status of meetings in objects.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :param document_builder: DocumentBuilder creating the documents in worker processes, None to create
+            them in the calling thread.
+        :yields: list of meetings documents generated from one page of meetings.
+        """
         try:
-            meeting_type_enum_to_name_mapping = {
-                "1": "An instant meeting",
-                "2": "A scheduled meeting",
-                "3": "A recurring meeting with no fixed time",
-                "8": "A recurring meeting with fixed time",
-            }
-            meetings_documents = []
             for user in users_data:
-                meetings_list = self.set_meetings_from_user_id(
-                    user["id"], start_time, end_time
-                )
-                if is_meetings_in_objects:
-                    count = 0
-                    for meeting in meetings_list:
-                        meeting_document = {
-                            "type": MEETINGS,
-                            "parent_id": str(user["id"]),
-                        }
-                        for ws_field, zoom_fields in meetings_schema.items():
-                            meeting_document[ws_field] = meeting[zoom_fields]
-                        meeting_document["body"] = (
-                            f"Meeting Host : {meeting['host_id']}\nMeeting Type : "
-                            f"{meeting_type_enum_to_name_mapping[str(meeting['type'])]}"
+                count = 0
+                for meetings_page in self.zoom_client.iter_pages(
+                    end_point=f"users/{user['id']}/meetings?page_size=300",
+                    key=MEETINGS,
+                ):
+                    meetings_list = self.filter_meetings_from_user_id(
+                        user["id"], meetings_page, start_time, end_time
+                    )
+                    if is_meetings_in_objects and document_builder is not None:
+                        yield document_builder.create_documents(
+                            MEETINGS, user["id"], meetings_list, meetings_schema, enable_permission
                         )
-                        meeting_document[
-                            "url"
-                        ] = f"https://zoom.us/user/{user['id']}/meeting/{meeting['id']}"
-                        if enable_permission:
-                            permission_list = ["User:Read"]
-                            permission_list.extend(
-                                self.zoom_enterprise_search_mappings.get(user["id"], [])
+                        count += len(meetings_list)
+                    elif is_meetings_in_objects:
+                        yield [
+                            self.create_meeting_document(
+                                user["id"], meeting, meetings_schema, enable_permission
                             )
-                            meeting_document["_allow_permissions"] = permission_list
-                        meetings_documents.append(meeting_document)
-                        count += 1
+                            for meeting in meetings_list
+                        ]
+                        count += len(meetings_list)
+                if is_meetings_in_objects:
                     self.logger.info(
                         f" Thread: [{threading.get_ident()}] {count} number(s) of Meetings Document generated."
                     )
-            return {"type": MEETINGS, "data": meetings_documents}
         except KeyError as key_error_exception:
             self.logger.error(
                 f"Error {key_error_exception} occurred while generating meetings documents."
@@ -129,3 +173,34 @@ class ZoomMeetings:
                 f"Error while preparing Documents for meetings: {exception}"
             )
             raise exception
+
+    def create_meeting_document(
+        self, user_id, meeting, meetings_schema, enable_permission
+    ):
+        """This method will create a document for the meeting hosted by the user ready to be indexed.
+        :param user_id: string of the user ID.
+        :param meeting: dictionary containing details fetched for a meeting from Zoom.
+        :param meetings_schema: dictionary of fields to be indexed for meetings.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :returns: dictionary of meeting document.
+        """
+        meeting_document = {
+            "type": MEETINGS,
+            "parent_id": str(user_id),
+        }
+        for ws_field, zoom_fields in meetings_schema.items():
+            meeting_document[ws_field] = meeting[zoom_fields]
+        meeting_document["body"] = (
+            f"Meeting Host : {meeting['host_id']}\nMeeting Type : "
+            f"{MEETING_TYPE_ENUM_TO_NAME_MAPPING[str(meeting['type'])]}"
+        )
+        meeting_document[
+            "url"
+        ] = f"https://zoom.us/user/{user_id}/meeting/{meeting['id']}"
+        if enable_permission:
+            permission_list = ["User:Read"]
+            permission_list.extend(
+                self.zoom_enterprise_search_mappings.get(user_id, [])
+            )
+            meeting_document["_allow_permissions"] = permission_list
+        return meeting_document
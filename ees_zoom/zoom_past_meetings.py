@@ -9,10 +9,20 @@ the list and will create documents from the fetched responses.
 import datetime
 import json
 import threading
+from concurrent.futures import as_completed
 
 import requests
 
 from .constant import PAST_MEETINGS, RFC_3339_DATETIME_FORMAT
+from .zoom_meetings import MEETING_TYPE_ENUM_TO_NAME_MAPPING
+
+KEYS_TO_INDEX_FROM_PARTICIPANTS_RESPONSE = [
+    "id",
+    "name",
+    "join_time",
+    "leave_time",
+    "duration",
+]
 
 
 class ZoomPastMeetings:
@@ -24,6 +34,9 @@ class ZoomPastMeetings:
         self.zoom_client = zoom_client
         self.zoom_enterprise_search_mappings = zoom_enterprise_search_mappings
         self.retry_count = config.get_value("retry_count")
+        # Zoom API calls made by the executor threads for the meetings of this object.
+        self.executor_api_calls_count = 0
+        self.executor_api_calls_lock = threading.Lock()
 
     def get_past_meeting_details_from_meeting_id(
         self, meeting_id, start_time, end_time
@@ -54,6 +67,19 @@ class ZoomPastMeetings:
                 f"Unknown error occurred while fetching past_meetings from Zoom. : {exception}"
             )
             raise exception
+        return self.filter_past_meeting_in_time_range(
+            past_meeting_details, start_time, end_time
+        )
+
+    def filter_past_meeting_in_time_range(
+        self, past_meeting_details, start_time, end_time
+    ):
+        """Method will return the past_meeting instance if it ended in between start_time and end_time.
+        :param past_meeting_details: dictionary of past_meeting details fetched from Zoom.
+        :param start_time: datetime object for lower limit for data fetching.
+        :param end_time: datetime object for upper limit for data fetching.
+        :returns: dictionary if past_meeting falls in the time range.
+        """
         meeting_date = datetime.datetime.strptime(
             past_meeting_details["end_time"], RFC_3339_DATETIME_FORMAT
         )
@@ -89,23 +115,110 @@ class ZoomPastMeetings:
             f"Thread: [{threading.get_ident()}] Fetched total : {len(participants_for_meeting)} "
             f"number(s) of meetings participants for {past_meeting_id}."
         )
-        keys_to_index_from_participants_response = [
-            "id",
-            "name",
-            "join_time",
-            "leave_time",
-            "duration",
-        ]
+        return self.get_participants_details(participants_for_meeting)
+
+    def get_participants_details(self, participants_for_meeting):
+        """Method will keep only the participant fields which are indexed in the past_meeting body.
+        :param participants_for_meeting: list of participants fetched from Zoom for a meeting.
+        :returns: List of participants details.
+        """
         participants_details = []
         for participant in participants_for_meeting:
             participant_details = {
                 key: val
                 for key, val in participant.items()
-                if key in keys_to_index_from_participants_response
+                if key in KEYS_TO_INDEX_FROM_PARTICIPANTS_RESPONSE
             }
             participants_details.append(participant_details)
         return participants_details
 
+    def get_past_meeting_document(
+        self,
+        meeting,
+        past_meetings_schema,
+        start_time,
+        end_time,
+        enable_permission,
+    ):
+        """This Method will get the past_meeting instance of the meeting along with its participants and will
+        create a document from the returned data ready to be indexed.
+        :param meeting: dictionary containing details fetched for a meeting.
+        :param past_meetings_schema: dictionary of fields to be indexed for past_meetings.
+        :param start_time: datetime object for lower limit for data fetching.
+        :param end_time: datetime object for upper limit for data fetching.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :returns: past_meeting document, None if the meeting has no past instance in the time range.
+        """
+        past_meeting_dictionary = self.get_past_meeting_details_from_meeting_id(
+            str(meeting["id"]), start_time, end_time
+        )
+        if not past_meeting_dictionary:
+            return None
+        participants_list = self.get_meeting_participants(meeting["id"])
+        return self.create_past_meeting_document(
+            meeting,
+            past_meeting_dictionary,
+            participants_list,
+            past_meetings_schema,
+            enable_permission,
+        )
+
+    def get_past_meeting_document_in_executor(self, meeting, *args):
+        """Gets the past_meeting document of the meeting from an executor thread, counting the Zoom API calls
+        made by the thread for the meeting in executor_api_calls_count.
+        :param meeting: dictionary containing details fetched for a meeting.
+        :param args: arguments of get_past_meeting_document following the meeting.
+        :returns: past_meeting document, None if the meeting has no past instance in the time range.
+        """
+        api_calls_count = self.zoom_client.get_thread_api_calls_count()
+        try:
+            return self.get_past_meeting_document(meeting, *args)
+        finally:
+            with self.executor_api_calls_lock:
+                self.executor_api_calls_count += self.zoom_client.get_thread_api_calls_count() - api_calls_count
+
+    def iter_past_meetings_details_documents(
+        self,
+        meetings_data,
+        past_meetings_schema,
+        start_time,
+        end_time,
+        enable_permission,
+        executor=None,
+    ):
+        """This Method will iterate over meetings list and will yield the documents of the valid past_meetings
+        in the order their calls complete. The past_meeting and participants calls of the meetings are issued
+        concurrently by the threads of the executor, or one meeting after the other without an executor.
+        :param meetings_data: list of dictionaries where each dictionary contains details fetched for
+        a meeting.
+        :param past_meetings_schema: dictionary of fields to be indexed for past_meetings.
+        :param start_time: datetime object for lower limit for data fetching.
+        :param end_time: datetime object for upper limit for data fetching.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :param executor: ThreadPoolExecutor bounding the number of meetings fetched at the same time.
+        :yields: past_meeting document.
+        """
+        args = (past_meetings_schema, start_time, end_time, enable_permission)
+        if executor is None:
+            for meeting in meetings_data:
+                past_meeting_document = self.get_past_meeting_document(meeting, *args)
+                if past_meeting_document:
+                    yield past_meeting_document
+            return
+        futures = [
+            executor.submit(self.get_past_meeting_document_in_executor, meeting, *args)
+            for meeting in meetings_data
+        ]
+        try:
+            for future in as_completed(futures):
+                past_meeting_document = future.result()
+                if past_meeting_document:
+                    yield past_meeting_document
+        finally:
+            # The calls of the remaining meetings are not needed once one of them failed.
+            for future in futures:
+                future.cancel()
+
     def get_past_meetings_details_documents(
         self,
         meetings_data,
@@ -113,6 +226,7 @@ class ZoomPastMeetings:
         start_time,
         end_time,
         enable_permission,
+        executor=None,
     ):
         """This Method will iterate over meetings list and will get all valid past_meetings
         for the meetingID. it will create a document from the returned data ready to be indexed.
@@ -122,61 +236,22 @@ class ZoomPastMeetings:
         :param start_time: datetime object for lower limit for data fetching.
         :param end_time: datetime object for upper limit for data fetching.
         :param enable_permission: boolean to check if permission sync is enabled or not.
+        :param executor: ThreadPoolExecutor bounding the number of meetings fetched at the same time.
         :returns: dictionary containing type of data along with the data.
         """
         try:
-            meeting_type_enum_to_name_mapping = {
-                "1": "An instant meeting",
-                "2": "A scheduled meeting",
-                "3": "A recurring meeting with no fixed time",
-                "8": "A recurring meeting with fixed time",
-            }
-            past_meetings_count = 0
-            past_meetings_documents = []
-            for meeting in meetings_data:
-                past_meeting_dictionary = self.get_past_meeting_details_from_meeting_id(
-                    str(meeting["id"]), start_time, end_time
+            past_meetings_documents = list(
+                self.iter_past_meetings_details_documents(
+                    meetings_data,
+                    past_meetings_schema,
+                    start_time,
+                    end_time,
+                    enable_permission,
+                    executor,
                 )
-                if past_meeting_dictionary:
-                    past_meeting_document = {
-                        "type": PAST_MEETINGS,
-                        "parent_id": str(meeting["id"]),
-                    }
-                    for ws_field, zoom_fields in past_meetings_schema.items():
-                        past_meeting_document[ws_field] = past_meeting_dictionary[
-                            zoom_fields
-                        ]
-                    participants_list = self.get_meeting_participants(meeting["id"])
-                    if not len(participants_list):
-                        # when meeting host is the only participant we will add it manually.
-                        meeting_host_user_dictionary = {
-                            "id": past_meeting_dictionary["host_id"],
-                            "name": past_meeting_dictionary["user_name"],
-                            "join_time": past_meeting_dictionary["start_time"],
-                            "leave_time": past_meeting_dictionary["end_time"],
-                            "duration": past_meeting_dictionary["duration"],
-                        }
-                        participants_list.append(meeting_host_user_dictionary)
-                    past_meeting_document["body"] = (
-                        f"Meeting Duration:{past_meeting_dictionary['duration']}\n"
-                        f"Meeting Type:{meeting_type_enum_to_name_mapping[str(past_meeting_dictionary['type'])]}\n"
-                        f"Meeting Participants : {participants_list}"
-                    )
-                    past_meeting_document[
-                        "url"
-                    ] = f"https://zoom.us/user/{meeting['host_id']}/meeting/{past_meeting_dictionary['id']}"
-                    if enable_permission:
-                        permission_list = ["User:Read"]
-                        permission_list.extend(
-                            self.zoom_enterprise_search_mappings.get(
-                                meeting["host_id"], []
-                            )
-                        )
-                        past_meeting_document["_allow_permissions"] = permission_list
-                    past_meetings_documents.append(past_meeting_document)
-                    past_meetings_count += 1
+            )
             self.logger.info(
-                f"Thread: [{threading.get_ident()}] {past_meetings_count} number(s) of "
+                f"Thread: [{threading.get_ident()}] {len(past_meetings_documents)} number(s) of "
                 f"Past_Meetings documents generated."
             )
             return {"type": PAST_MEETINGS, "data": past_meetings_documents}
@@ -190,3 +265,51 @@ class ZoomPastMeetings:
                 f"Error occurred while preparing Documents for past_meetings: {exception}"
             )
             raise exception
+
+    def create_past_meeting_document(
+        self,
+        meeting,
+        past_meeting_dictionary,
+        participants_list,
+        past_meetings_schema,
+        enable_permission,
+    ):
+        """This method will create a document for the past_meeting instance of the meeting ready to be indexed.
+        :param meeting: dictionary containing details fetched for a meeting.
+        :param past_meeting_dictionary: dictionary of past_meeting details fetched for the meeting.
+        :param participants_list: list of participants details who attended the meeting.
+        :param past_meetings_schema: dictionary of fields to be indexed for past_meetings.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :returns: dictionary of past_meeting document.
+        """
+        past_meeting_document = {
+            "type": PAST_MEETINGS,
+            "parent_id": str(meeting["id"]),
+        }
+        for ws_field, zoom_fields in past_meetings_schema.items():
+            past_meeting_document[ws_field] = past_meeting_dictionary[zoom_fields]
+        if not len(participants_list):
+            # when meeting host is the only participant we will add it manually.
+            meeting_host_user_dictionary = {
+                "id": past_meeting_dictionary["host_id"],
+                "name": past_meeting_dictionary["user_name"],
+                "join_time": past_meeting_dictionary["start_time"],
+                "leave_time": past_meeting_dictionary["end_time"],
+                "duration": past_meeting_dictionary["duration"],
+            }
+            participants_list.append(meeting_host_user_dictionary)
+        past_meeting_document["body"] = (
+            f"Meeting Duration:{past_meeting_dictionary['duration']}\n"
+            f"Meeting Type:{MEETING_TYPE_ENUM_TO_NAME_MAPPING[str(past_meeting_dictionary['type'])]}\n"
+            f"Meeting Participants : {participants_list}"
+        )
+        past_meeting_document[
+            "url"
+        ] = f"https://zoom.us/user/{meeting['host_id']}/meeting/{past_meeting_dictionary['id']}"
+        if enable_permission:
+            permission_list = ["User:Read"]
+            permission_list.extend(
+                self.zoom_enterprise_search_mappings.get(meeting["host_id"], [])
+            )
+            past_meeting_document["_allow_permissions"] = permission_list
+        return past_meeting_document
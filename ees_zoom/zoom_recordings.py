@@ -11,6 +11,16 @@ import threading
 from .constant import MEETINGS, RFC_3339_DATETIME_FORMAT, RECORDINGS
 from .utils import url_encode
 
+# COMMON_PARAM will be common for all the recordings of one meeting.
+COMMON_PARAM = [
+    "host_id",
+    "topic",
+    "type",
+    "share_url",
+    "total_size",
+    "duration",
+]
+
 
 class ZoomRecordings:
     """This class is responsible for fetching recordings from Zoom and push document created for each recording
@@ -70,66 +80,66 @@ class ZoomRecordings:
         :param enable_permission: boolean to check if permission sync is enabled or not.
         :returns: dictionary containing type of data along with the data.
         """
+        recording_documents = []
+        for recording_documents_page in self.iter_recordings_details_documents(
+            users_data, recordings_schema, start_time, end_time, enable_permission
+        ):
+            recording_documents.extend(recording_documents_page)
+        return {"type": RECORDINGS, "data": recording_documents}
+
+    def iter_recordings_details_documents(
+        self,
+        users_data,
+        recordings_schema,
+        start_time,
+        end_time,
+        enable_permission,
+        document_builder=None,
+    ):
+        """This method will iterate over list of users and will yield the recordings documents of each
+        page fetched from Zoom, so only one page of recordings is held in memory at a time.
+        :param users_data: list of dictionaries where each dictionary contains details fetched for a user from Zoom.
+        :param recordings_schema: dictionary of fields to be indexed for meetings.
+        :param start_time: datetime object for lower limit for data fetching.
+        :param end_time: datetime object for upper limit for data fetching.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :param document_builder: DocumentBuilder creating the documents in worker processes, None to create
+            them in the calling thread.
+        :yields: list of recordings documents generated from one page of recordings.
+        """
         try:
-            recording_documents = []
-            # common_param will be common for all the recordings of one meeting.
-            common_param = [
-                "host_id",
-                "topic",
-                "type",
-                "share_url",
-                "total_size",
-                "duration",
-            ]
+            count = 0
             for user in users_data:
                 self.logger.info(
                     f"Attempting to extract recordings for user {user['id']}."
                 )
-                recordings_list = self.get_recordings_from_user_id(
-                    user["id"],
-                    start_time.strftime(RFC_3339_DATETIME_FORMAT),
-                    end_time.strftime(RFC_3339_DATETIME_FORMAT),
+                url = (
+                    f"users/{user['id']}/recordings?page_size=300"
+                    f"&from={start_time.strftime(RFC_3339_DATETIME_FORMAT)}"
+                    f"&to={end_time.strftime(RFC_3339_DATETIME_FORMAT)}"
                 )
-                for meeting in recordings_list:
-                    for recording in meeting["recording_files"]:
-                        # skipping the recordings which are still in progress.
-                        # skipped recordings will be indexed in the next execution.
-                        if recording["status"] != "completed":
-                            continue
-                        recording_document = {
-                            "type": RECORDINGS,
-                            "parent_id": user["id"],
-                        }
-                        for ws_field, zoom_fields in recordings_schema.items():
-                            if (recording["file_type"].upper() == "TIMELINE") and (
-                                ws_field == "url"
-                            ):
-                                continue
-                            if zoom_fields in common_param:
-                                recording_document[ws_field] = meeting[zoom_fields]
-                                continue
-                            recording_document[ws_field] = recording[zoom_fields]
-                        recording_document["body"] = (
-                            f"File MetaData\n File Type : {recording['file_type']}"
-                            f"\n File Size : {recording['file_size']}\n Recording Type : {recording['recording_type']}"
+                for recordings_page in self.zoom_client.iter_pages(
+                    end_point=url, key=MEETINGS
+                ):
+                    if document_builder is not None:
+                        recording_documents = document_builder.create_documents(
+                            RECORDINGS, user["id"], recordings_page, recordings_schema, enable_permission
                         )
-                        url_encoded_uuid = url_encode(meeting["uuid"])
-                        recording_document[
-                            "url"
-                        ] = f"https://zoom.us/recording/management/detail?meeting_id={url_encoded_uuid}"
-                        if enable_permission:
-                            permission_list = ["Recording:Read"]
-                            permission_list.extend(
-                                self.zoom_enterprise_search_mappings.get(user["id"], [])
+                    else:
+                        recording_documents = []
+                        for meeting in recordings_page:
+                            recording_documents.extend(
+                                self.create_recordings_documents(
+                                    user["id"], meeting, recordings_schema, enable_permission
+                                )
                             )
-                            recording_document["_allow_permissions"] = permission_list
-                        recording_documents.append(recording_document)
+                    count += len(recording_documents)
+                    yield recording_documents
 
             self.logger.info(
-                f"Thread: [{threading.get_ident()}] {len(recording_documents)} number(s) of "
+                f"Thread: [{threading.get_ident()}] {count} number(s) of "
                 "Recordings documents generated."
             )
-            return {"type": RECORDINGS, "data": recording_documents}
         except KeyError as key_error_exception:
             self.logger.error(
                 f"Error {key_error_exception} occurred while generating recordings documents."
@@ -140,3 +150,49 @@ class ZoomRecordings:
                 f"Error {exception} occurred while generating recordings documents."
             )
             raise exception
+
+    def create_recordings_documents(
+        self, user_id, meeting, recordings_schema, enable_permission
+    ):
+        """This method will create documents for all the completed recording files of the meeting.
+        :param user_id: string of the user ID.
+        :param meeting: dictionary containing recorded meeting details fetched from Zoom.
+        :param recordings_schema: dictionary of fields to be indexed for recordings.
+        :param enable_permission: boolean to check if permission sync is enabled or not.
+        :returns: list of recordings documents.
+        """
+        recording_documents = []
+        for recording in meeting["recording_files"]:
+            # skipping the recordings which are still in progress.
+            # skipped recordings will be indexed in the next execution.
+            if recording["status"] != "completed":
+                continue
+            recording_document = {
+                "type": RECORDINGS,
+                "parent_id": user_id,
+            }
+            for ws_field, zoom_fields in recordings_schema.items():
+                if (recording["file_type"].upper() == "TIMELINE") and (
+                    ws_field == "url"
+                ):
+                    continue
+                if zoom_fields in COMMON_PARAM:
+                    recording_document[ws_field] = meeting[zoom_fields]
+                    continue
+                recording_document[ws_field] = recording[zoom_fields]
+            recording_document["body"] = (
+                f"File MetaData\n File Type : {recording['file_type']}"
+                f"\n File Size : {recording['file_size']}\n Recording Type : {recording['recording_type']}"
+            )
+            url_encoded_uuid = url_encode(meeting["uuid"])
+            recording_document[
+                "url"
+            ] = f"https://zoom.us/recording/management/detail?meeting_id={url_encoded_uuid}"
+            if enable_permission:
+                permission_list = ["Recording:Read"]
+                permission_list.extend(
+                    self.zoom_enterprise_search_mappings.get(user_id, [])
+                )
+                recording_document["_allow_permissions"] = permission_list
+            recording_documents.append(recording_document)
+        return recording_documents
@@ -9,6 +9,7 @@ generate documents from fetched responses.
 """
 
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from .constant import ROLES
 
@@ -126,14 +127,103 @@ class ZoomRoles:
 
     def fetch_user_ids_with_chat_access(self):
         """This method will fetch the userID of users having read access for chat messages.
-        :returns: list containing userIDs of users having read access for chat messages.
+        :returns: set containing userIDs of users having read access for chat messages.
         """
-        self.set_list_of_roles_from_zoom()
-        chat_permission_users_list = []
-        for role in self.roles_list:
-            role_permissions = self.fetch_role_permissions(role["id"])
-            role_members_ids = self.fetch_members_of_role(role["id"])
-            for role_permission in role_permissions:
-                if role_permission == CHAT_MESSAGE_READ_PERMISSION:
-                    chat_permission_users_list.extend(role_members_ids)
-        return chat_permission_users_list
+        return RoleIndex(self, self.logger).get_users_with_privilege(CHAT_MESSAGE_READ_PERMISSION)
+
+
+class RoleIndex:
+    """This class resolves the privileges and the members of all the roles available in Zoom at once,
+    fetching the roles concurrently, and indexes them by user and by privilege. A command shares a single
+    index between all the objects needing the roles, so no role is fetched twice."""
+
+    def __init__(self, roles_object, logger, thread_count=1):
+        """
+        :param roles_object: ZoomRoles object used to fetch the roles from Zoom.
+        :param logger: logger instance.
+        :param thread_count: number of roles requests sent to Zoom at the same time.
+        """
+        self.roles_object = roles_object
+        self.logger = logger
+        self.thread_count = thread_count
+        self.lock = threading.Lock()
+        self.is_built = False
+        self.roles_list = []
+        self.role_privileges = {}
+        self.role_members = {}
+        self.user_roles = {}
+        self.privilege_users = {}
+
+    def build(self):
+        """Fetches the roles, their privileges and their members from Zoom, only the first time it is called."""
+        with self.lock:
+            if self.is_built:
+                return
+            self.roles_object.set_list_of_roles_from_zoom()
+            self.roles_list = list(self.roles_object.roles_list)
+            role_ids = [role["id"] for role in self.roles_list]
+            with ThreadPoolExecutor(max_workers=self.thread_count) as executor:
+                privileges_futures = [
+                    executor.submit(self.roles_object.fetch_role_permissions, role_id)
+                    for role_id in role_ids
+                ]
+                members_futures = [
+                    executor.submit(self.roles_object.fetch_members_of_role, role_id)
+                    for role_id in role_ids
+                ]
+                for role_id, privileges_future, members_future in zip(
+                    role_ids, privileges_futures, members_futures
+                ):
+                    self.add_role(role_id, privileges_future.result(), members_future.result())
+            self.is_built = True
+            self.logger.info(
+                f"Indexed {len(self.roles_list)} roles for {len(self.user_roles)} users."
+            )
+
+    def add_role(self, role_id, privileges, member_ids):
+        """Adds the privileges and the members of a role to the maps of the index.
+        :param role_id: string of the role ID.
+        :param privileges: list of the privileges of the role.
+        :param member_ids: list of the userIDs of the members of the role.
+        """
+        self.role_privileges[role_id] = privileges
+        self.role_members[role_id] = member_ids
+        for member_id in member_ids:
+            self.user_roles.setdefault(member_id, []).append(role_id)
+        for privilege in privileges:
+            self.privilege_users.setdefault(privilege, set()).update(member_ids)
+
+    def get_roles(self):
+        """Returns the roles available in Zoom.
+        :returns: list of dictionary contains roles data fetched from Zoom api.
+        """
+        self.build()
+        return self.roles_list
+
+    def get_users_roles(self):
+        """Returns the roles of every user member of at least one role.
+        :returns: dictionary of userID to the list of its role IDs.
+        """
+        self.build()
+        return self.user_roles
+
+    def get_users_with_privilege(self, privilege):
+        """Returns the users having a privilege through any of their roles.
+        :param privilege: name of the privilege, e.g. ChatMessage:Read.
+        :returns: set of userIDs.
+        """
+        self.build()
+        return self.privilege_users.get(privilege, set())
+
+    def get_user_privileges(self, user_id):
+        """Returns the privileges of all the roles of a user, in the order of the roles.
+        :param user_id: string of the user ID.
+        :returns: list of privileges without duplicates.
+        """
+        self.build()
+        privileges = []
+        for role_id in self.user_roles.get(user_id, []):
+            for privilege in self.role_privileges[role_id]:
+                if privilege not in privileges:
+                    privileges.append(privilege)
+        return privileges
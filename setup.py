@@ -28,6 +28,11 @@ install_requires = [
     "tika",
 ]
 
+# The async zoom_sync_mode fetches the Zoom objects with aiohttp.
+extras_require = {
+    "async": ["aiohttp>=3.7"],
+}
+
 description = ""
 
 with open("README.md", encoding="utf-8") as readme_file:
@@ -59,6 +64,7 @@ setup(
     zip_safe=False,
     classifiers=classifiers,
     install_requires=install_requires,
+    extras_require=extras_require,
     data_files=[("config", ["zoom_connector.yml"])],
     entry_points="""
       [console_scripts]
@@ -0,0 +1,139 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ees_zoom.async_sync_zoom import AsyncSyncZoom  # noqa
+from ees_zoom.async_zoom_client import AsyncZoomClient  # noqa
+from ees_zoom.configuration import Configuration  # noqa
+from ees_zoom.zoom_client import ZoomClient  # noqa
+
+CONFIG_FILE = os.path.join(
+    os.path.join(os.path.dirname(__file__), "config"),
+    "zoom_connector.yml",
+)
+
+
+def create_async_sync_zoom_object(objects):
+    """This function creates AsyncSyncZoom object for test.
+    :param objects: dictionary of the objects to be fetched.
+    :returns AsyncSyncZoom: Instance of AsyncSyncZoom and the mocked queue.
+    """
+    config = Configuration(file_name=CONFIG_FILE)
+    logger = logging.getLogger("unit_test_async_sync_zoom")
+    zoom_client = ZoomClient(config, logger)
+    zoom_client.access_token = "dummy"
+    zoom_client.access_token_expiration = time.time() + 4000
+    time_range = [datetime(2000, 1, 1), datetime(2100, 1, 1)]
+    queue = Mock()
+    sync_zoom = AsyncSyncZoom(
+        config,
+        logger,
+        Mock(),
+        zoom_client,
+        {object_type: time_range for object_type in objects},
+        queue,
+        {},
+    )
+    sync_zoom.configuration_objects = objects
+    return sync_zoom, queue
+
+
+def test_perform_async_sync_fetches_channels_and_deduplicates_chats():
+    """Test that perform_async_sync fetches objects of every user and skips chats already fetched for another user."""
+    sync_zoom, queue = create_async_sync_zoom_object(
+        {"channels": None, "chats": None}
+    )
+    sync_zoom.all_chat_access = {"dummy_user_1", "dummy_user_2"}
+
+    async def mock_get(self, end_point, key, is_paginated=False):
+        user_id = end_point.split("/")[2]
+        if key == "channels":
+            return [{"id": f"channel_{user_id}", "name": "dummy_channel", "channel_settings": {}}]
+        return [
+            {
+                "id": "shared_chat",
+                "message": "dummy_message",
+                "sender": "dummy_sender",
+                "date_time": "2022-01-01T00:00:00Z",
+            }
+        ]
+
+    with patch.object(AsyncZoomClient, "get", mock_get):
+        ids_storage = sync_zoom.perform_async_sync(
+            [{"id": "dummy_user_1"}, {"id": "dummy_user_2"}]
+        )
+
+    assert sorted(document["id"] for document in ids_storage) == [
+        "channel_dummy_user_1",
+        "channel_dummy_user_2",
+        "shared_chat",
+    ]
+    appended_documents = [
+        document
+        for call in queue.append_to_queue.call_args_list
+        for document in call[0][0]
+    ]
+    assert len(appended_documents) == 3
+
+
+def test_perform_async_sync_continues_on_object_error():
+    """Test that an error while fetching an object of one user does not stop the others."""
+    sync_zoom, queue = create_async_sync_zoom_object({"channels": None})
+
+    async def mock_get(self, end_point, key, is_paginated=False):
+        user_id = end_point.split("/")[2]
+        if user_id == "dummy_user_1":
+            raise ValueError("dummy error")
+        return [{"id": f"channel_{user_id}", "name": "dummy_channel", "channel_settings": {}}]
+
+    with patch.object(AsyncZoomClient, "get", mock_get):
+        ids_storage = sync_zoom.perform_async_sync(
+            [{"id": "dummy_user_1"}, {"id": "dummy_user_2"}]
+        )
+
+    assert [document["id"] for document in ids_storage] == ["channel_dummy_user_2"]
+
+
+def test_perform_async_sync_does_not_block_event_loop_on_full_queue():
+    """Test that the requests in flight progress while appending documents to a full queue."""
+    sync_zoom, queue = create_async_sync_zoom_object({"channels": None})
+    second_user_fetched = threading.Event()
+    is_queue_released = []
+
+    def append_to_queue(documents):
+        # A full queue blocks until the documents of the other user are fetched.
+        if documents[0]["id"] == "channel_dummy_user_1":
+            is_queue_released.append(second_user_fetched.wait(timeout=2))
+
+    queue.append_to_queue.side_effect = append_to_queue
+
+    async def mock_get(self, end_point, key, is_paginated=False):
+        user_id = end_point.split("/")[2]
+        if user_id == "dummy_user_2":
+            await asyncio.sleep(0.1)
+            second_user_fetched.set()
+        return [{"id": f"channel_{user_id}", "name": "dummy_channel", "channel_settings": {}}]
+
+    with patch.object(AsyncZoomClient, "get", mock_get):
+        ids_storage = sync_zoom.perform_async_sync(
+            [{"id": "dummy_user_1"}, {"id": "dummy_user_2"}]
+        )
+
+    assert is_queue_released == [True]
+    assert len(ids_storage) == 2
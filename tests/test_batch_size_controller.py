@@ -0,0 +1,61 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import logging
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ees_zoom.batch_size_controller import MIN_BATCH_SIZE, BatchSizeController  # noqa
+from ees_zoom.constant import BATCH_SIZE  # noqa
+
+
+def create_batch_size_controller():
+    """Creates a BatchSizeController targeting requests of 10 seconds."""
+    return BatchSizeController(logging.getLogger("unit_test_batch_size_controller"), 10)
+
+
+def test_batch_size_is_halved_on_server_errors():
+    """Test that the batch size of a document type is halved down to the minimum when requests are retried"""
+    batch_size_controller = create_batch_size_controller()
+    sizes = []
+    for _ in range(5):
+        size = batch_size_controller.get_batch_size("files")
+        batch_size_controller.record("files", size, 1, 1)
+        sizes.append(batch_size_controller.get_batch_size("files"))
+    assert sizes == [50, 25, 12, MIN_BATCH_SIZE, MIN_BATCH_SIZE]
+    assert batch_size_controller.get_batch_size("users") == BATCH_SIZE
+
+
+def test_batch_size_shrinks_on_slow_requests_and_grows_back():
+    """Test that slow requests reduce the batch size, which grows back once the requests are fast again"""
+    batch_size_controller = create_batch_size_controller()
+    batch_size_controller.record("files", BATCH_SIZE, 20, 0)
+    assert batch_size_controller.get_batch_size("files") == 75
+    for _ in range(10):
+        size = batch_size_controller.get_batch_size("files")
+        batch_size_controller.record("files", size, 0.5, 0)
+    assert batch_size_controller.get_batch_size("files") == BATCH_SIZE
+
+
+def test_batch_size_follows_the_throughput():
+    """Test that the batch size stays at the maximum while the throughput holds, and moves towards the batch
+    size giving the highest throughput when it drops"""
+    batch_size_controller = create_batch_size_controller()
+    for _ in range(5):
+        batch_size_controller.record("meetings", BATCH_SIZE, 1, 0)
+    assert batch_size_controller.get_batch_size("meetings") == BATCH_SIZE
+
+    def get_seconds(size):
+        # The throughput is the highest with batches of 50 documents.
+        return 0.1 + size / 100 + max(0, size - 50) / 20
+
+    sizes = []
+    for _ in range(60):
+        size = batch_size_controller.get_batch_size("meetings")
+        batch_size_controller.record("meetings", size, get_seconds(size), 0)
+        sizes.append(batch_size_controller.get_batch_size("meetings"))
+    assert all(30 <= size <= 70 for size in sizes[-30:])
@@ -7,6 +7,10 @@
 import logging
 import os
 import sys
+import threading
+from queue import Empty, Full
+
+import pytest
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from ees_zoom.configuration import Configuration  # noqa
@@ -58,3 +62,40 @@ def test_put_checkpoint():
     message = queue.get()
     queue.get()
     assert message == expected_message
+
+
+def test_append_to_queue_blocks_producer_when_queue_is_full():
+    """Tests that a producer waits for the consumer once the maximum number of documents is queued"""
+    logger = logging.getLogger("unit_test_connector_queue")
+    queue = ConnectorQueue(logger, max_documents=150)
+    queue.append_to_queue(list(range(100)))
+    producer = threading.Thread(target=queue.append_to_queue, args=(list(range(100)),))
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()
+    assert queue.qsize() == 1
+    assert queue.get() == {"type": "document_list", "data": list(range(100))}
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    assert queue.qsize() == 1
+
+
+def test_put_raises_full_when_bytes_limit_reached():
+    """Tests that the size of the queued documents bounds the queue while checkpoints are still accepted"""
+    logger = logging.getLogger("unit_test_connector_queue")
+    queue = ConnectorQueue(logger, max_bytes=1000)
+    queue.append_to_queue(["x" * 600])
+    with pytest.raises(Full):
+        queue.put({"type": "document_list", "data": ["x" * 600]}, timeout=0.1)
+    queue.put_checkpoint("key", get_current_time(), "full")
+    queue.end_signal()
+    assert queue.qsize() == 3
+
+
+def test_get_raises_empty_when_no_message_arrives():
+    """Tests that get stops waiting after the timeout when no message is queued"""
+    logger = logging.getLogger("unit_test_connector_queue")
+    queue = ConnectorQueue(logger)
+    assert queue.empty()
+    with pytest.raises(Empty):
+        queue.get(timeout=0.1)
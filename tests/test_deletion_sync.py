@@ -111,10 +111,12 @@ def test_delete_documents(
     args.config_file = CONFIG_FILE
     deletion_sync_obj = DeletionSyncCommand(args)
     deletion_sync_obj.workplace_search_client.delete_documents = Mock()
+    deletion_sync_obj.fingerprint_storage = Mock()
     deletion_sync_obj.zoom_client.ensure_token_valid()
 
     # Execute and assert
     assert deletion_sync_obj.delete_documents(deleted_ids, storage_with_collection) == updated_storage_with_collection
+    deletion_sync_obj.fingerprint_storage.remove.assert_called_once_with(deleted_ids)
 
 
 @pytest.mark.parametrize(
@@ -295,6 +297,45 @@ def test_collect_deleted_roles_ids_negative(
     assert [] == deletion_sync_obj.global_deletion_ids
 
 
+def test_collect_deleted_roles_ids_does_not_read_response_cache(requests_mock, tmp_path):
+    """Test that deletion_sync_command deletes a role deleted from Zoom while the response cache still holds it.
+    :param requests_mock: fixture for requests.get calls.
+    :param tmp_path: directory in which the cache database is created.
+    """
+    # Setup
+    _, logger = settings(requests_mock)
+    args = argparse.Namespace()
+    args.config_file = CONFIG_FILE
+    deletion_sync_obj = DeletionSyncCommand(args)
+    deletion_sync_obj.config._Configuration__configurations.update(
+        {
+            "zoom_response_cache_enabled": True,
+            "zoom_response_cache_path": str(tmp_path / "response_cache.db"),
+        }
+    )
+    requests_mock.get(
+        "https://api.zoom.us/v2/roles/844424930334011",
+        json={"id": "844424930334011", "privileges": []},
+        status_code=200,
+    )
+    sync_zoom_client = ZoomClient(deletion_sync_obj.config, logger)
+    sync_zoom_client.ensure_token_valid()
+    sync_zoom_client.get(end_point="roles/844424930334011", key="privileges")
+    requests_mock.get(
+        "https://api.zoom.us/v2/roles/844424930334011",
+        json={"code": 1001, "message": "Role does not exist: 844424930334011."},
+        status_code=400,
+    )
+    deletion_sync_obj.zoom_client.ensure_token_valid()
+
+    # Execute
+    deletion_sync_obj.collect_deleted_roles_ids(["844424930334011"])
+
+    # Assert
+    assert deletion_sync_obj.zoom_client.response_cache is None
+    assert ["844424930334011"] == deletion_sync_obj.global_deletion_ids
+
+
 @pytest.mark.parametrize(
     "group_id_list, deletion_response",
     [
@@ -796,3 +837,46 @@ def test_collect_chats_and_files_ids_negative(
 
     # Assert
     assert [] == deletion.global_deletion_ids
+
+
+@patch("ees_zoom.utils.BloomFilter.add", Mock(return_value=False))
+def test_collect_chats_ids_keeps_chats_reported_fetched_by_bloom_filter(requests_mock):
+    """Test that deletion_sync_command won't delete a chat existing in Zoom when the bloom filter reports it
+    as already fetched although it was never fetched.
+    :param requests_mock: fixture for requests.get calls.
+    """
+    # Setup
+    _, _ = settings(requests_mock)
+    args = get_args("DeletionSyncCommand")
+    deletion = DeletionSyncCommand(args)
+    get_value = deletion.config.get_value
+    configurations = {
+        "objects": {"chats": None},
+        "zoom_dedup_bloom_filter_capacity": 1000,
+    }
+    deletion.config.get_value = Mock(
+        side_effect=lambda key: configurations[key] if key in configurations else get_value(key)
+    )
+    deletion.role_index = Mock(get_users_with_privilege=Mock(return_value={"dummy_user"}))
+    requests_mock.get(
+        "https://api.zoom.us/v2/chat/users/dummy_user/messages",
+        json={
+            "messages": [
+                {
+                    "id": "844424930334011",
+                    "message": "dummy_message",
+                    "sender": "dummy_sender",
+                    "date_time": "2022-01-01T00:00:00Z",
+                }
+            ],
+            "next_page_token": "",
+        },
+    )
+    deletion.zoom_client.ensure_token_valid()
+
+    # Execute
+    with patch.object(SyncZoom, "get_all_users_from_zoom", Mock(return_value=[{"id": "dummy_user"}])):
+        deletion.collect_channels_and_recordings_ids(["844424930334011", "844424930334012"])
+
+    # Assert
+    assert deletion.global_deletion_ids == ["844424930334012"]
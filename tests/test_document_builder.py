@@ -0,0 +1,53 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import logging
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ees_zoom.configuration import Configuration  # noqa
+from ees_zoom.document_builder import DocumentBuilder  # noqa
+from ees_zoom.zoom_chat_messages import ZoomChatMessages  # noqa
+from ees_zoom.zoom_meetings import ZoomMeetings  # noqa
+
+CONFIG_FILE = os.path.join(
+    os.path.join(os.path.dirname(__file__), "config"),
+    "zoom_connector.yml",
+)
+MAPPINGS = {"dummy_user_1": ["ent_dummy_user_1"]}
+
+
+def test_document_builder_creates_same_documents_as_sync_threads():
+    """Test that the documents created by the worker processes are the ones created in the calling thread."""
+    config = Configuration(file_name=CONFIG_FILE)
+    logger = logging.getLogger("unit_test_document_builder")
+    meetings = [
+        {"id": index, "topic": f"dummy_topic_{index}", "host_id": "dummy_user_1", "type": 2}
+        for index in range(3)
+    ]
+    chats = [{"id": f"dummy_chat_{index}", "message": "dummy_message"} for index in range(3)]
+    meetings_schema = {"id": "id", "title": "topic"}
+    chats_schema = {"id": "id"}
+    meetings_object = ZoomMeetings(config, logger, None, MAPPINGS)
+    chats_object = ZoomChatMessages(config, logger, None, MAPPINGS)
+    document_builder = DocumentBuilder(config, logger, MAPPINGS, 2)
+    try:
+        assert document_builder.create_documents(
+            "meetings", "dummy_user_1", meetings, meetings_schema, True
+        ) == [
+            meetings_object.create_meeting_document("dummy_user_1", meeting, meetings_schema, True)
+            for meeting in meetings
+        ]
+        assert document_builder.create_documents(
+            "chats", "dummy_user_1", chats, chats_schema, False
+        ) == [
+            chats_object.create_chat_document("dummy_user_1", chat, chats_schema, False)
+            for chat in chats
+        ]
+        assert document_builder.create_documents("chats", "dummy_user_1", [], chats_schema, False) == []
+    finally:
+        document_builder.close()
@@ -0,0 +1,83 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import logging
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ees_zoom.fingerprint_storage import (FingerprintStorage,  # noqa
+                                          get_document_fingerprint)
+from ees_zoom.sharding import Shard  # noqa
+from ees_zoom.utils import encode_document  # noqa
+
+
+def create_fingerprint_storage(tmp_path):
+    """Creates a FingerprintStorage stored in a temporary directory.
+    :param tmp_path: temporary directory of the test.
+    :returns: FingerprintStorage instance.
+    """
+    fingerprint_storage = FingerprintStorage(logging.getLogger("unit_test_fingerprint_storage"))
+    fingerprint_storage.fingerprints_path = str(tmp_path / "doc_fingerprints.json")
+    return fingerprint_storage
+
+
+def test_fingerprint_covers_all_the_fields():
+    """Tests that a change of any field of a document changes its fingerprint"""
+    document = {"id": "1", "title": "dummy", "body": "dummy", "url": "dummy", "_allow_permissions": ["role_1"]}
+    fingerprint = get_document_fingerprint(encode_document(document))
+    assert get_document_fingerprint(encode_document(dict(document))) == fingerprint
+    for field, value in [("title", "changed"), ("body", "changed"), ("_allow_permissions", ["role_2"])]:
+        assert get_document_fingerprint(encode_document(dict(document, **{field: value}))) != fingerprint
+
+
+def test_fingerprints_are_kept_between_syncs(tmp_path):
+    """Tests that the fingerprints recorded by a sync are read by the next one, deleted documents being forgotten"""
+    fingerprint_storage = create_fingerprint_storage(tmp_path)
+    assert not fingerprint_storage.is_unchanged("1", "fingerprint_1")
+    fingerprint_storage.record("1", "fingerprint_1")
+    fingerprint_storage.record(2, "fingerprint_2")
+    fingerprint_storage.save()
+
+    next_fingerprint_storage = create_fingerprint_storage(tmp_path)
+    assert next_fingerprint_storage.is_unchanged("1", "fingerprint_1")
+    assert next_fingerprint_storage.is_unchanged(2, "fingerprint_2")
+    assert not next_fingerprint_storage.is_unchanged("1", "fingerprint_3")
+    next_fingerprint_storage.remove([2])
+    next_fingerprint_storage.save()
+    assert not create_fingerprint_storage(tmp_path).is_unchanged(2, "fingerprint_2")
+
+
+def test_every_shard_has_its_own_fingerprints():
+    """Tests that the fingerprints of a sharded sync are stored per shard"""
+    logger = logging.getLogger("unit_test_fingerprint_storage")
+    assert FingerprintStorage(logger, Shard(1, 4)).fingerprints_path.endswith("doc_fingerprints.shard-1-of-4.json")
+    assert FingerprintStorage(logger).fingerprints_path.endswith("doc_fingerprints.json")
+
+
+def test_save_merges_the_changes_of_concurrent_commands(tmp_path):
+    """Tests that a sync saving its fingerprints keeps the fingerprints removed and recorded meanwhile by
+    another command"""
+    fingerprint_storage = create_fingerprint_storage(tmp_path)
+    for document_id in ["1", "2", "3"]:
+        fingerprint_storage.record(document_id, f"fingerprint_{document_id}")
+    fingerprint_storage.save()
+
+    sync_fingerprint_storage = create_fingerprint_storage(tmp_path)
+    assert sync_fingerprint_storage.is_unchanged("1", "fingerprint_1")
+    deletion_fingerprint_storage = create_fingerprint_storage(tmp_path)
+    deletion_fingerprint_storage.remove(["1", "2"])
+    deletion_fingerprint_storage.record("4", "fingerprint_4")
+    deletion_fingerprint_storage.save()
+    sync_fingerprint_storage.record("3", "fingerprint_3_changed")
+    sync_fingerprint_storage.record("5", "fingerprint_5")
+    sync_fingerprint_storage.save()
+
+    assert create_fingerprint_storage(tmp_path).load_fingerprints() == {
+        "3": "fingerprint_3_changed",
+        "4": "fingerprint_4",
+        "5": "fingerprint_5",
+    }
@@ -4,12 +4,19 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 
+import json
 import logging
 import os
+import threading
+from queue import Queue
 from unittest.mock import MagicMock, Mock, patch
 
+import pytest
+
+from ees_zoom.checkpointing import Checkpoint
 from ees_zoom.configuration import Configuration
 from ees_zoom.connector_queue import ConnectorQueue
+from ees_zoom.constant import BATCH_SIZE
 from ees_zoom.full_sync_command import FullSyncCommand
 from ees_zoom.sync_zoom import SyncZoom
 from support import get_args
@@ -56,3 +63,83 @@ def test_start_producer(mock1, mock2):
     assert queue.qsize() == total_expected_size
     queue.close()
     queue.join_thread()
+
+
+def create_full_sync_command(indexed_event):
+    """Creates a FullSyncCommand indexing documents into a mocked Enterprise Search while they are fetched.
+    :param indexed_event: event set once a document is indexed.
+    :returns: FullSyncCommand instance.
+    """
+    full = FullSyncCommand(get_args("FullSyncCommand"))
+    full.config._Configuration__configurations["enable_pipelined_sync"] = True
+
+    def index_documents(body, timeout, on_error=None):
+        indexed_event.set()
+        return {"results": [{"id": document["id"], "errors": []} for document in json.loads(body)]}
+
+    full.workplace_search_client = Mock()
+    full.workplace_search_client.index_documents = index_documents
+    full.local_storage = Mock()
+    full.fingerprint_storage = Mock(is_unchanged=Mock(return_value=False))
+    return full
+
+
+@patch.object(Checkpoint, "set_checkpoint")
+def test_execute_sync_indexes_documents_while_fetching(mock_set_checkpoint):
+    """Test that documents are indexed before the producer completes and checkpoints are stored afterwards
+    :param mock_set_checkpoint: patch for Checkpoint.set_checkpoint
+    """
+    indexed_event = threading.Event()
+    full = create_full_sync_command(indexed_event)
+
+    documents = [{"id": f"meeting_{index}"} for index in range(BATCH_SIZE)]
+
+    def start_producer(queue):
+        queue.append_to_queue(documents)
+        assert indexed_event.wait(timeout=5)
+        mock_set_checkpoint.assert_not_called()
+        queue.put_checkpoint("meetings", "2022-04-01T00:00:00Z", "full")
+        for _ in range(full.config.get_value("enterprise_search_sync_thread_count")):
+            queue.end_signal()
+        return documents
+
+    full.execute_sync(start_producer)
+    mock_set_checkpoint.assert_called_once_with(
+        current_time="2022-04-01T00:00:00Z", index_type="full", obj_type="meetings"
+    )
+    full.local_storage.store_indexed_documents_ids.assert_called_once_with(
+        documents, {document["id"] for document in documents}
+    )
+
+
+@patch.object(Checkpoint, "set_checkpoint")
+def test_execute_sync_stops_consumer_when_producer_fails(mock_set_checkpoint):
+    """Test that a failing producer stops the indexing threads and no checkpoint is stored
+    :param mock_set_checkpoint: patch for Checkpoint.set_checkpoint
+    """
+    full = create_full_sync_command(threading.Event())
+
+    def start_producer(queue):
+        queue.append_to_queue([{"id": "meeting_1"}])
+        raise ValueError("Zoom is unavailable")
+
+    with pytest.raises(ValueError):
+        full.execute_sync(start_producer)
+    mock_set_checkpoint.assert_not_called()
+    full.local_storage.store_indexed_documents_ids.assert_not_called()
+
+
+def test_create_and_execute_jobs_runs_follow_up_tasks():
+    """Test that the tasks put in the follow-up tasks by running tasks are executed by the same threads."""
+    full = FullSyncCommand(get_args("FullSyncCommand"))
+    follow_up_tasks = Queue()
+
+    def perform_task(task):
+        if task < 10:
+            follow_up_tasks.put(task * 10)
+            follow_up_tasks.put(task * 10 + 1)
+        return [task]
+
+    documents = full.create_and_execute_jobs(2, perform_task, (), [1, 2], follow_up_tasks)
+    assert sorted(documents) == [1, 2, 10, 11, 20, 21]
+    assert full.create_and_execute_jobs(2, perform_task, (), iter([]), follow_up_tasks) == []
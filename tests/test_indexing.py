@@ -4,10 +4,14 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 import argparse
+import json
 import logging
 import os
 import sys
-from unittest.mock import MagicMock, Mock
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from elastic_enterprise_search import __version__
@@ -20,9 +24,12 @@ else:
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
+from ees_zoom.batch_size_controller import BatchSizeController  # noqa
 from ees_zoom.configuration import Configuration  # noqa
 from ees_zoom.connector_queue import ConnectorQueue  # noqa
+from ees_zoom.constant import BATCH_SIZE  # noqa
 from ees_zoom.enterprise_search_wrapper import EnterpriseSearchWrapper  # noqa
+from ees_zoom.fingerprint_storage import FingerprintStorage  # noqa
 from ees_zoom.sync_enterprise_search import SyncEnterpriseSearch  # noqa
 
 CONFIG_FILE = os.path.join(
@@ -272,3 +279,282 @@ def test_index_document_positive():
     # Cleanup
     indexer_object.queue.close()
     indexer_object.queue.join_thread()
+
+
+@pytest.mark.parametrize(
+    "max_allowed_bytes, batches_sizes",
+    [
+        (10000000, [100, 100, 51]),
+        (10000, [99, 99, 53]),
+    ],
+)
+def test_perform_sync_closes_batches_at_documents_count_and_size(max_allowed_bytes, batches_sizes):
+    """Test that perform_sync indexes the documents pulled from the queue in batches bounded by the number of
+    documents and by their JSON encoded size, a duplicated document being indexed once.
+    :param max_allowed_bytes: maximum size in bytes of a batch.
+    :param batches_sizes: expected number of documents of every batch.
+    """
+    # Setup
+    indexer_object = create_enterprise_search_object()
+    indexer_object.queue = ConnectorQueue(indexer_object.logger)
+    indexer_object.index_documents = Mock()
+    indexer_object.max_allowed_bytes = max_allowed_bytes
+    # Every document is 99 bytes long once encoded, 100 bytes with its separator in the batch.
+    documents = [{"id": f"doc_{index:03d}", "body": "x" * 73} for index in range(250)]
+    indexer_object.queue.append_to_queue(documents + [documents[-1]])
+    indexer_object.queue.append_to_queue([{"id": "large", "body": "x" * 20000000}])
+    indexer_object.queue.end_signal()
+
+    # Execute
+    indexer_object.perform_sync()
+
+    # Assert
+    batches = [call[0][0] for call in indexer_object.index_documents.call_args_list]
+    assert [len(batch) for batch in batches] == batches_sizes
+    assert [document["id"] for batch in batches for document in batch] == [
+        document["id"] for document in documents
+    ] + ["large"]
+    assert batches[-1][-1] == {"id": "large", "body": None}
+    assert len(indexer_object.generated_documents_ids) == 251
+
+
+@patch("ees_zoom.utils.time.sleep", Mock())
+def test_perform_sync_sends_encoded_documents_reused_across_retries():
+    """Test that perform_sync sends the documents encoded once as the body of the request, the same body being
+    sent again when the request is retried."""
+    # Setup
+    indexer_object = create_enterprise_search_object()
+    indexer_object.queue = ConnectorQueue(indexer_object.logger)
+    documents = [{"id": f"doc_{index}", "body": "Réunion hebdomadaire"} for index in range(3)]
+    indexer_object.queue.append_to_queue(documents)
+    indexer_object.queue.end_signal()
+    if version.parse(__version__) >= version.parse("8.0"):
+        bad_gateway_error = BadGatewayError(meta=Mock(status=502), message="Connection Reset By peer", body="")
+    else:
+        bad_gateway_error = BadGatewayError(message="Connection Reset By peer")
+    client_index_documents = Mock(
+        side_effect=[
+            bad_gateway_error,
+            {"results": [{"id": document["id"], "errors": []} for document in documents]},
+        ]
+    )
+    indexer_object.workplace_search_client.workplace_search_client.index_documents = client_index_documents
+
+    # Execute
+    indexer_object.perform_sync()
+
+    # Assert
+    bodies = [call[1]["documents"] for call in client_index_documents.call_args_list]
+    assert len(bodies) == 2
+    assert bodies[0] is bodies[1]
+    assert json.loads(bodies[0]) == documents
+    assert indexer_object.total_document_indexed == 3
+
+
+def test_perform_sync_keeps_several_requests_in_flight():
+    """Test that perform_sync sends the next batches while the previous requests are pending, and records the
+    indexed and the rejected documents from the responses."""
+    # Setup
+    indexer_object = create_enterprise_search_object()
+    indexer_object.queue = ConnectorQueue(indexer_object.logger)
+    indexer_object.max_in_flight_requests = 3
+    documents = [{"id": f"doc_{index}"} for index in range(3 * BATCH_SIZE)]
+    indexer_object.queue.append_to_queue(documents)
+    indexer_object.queue.end_signal()
+    barrier = threading.Barrier(3)
+
+    def index_documents(body, timeout, on_error=None):
+        # The three requests only complete once they are all in flight.
+        barrier.wait(timeout=5)
+        return {
+            "results": [
+                {"id": document["id"], "errors": ["not indexed"] if document["id"] == "doc_0" else []}
+                for document in json.loads(body)
+            ]
+        }
+
+    indexer_object.workplace_search_client.index_documents = index_documents
+
+    # Execute
+    indexer_object.perform_sync()
+
+    # Assert
+    assert indexer_object.total_documents_found == 3 * BATCH_SIZE
+    assert indexer_object.total_document_indexed == 3 * BATCH_SIZE - 1
+    assert indexer_object.error_count == 1
+    assert indexer_object.indexed_documents_ids == {document["id"] for document in documents[1:]}
+
+
+def test_perform_sync_threads_keep_their_own_requests_in_flight():
+    """Test that the indexing threads sharing the SyncEnterpriseSearch instance each keep their requests in
+    flight and process all the responses."""
+    # Setup
+    indexer_object = create_enterprise_search_object()
+    indexer_object.queue = ConnectorQueue(indexer_object.logger)
+    indexer_object.max_in_flight_requests = 2
+    documents = [{"id": f"doc_{index}"} for index in range(20 * BATCH_SIZE)]
+    indexer_object.queue.append_to_queue(documents)
+    indexer_object.queue.end_signal()
+    indexer_object.queue.end_signal()
+
+    def index_documents(body, timeout, on_error=None):
+        time.sleep(0.01)
+        return {"results": [{"id": document["id"], "errors": []} for document in json.loads(body)]}
+
+    indexer_object.workplace_search_client.index_documents = index_documents
+
+    # Execute
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for future in [executor.submit(indexer_object.perform_sync) for _ in range(2)]:
+            future.result()
+
+    # Assert
+    assert indexer_object.indexed_documents_ids == {document["id"] for document in documents}
+
+
+def test_perform_sync_logs_documents_pending_when_indexing_fails():
+    """Test that perform_sync logs the number of documents still pending in flight when a request fails."""
+    # Setup
+    indexer_object = create_enterprise_search_object()
+    indexer_object.queue = ConnectorQueue(indexer_object.logger)
+    indexer_object.max_in_flight_requests = 3
+    indexer_object.queue.append_to_queue([{"id": f"doc_{index}"} for index in range(2 * BATCH_SIZE + 5)])
+    indexer_object.queue.end_signal()
+    barrier = threading.Barrier(3)
+    release = threading.Event()
+    indexer_object.logger = Mock()
+    indexer_object.logger.error.side_effect = lambda message: release.set()
+
+    def index_documents(body, timeout, on_error=None):
+        # The three requests are in flight when the first one fails, the two others stay pending.
+        barrier.wait(timeout=5)
+        if json.loads(body)[0]["id"] == "doc_0":
+            raise ValueError("indexing failed")
+        release.wait(timeout=5)
+        return {"results": [{"id": document["id"], "errors": []} for document in json.loads(body)]}
+
+    indexer_object.workplace_search_client.index_documents = index_documents
+
+    # Execute
+    with pytest.raises(ValueError):
+        indexer_object.perform_sync()
+
+    # Assert
+    assert f"{BATCH_SIZE + 5} documents pending" in indexer_object.logger.error.call_args.args[0]
+
+
+@patch("ees_zoom.utils.time.sleep", Mock())
+def test_perform_sync_adapts_batch_size_of_each_document_type():
+    """Test that perform_sync batches every document type separately, a request retried for a server error
+    halving the batch size of its document type."""
+    # Setup
+    indexer_object = create_enterprise_search_object()
+    indexer_object.queue = ConnectorQueue(indexer_object.logger)
+    indexer_object.batch_size_controller = BatchSizeController(indexer_object.logger, 10)
+    files = [{"id": f"file_{index}", "type": "files"} for index in range(BATCH_SIZE)]
+    users = [{"id": f"user_{index}", "type": "users"} for index in range(10)]
+    indexer_object.queue.append_to_queue(users[:5] + files + users[5:])
+    indexer_object.queue.append_to_queue(files[:60])
+    indexer_object.queue.end_signal()
+    if version.parse(__version__) >= version.parse("8.0"):
+        bad_gateway_error = BadGatewayError(meta=Mock(status=502), message="Connection Reset By peer", body="")
+    else:
+        bad_gateway_error = BadGatewayError(message="Connection Reset By peer")
+    bodies = []
+
+    def index_documents(content_source_id, documents, request_timeout):
+        bodies.append(json.loads(documents))
+        if len(bodies) == 1:
+            raise bad_gateway_error
+        return {"results": [{"id": document["id"], "errors": []} for document in bodies[-1]]}
+
+    indexer_object.workplace_search_client.workplace_search_client.index_documents = index_documents
+
+    # Execute
+    indexer_object.perform_sync()
+
+    # Assert
+    assert [[document["type"] for document in body] for body in bodies] == [
+        ["files"] * BATCH_SIZE,
+        ["files"] * BATCH_SIZE,
+        ["files"] * (BATCH_SIZE // 2),
+        ["users"] * 10,
+        ["files"] * 10,
+    ]
+    assert indexer_object.batch_size_controller.get_batch_size("users") == BATCH_SIZE
+    assert len(indexer_object.indexed_documents_ids) == BATCH_SIZE + 10
+
+
+def test_perform_sync_skips_unchanged_documents(tmp_path):
+    """Test that perform_sync only sends the documents which changed since the previous sync, the unchanged
+    documents counting as indexed.
+    :param tmp_path: temporary directory of the test.
+    """
+    documents = [{"id": f"doc_{index}", "body": "dummy"} for index in range(10)]
+    changed_documents = [dict(document, body="changed") for document in documents[:3]]
+    sent_documents = []
+    for sync_documents in [documents, changed_documents + documents[3:]]:
+        # Setup
+        indexer_object = create_enterprise_search_object()
+        fingerprint_storage = FingerprintStorage(indexer_object.logger)
+        fingerprint_storage.fingerprints_path = str(tmp_path / "doc_fingerprints.json")
+        indexer_object.fingerprint_storage = fingerprint_storage
+        indexer_object.queue = ConnectorQueue(indexer_object.logger)
+        indexer_object.queue.append_to_queue(sync_documents)
+        indexer_object.queue.end_signal()
+
+        def index_documents(body, timeout, on_error=None):
+            sent_documents.append(json.loads(body))
+            return {"results": [{"id": document["id"], "errors": []} for document in sent_documents[-1]]}
+
+        indexer_object.workplace_search_client.index_documents = index_documents
+
+        # Execute
+        indexer_object.perform_sync()
+        fingerprint_storage.save()
+
+    # Assert
+    assert sent_documents == [documents, changed_documents]
+    assert indexer_object.skipped_documents_count == 7
+    assert indexer_object.indexed_documents_ids == {document["id"] for document in documents}
+
+
+def test_perform_sync_does_not_record_rejected_documents(tmp_path):
+    """Test that the fingerprint of a document rejected by Enterprise Search is not recorded, so the next sync
+    sends it again.
+    :param tmp_path: temporary directory of the test.
+    """
+    documents = [{"id": f"doc_{index}", "body": "dummy"} for index in range(3)]
+    sent_documents = []
+    stored_fingerprints = []
+    for rejected_id in ["doc_1", None]:
+        # Setup
+        indexer_object = create_enterprise_search_object()
+        fingerprint_storage = FingerprintStorage(indexer_object.logger)
+        fingerprint_storage.fingerprints_path = str(tmp_path / "doc_fingerprints.json")
+        indexer_object.fingerprint_storage = fingerprint_storage
+        indexer_object.queue = ConnectorQueue(indexer_object.logger)
+        indexer_object.queue.append_to_queue(documents)
+        indexer_object.queue.end_signal()
+
+        def index_documents(body, timeout, on_error=None):
+            sent_documents.append([document["id"] for document in json.loads(body)])
+            return {
+                "results": [
+                    {"id": document_id, "errors": ["dummy error"] if document_id == rejected_id else []}
+                    for document_id in sent_documents[-1]
+                ]
+            }
+
+        indexer_object.workplace_search_client.index_documents = index_documents
+
+        # Execute
+        indexer_object.perform_sync()
+        fingerprint_storage.save()
+        assert indexer_object.sent_fingerprints == {}
+        with open(tmp_path / "doc_fingerprints.json", encoding="utf-8") as fingerprints_file:
+            stored_fingerprints.append(sorted(json.load(fingerprints_file)))
+
+    # Assert
+    assert sent_documents == [["doc_0", "doc_1", "doc_2"], ["doc_1"]]
+    assert stored_fingerprints == [["doc_0", "doc_2"], ["doc_0", "doc_1", "doc_2"]]
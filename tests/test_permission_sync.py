@@ -117,3 +117,19 @@ def test_set_permissions_list(
 
         # Assert
         mock.permission_sync.workplace_add_permission.assert_called()
+
+
+def test_set_permissions_list_adds_privileges_of_user_roles():
+    """Tests that every enterprise search user gets the privileges of the roles of its Zoom user."""
+    permission_sync = PermissionSyncCommand(get_args("PermissionSyncCommand"))
+    permission_sync.role_index.is_built = True
+    permission_sync.role_index.add_role("role_1", ["Role:Read", "User:Read"], ["zoom_user_id"])
+    permission_sync.role_index.add_role("role_2", ["User:Read", "ChatMessage:Read"], ["zoom_user_id"])
+    permission_sync.workplace_search_client.add_permissions = Mock()
+    permission_sync.set_permissions_list(
+        {"zoom_user_id": ["ent_user_1", "ent_user_2"], "zoom_user_without_role": ["ent_user_3"]}
+    )
+    assert permission_sync.workplace_search_client.add_permissions.call_args_list == [
+        unittest.mock.call("ent_user_1", ["Role:Read", "User:Read", "ChatMessage:Read", "ent_user_1"]),
+        unittest.mock.call("ent_user_2", ["Role:Read", "User:Read", "ChatMessage:Read", "ent_user_2"]),
+    ]
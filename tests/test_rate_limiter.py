@@ -0,0 +1,92 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import logging
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ees_zoom.configuration import Configuration  # noqa
+from ees_zoom.rate_limiter import (HEAVY, LIGHT, MEDIUM, TokenBucket,  # noqa
+                                   get_endpoint_category, parse_retry_after)
+from ees_zoom.zoom_client import ZOOM_BASE_URL, ZoomClient  # noqa
+
+CONFIG_FILE = os.path.join(
+    os.path.join(os.path.dirname(__file__), "config"),
+    "zoom_connector.yml",
+)
+
+
+def create_zoom_client_object():
+    """This function creates ZoomClient object with a valid access token for test.
+    :returns ZoomClient: Instance of ZoomClient.
+    """
+    config = Configuration(file_name=CONFIG_FILE)
+    logger = logging.getLogger("unit_test_rate_limiter")
+    zoom_client = ZoomClient(config, logger)
+    zoom_client.access_token = "dummy"
+    zoom_client.access_token_expiration = time.time() + 4000
+    zoom_client.ensure_token_valid = lambda: None
+    return zoom_client
+
+
+@pytest.mark.parametrize(
+    "end_point, category",
+    [
+        ("report/meetings/dummy_id/participants?page_size=300", HEAVY),
+        ("past_meetings/dummy_id", LIGHT),
+        ("roles/dummy_id", LIGHT),
+        ("roles/dummy_id/members?page_size=300", MEDIUM),
+        ("chat/users/dummy_id/messages?page_size=300", MEDIUM),
+        ("users?page_size=300", MEDIUM),
+    ],
+)
+def test_get_endpoint_category(end_point, category):
+    """Test that the endpoints used by the connector are mapped to their Zoom rate limit category."""
+    assert get_endpoint_category(end_point) == category
+
+
+def test_parse_retry_after():
+    """Test parsing of Retry-After values sent for per second and daily limits."""
+    assert parse_retry_after("2") == 2
+    assert parse_retry_after("2022-01-01T00:01:00Z", now=1640995200) == 60
+    assert parse_retry_after("") is None
+    assert parse_retry_after("invalid") is None
+
+
+def test_token_bucket_spaces_requests_over_the_rate():
+    """Test that the token bucket hands out its capacity immediately and spaces the following requests."""
+    bucket = TokenBucket(rate=10)
+    waits = [bucket.reserve() for _ in range(12)]
+    assert all(wait == 0 for wait in waits[:10])
+    assert waits[10] == pytest.approx(0.1, abs=0.01)
+    assert waits[11] == pytest.approx(0.2, abs=0.01)
+
+
+def test_get_retries_after_too_many_requests(requests_mock):
+    """Test that ZoomClient.get waits for Retry-After and requests the same page again on status 429."""
+    zoom_client = create_zoom_client_object()
+    requests_mock.get(
+        f"{ZOOM_BASE_URL}users?page_size=300",
+        [
+            {"status_code": 429, "headers": {"Retry-After": "0.2"}, "json": {}},
+            {
+                "status_code": 200,
+                "headers": {"X-RateLimit-Limit": "40", "X-RateLimit-Remaining": "39"},
+                "json": {"users": [{"id": "dummy_user"}], "next_page_token": ""},
+            },
+        ],
+    )
+    start = time.monotonic()
+    response = zoom_client.get("users?page_size=300", "users", is_paginated=True)
+    assert response == [{"id": "dummy_user"}]
+    assert time.monotonic() - start >= 0.2
+    assert requests_mock.call_count == 2
+    assert zoom_client.rate_limiter.throttled_requests_count == 1
+    assert zoom_client.rate_limiter.buckets[MEDIUM].rate == 40
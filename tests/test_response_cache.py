@@ -0,0 +1,130 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import logging
+import os
+import sys
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ees_zoom.configuration import Configuration  # noqa
+from ees_zoom.response_cache import ResponseCache  # noqa
+from ees_zoom.zoom_client import ZOOM_BASE_URL, ZoomClient  # noqa
+
+CONFIG_FILE = os.path.join(
+    os.path.join(os.path.dirname(__file__), "config"),
+    "zoom_connector.yml",
+)
+
+
+def settings(tmp_path, **cache_settings):
+    """This function loads configuration from the file with the response cache enabled.
+    :param tmp_path: directory in which the cache database is created.
+    :param cache_settings: response cache settings overriding the configuration file.
+    :returns configuration: Configuration instance
+    :returns logger: Logger instance
+    """
+    configuration = Configuration(file_name=CONFIG_FILE)
+    settings = {
+        "zoom_response_cache_enabled": True,
+        "zoom_response_cache_path": str(tmp_path / "response_cache.db"),
+    }
+    settings.update(cache_settings)
+    get_value = configuration.get_value
+    configuration.get_value = lambda key: settings[key] if key in settings else get_value(key)
+    logger = logging.getLogger("unit_test_response_cache")
+    return configuration, logger
+
+
+def create_zoom_client_object(config, logger):
+    """This function creates ZoomClient object with a valid access token for test.
+    :returns ZoomClient: Instance of ZoomClient.
+    """
+    zoom_client = ZoomClient(config, logger)
+    zoom_client.access_token = "dummy"
+    zoom_client.access_token_expiration = time.time() + 4000
+    zoom_client.ensure_token_valid = Mock()
+    return zoom_client
+
+
+def test_fresh_response_is_shared_across_clients(tmp_path, requests_mock):
+    """Test that a response cached by one command is served to the next one without calling Zoom."""
+    config, logger = settings(tmp_path)
+    requests_mock.get(
+        f"{ZOOM_BASE_URL}users?page_size=300",
+        json={"users": [{"id": "user_1"}], "next_page_token": "token"},
+    )
+    requests_mock.get(
+        f"{ZOOM_BASE_URL}users?page_size=300&next_page_token=token",
+        json={"users": [{"id": "user_2"}], "next_page_token": ""},
+    )
+    first_client = create_zoom_client_object(config, logger)
+    assert first_client.get("users?page_size=300", "users", is_paginated=True) == [
+        {"id": "user_1"},
+        {"id": "user_2"},
+    ]
+    second_client = create_zoom_client_object(config, logger)
+    assert second_client.get("users?page_size=300", "users", is_paginated=True) == [
+        {"id": "user_1"},
+        {"id": "user_2"},
+    ]
+    assert requests_mock.call_count == 2
+    assert first_client.response_cache.misses == 1
+    assert second_client.response_cache.hits == 1
+
+
+def test_stale_response_is_revalidated_with_etag(tmp_path, requests_mock):
+    """Test that an expired single page response is revalidated with If-None-Match and reused on 304."""
+    config, logger = settings(tmp_path)
+    url = f"{ZOOM_BASE_URL}roles"
+    requests_mock.get(
+        url,
+        [
+            {"json": {"roles": [{"id": "role_1"}]}, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+        ],
+    )
+    first_client = create_zoom_client_object(config, logger)
+    first_client.response_cache.ttls["roles"] = 0.1
+    assert first_client.get("roles", "roles") == [{"id": "role_1"}]
+    time.sleep(0.2)
+    second_client = create_zoom_client_object(config, logger)
+    second_client.response_cache.ttls["roles"] = 0.1
+    assert second_client.get("roles", "roles") == [{"id": "role_1"}]
+    assert requests_mock.request_history[1].headers["If-None-Match"] == '"v1"'
+    assert second_client.response_cache.revalidations == 1
+
+
+def test_errors_are_not_cached(tmp_path, requests_mock):
+    """Test that a failed call is not stored in the cache."""
+    config, logger = settings(tmp_path)
+    requests_mock.get(
+        f"{ZOOM_BASE_URL}groups",
+        [{"status_code": 500}, {"json": {"groups": [{"id": "group_1"}]}}],
+    )
+    zoom_client = create_zoom_client_object(config, logger)
+    with pytest.raises(requests.exceptions.HTTPError):
+        zoom_client.get("groups", "groups")
+    assert zoom_client.get("groups", "groups") == [{"id": "group_1"}]
+    assert zoom_client.response_cache.misses == 1
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path):
+    """Test that the least recently used responses are evicted once the cache exceeds its size."""
+    config, logger = settings(tmp_path, zoom_response_cache_max_size_mb=1)
+    response_cache = ResponseCache(config, logger)
+    page = [{"users": ["x" * 400 * 1024]}]
+    response_cache.put("first", page)
+    response_cache.put("second", page)
+    response_cache.get("first")
+    response_cache.put("third", page)
+    assert response_cache.get("second") is None
+    assert response_cache.get("first") is not None
+    assert response_cache.get("third") is not None
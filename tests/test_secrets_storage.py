@@ -7,12 +7,15 @@
 import json
 import logging
 import os
+import subprocess
 import sys
 import time
 
+import pytest
+
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from ees_zoom.configuration import Configuration  # noqa
-from ees_zoom.secrets_storage import SecretsStorage  # noqa
+from ees_zoom.secrets_storage import SECRETS_LOCK_PATH, SecretsStorage, fcntl  # noqa
 
 SECRETS_JSON_PATH = os.path.join(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..")),
@@ -93,3 +96,34 @@ def test_get_secrets_from_json_file():
     with open(SECRETS_JSON_PATH, encoding="UTF-8") as secrets_store:
         secrets_data = json.load(secrets_store)
     assert secrets_data == secrets_storage_data
+
+
+def test_set_secrets_replaces_file_atomically():
+    """test that storing the secrets replaces the secrets storage without leaving temporary files."""
+    config, logger = settings()
+    secrets_storage = SecretsStorage(config, logger)
+    secrets_storage.set_secrets({REFRESH_TOKEN_FIELD: "old_refresh_token"})
+    old_inode = os.stat(SECRETS_JSON_PATH).st_ino
+    secrets_storage.set_secrets({REFRESH_TOKEN_FIELD: "new_refresh_token"})
+    assert os.stat(SECRETS_JSON_PATH).st_ino != old_inode
+    assert secrets_storage.get_secrets() == {REFRESH_TOKEN_FIELD: "new_refresh_token"}
+    secrets_directory = os.path.dirname(SECRETS_JSON_PATH)
+    assert not [name for name in os.listdir(secrets_directory) if name.startswith(".secrets-")]
+
+
+@pytest.mark.skipif(fcntl is None, reason="advisory file locks are not available")
+def test_lock_excludes_other_processes():
+    """test that the secrets storage lock is held against the other connector processes."""
+    config, logger = settings()
+    secrets_storage = SecretsStorage(config, logger)
+    try_lock = (
+        "import fcntl, sys\n"
+        f"lock_file = open({SECRETS_LOCK_PATH!r}, 'a')\n"
+        "try:\n"
+        "    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)\n"
+        "except OSError:\n"
+        "    sys.exit(1)\n"
+    )
+    with secrets_storage.lock():
+        assert subprocess.run([sys.executable, "-c", try_lock]).returncode == 1
+    assert subprocess.run([sys.executable, "-c", try_lock]).returncode == 0
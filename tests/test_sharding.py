@@ -0,0 +1,62 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import argparse
+import logging
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ees_zoom import checkpointing  # noqa
+from ees_zoom.configuration import Configuration  # noqa
+from ees_zoom.sharding import Shard, parse_shard  # noqa
+
+CONFIG_FILE = os.path.join(
+    os.path.join(os.path.dirname(__file__), "config"),
+    "zoom_connector.yml",
+)
+
+
+def test_shards_partition_users():
+    """Test that every user belongs to exactly one shard and only the shard 0 syncs the account objects."""
+    users = [{"id": f"dummy_user_{index}"} for index in range(1000)]
+    shards = [parse_shard(f"{index}/4") for index in range(4)]
+    shards_users = [shard.filter_users(users) for shard in shards]
+    assert sorted(user["id"] for shard_users in shards_users for user in shard_users) == sorted(
+        user["id"] for user in users
+    )
+    assert all(len(shard_users) > 150 for shard_users in shards_users)
+    assert [shard.is_account_shard for shard in shards] == [True, False, False, False]
+    assert Shard().filter_users(users) == users
+
+
+@pytest.mark.parametrize("value", ["4/4", "-1/4", "1", "a/b", "0/0"])
+def test_parse_shard_rejects_invalid_shards(value):
+    """Test that the --shard argument is validated.
+    :param value: value of the --shard argument.
+    """
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_shard(value)
+
+
+def test_shards_keep_their_own_checkpoints(tmp_path, monkeypatch):
+    """Test that the checkpoints of the shards are stored in separate files.
+    :param tmp_path: fixture for a temporary directory.
+    :param monkeypatch: fixture for patching the checkpoint path.
+    """
+    monkeypatch.setattr(checkpointing, "CHECKPOINT_PATH", str(tmp_path / "checkpoint.json"))
+    config = Configuration(file_name=CONFIG_FILE)
+    logger = logging.getLogger("unit_test_sharding")
+    for index, checkpoint_time in enumerate(["2022-01-01T00:00:00Z", "2022-02-01T00:00:00Z"]):
+        checkpointing.Checkpoint(config, logger, Shard(index, 2)).set_checkpoint(
+            checkpoint_time, "full", "meetings"
+        )
+    assert sorted(os.listdir(tmp_path)) == ["checkpoint.shard-0-of-2.json", "checkpoint.shard-1-of-2.json"]
+    assert checkpointing.Checkpoint(config, logger, Shard(1, 2)).get_checkpoint(
+        "2022-03-01T00:00:00Z", "meetings"
+    ) == ("2022-02-01T00:00:00Z", "2022-03-01T00:00:00Z")
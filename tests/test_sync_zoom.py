@@ -0,0 +1,241 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ees_zoom.configuration import Configuration  # noqa
+from ees_zoom.sync_zoom import (MULTITHREADED_OBJECTS_FOR_DELETION,  # noqa
+                                PAST_MEETINGS_TASK_SIZE, SyncZoom)
+from ees_zoom.utils import SharedIdSet  # noqa
+from ees_zoom.zoom_client import ZoomClient  # noqa
+
+CONFIG_FILE = os.path.join(
+    os.path.join(os.path.dirname(__file__), "config"),
+    "zoom_connector.yml",
+)
+
+
+def create_sync_zoom_object(objects):
+    """This function creates SyncZoom object for test.
+    :param objects: dictionary of the objects to be fetched.
+    :returns SyncZoom: Instance of SyncZoom and the mocked queue.
+    """
+    config = Configuration(file_name=CONFIG_FILE)
+    logger = logging.getLogger("unit_test_sync_zoom")
+    zoom_client = ZoomClient(config, logger)
+    zoom_client.access_token = "dummy"
+    zoom_client.access_token_expiration = time.time() + 4000
+    time_range = [datetime(2000, 1, 1), datetime(2100, 1, 1)]
+    queue = Mock()
+    sync_zoom = SyncZoom(
+        config,
+        logger,
+        Mock(),
+        zoom_client,
+        {object_type: time_range for object_type in objects},
+        queue,
+        {},
+    )
+    sync_zoom.configuration_objects = objects
+    return sync_zoom, queue
+
+
+def test_iter_sync_tasks_yields_one_task_per_user_and_object():
+    """Test that every user dependent object of every user is a separate task, meetings covering past-meetings."""
+    sync_zoom, _ = create_sync_zoom_object(
+        {"users": None, "meetings": None, "past_meetings": None, "chats": None}
+    )
+    users = [{"id": "dummy_user_1"}, {"id": "dummy_user_2"}]
+    assert list(sync_zoom.iter_sync_tasks("users", users)) == [
+        ("users", users),
+        ("meetings", [users[0]]),
+        ("meetings", [users[1]]),
+        ("chats", [users[0]]),
+        ("chats", [users[1]]),
+    ]
+    assert list(sync_zoom.iter_sync_tasks(MULTITHREADED_OBJECTS_FOR_DELETION, users)) == [
+        ("chats", [users[0]]),
+        ("chats", [users[1]]),
+    ]
+
+
+def test_perform_sync_task_skips_chats_fetched_by_other_tasks(requests_mock):
+    """Test that a chat visible to several users is only fetched once by the concurrent tasks.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    sync_zoom, queue = create_sync_zoom_object({"chats": None})
+    user_ids = [f"dummy_user_{index}" for index in range(10)]
+    sync_zoom.all_chat_access = set(user_ids)
+    requests_mock.get(
+        re.compile(r"https://api.zoom.us/v2/chat/users/\w+/messages"),
+        json={
+            "messages": [
+                {
+                    "id": "shared_chat",
+                    "message": "dummy_message",
+                    "sender": "dummy_sender",
+                    "date_time": "2022-01-01T00:00:00Z",
+                }
+            ],
+            "next_page_token": "",
+        },
+    )
+    users = [{"id": user_id} for user_id in user_ids]
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        ids_storages = list(
+            executor.map(
+                lambda sync_task: sync_zoom.perform_sync_task("users", sync_task),
+                sync_zoom.iter_sync_tasks("users", users),
+            )
+        )
+    assert requests_mock.call_count == 10
+    assert [document["id"] for ids_storage in ids_storages for document in ids_storage] == [
+        "shared_chat"
+    ]
+
+
+def test_iter_sync_tasks_schedules_expensive_users_first():
+    """Test that the tasks are ordered by the cost of the previous sync, new users keeping their order."""
+    sync_zoom, _ = create_sync_zoom_object({"recordings": None, "chats": None})
+    costs = {("dummy_user_2", "chats"): 30, ("dummy_user_3", "recordings"): 5}
+    sync_zoom.user_statistics.get_cost = lambda user_id, object_type: costs.get((user_id, object_type))
+    users = [{"id": "dummy_user_1"}, {"id": "dummy_user_2"}, {"id": "dummy_user_3"}]
+    assert [
+        (object_type, users[0]["id"])
+        for object_type, users in sync_zoom.iter_sync_tasks("users", users)
+    ] == [
+        ("chats", "dummy_user_2"),
+        ("recordings", "dummy_user_3"),
+        ("recordings", "dummy_user_1"),
+        ("recordings", "dummy_user_2"),
+        ("chats", "dummy_user_1"),
+        ("chats", "dummy_user_3"),
+    ]
+
+
+def test_meetings_task_fans_out_past_meetings_tasks(requests_mock):
+    """Test that a meetings task puts its past-meetings in follow-up tasks instead of fetching them.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    sync_zoom, _ = create_sync_zoom_object({"meetings": None, "past_meetings": None})
+    requests_mock.get(
+        re.compile(r"https://api.zoom.us/v2/users/\w+/meetings"),
+        json={
+            "meetings": [
+                {
+                    "uuid": f"dummy_uuid_{index}",
+                    "id": index,
+                    "host_id": "dummy_user_1",
+                    "topic": "dummy_topic",
+                    "agenda": "dummy_agenda",
+                    "type": 2,
+                    "start_time": "2022-01-01T00:00:00Z",
+                    "created_at": "2022-01-01T00:00:00Z",
+                }
+                for index in range(PAST_MEETINGS_TASK_SIZE + 1)
+            ],
+            "next_page_token": "",
+        },
+    )
+    users = [{"id": "dummy_user_1"}]
+    sync_zoom.perform_sync_task("users", ("meetings", users))
+    follow_up_tasks = []
+    while not sync_zoom.follow_up_tasks.empty():
+        follow_up_tasks.append(sync_zoom.follow_up_tasks.get())
+    assert [(object_type, len(meetings)) for object_type, _, meetings in follow_up_tasks] == [
+        ("past_meetings", PAST_MEETINGS_TASK_SIZE),
+        ("past_meetings", 1),
+    ]
+    assert requests_mock.call_count == 1
+
+
+def test_past_meetings_task_counts_the_calls_of_the_executor_threads(requests_mock):
+    """Test that the statistics of a past-meetings task count the calls made by the past-meetings threads.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    sync_zoom, _ = create_sync_zoom_object({"meetings": None, "past_meetings": None})
+    sync_zoom.user_statistics = Mock()
+    requests_mock.get(
+        re.compile(r"https://api.zoom.us/v2/past_meetings/\d+"),
+        status_code=404,
+        json={"code": 3001, "message": "Meeting does not exist."},
+    )
+    users = [{"id": "dummy_user_1"}]
+    meetings = [{"id": index} for index in range(3)]
+    sync_zoom.perform_sync_task("users", ("past_meetings", users, meetings))
+    sync_zoom.close()
+    assert requests_mock.call_count == 3
+    assert sync_zoom.user_statistics.record.call_args[1]["api_calls"] == 3
+
+
+@patch("ees_zoom.utils.BloomFilter.add", Mock(return_value=False))
+def test_perform_sync_task_fetches_chats_reported_fetched_by_bloom_filter(requests_mock):
+    """Test that a chat the bloom filter reports as maybe fetched, although it was never fetched, is fetched.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    sync_zoom, queue = create_sync_zoom_object({"chats": None})
+    sync_zoom.fetched_chats_ids = SharedIdSet(bloom_filter_capacity=1000)
+    sync_zoom.all_chat_access = {"dummy_user"}
+    requests_mock.get(
+        "https://api.zoom.us/v2/chat/users/dummy_user/messages",
+        json={
+            "messages": [
+                {
+                    "id": f"dummy_chat_{index}",
+                    "message": "dummy_message",
+                    "sender": "dummy_sender",
+                    "date_time": "2022-01-01T00:00:00Z",
+                }
+                for index in range(2)
+            ],
+            "next_page_token": "",
+        },
+    )
+    ids_storage = sync_zoom.perform_sync_task("users", ("chats", [{"id": "dummy_user"}]))
+    assert [document["id"] for document in ids_storage] == ["dummy_chat_0", "dummy_chat_1"]
+    assert [document["id"] for document in queue.append_to_queue.call_args[0][0]] == [
+        "dummy_chat_0",
+        "dummy_chat_1",
+    ]
+
+
+def test_perform_sync_task_fetches_again_chats_failed_for_another_user(requests_mock):
+    """Test that a chat whose document could not be created for a user is fetched for the next user sharing it.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    sync_zoom, queue = create_sync_zoom_object({"chats": None})
+    sync_zoom.all_chat_access = {"dummy_user_1", "dummy_user_2"}
+    requests_mock.get(
+        re.compile(r"https://api.zoom.us/v2/chat/users/\w+/messages"),
+        json={
+            "messages": [
+                {
+                    "id": "shared_chat",
+                    "message": "dummy_message",
+                    "sender": "dummy_sender",
+                    "date_time": "2022-01-01T00:00:00Z",
+                }
+            ],
+            "next_page_token": "",
+        },
+    )
+    queue.append_to_queue.side_effect = [ValueError("dummy error"), None]
+    ids_storages = [
+        sync_zoom.perform_sync_task("users", ("chats", [{"id": user_id}]))
+        for user_id in ["dummy_user_1", "dummy_user_2"]
+    ]
+    assert [[document["id"] for document in ids_storage] for ids_storage in ids_storages] == [
+        [],
+        ["shared_chat"],
+    ]
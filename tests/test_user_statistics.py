@@ -0,0 +1,37 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import logging
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ees_zoom import user_statistics as user_statistics_module  # noqa
+from ees_zoom.user_statistics import UserStatistics  # noqa
+
+
+def test_recorded_statistics_are_merged_with_previous_syncs(tmp_path, monkeypatch):
+    """Test that the statistics of a sync replace only the object types it fetched."""
+    monkeypatch.setattr(
+        user_statistics_module, "USER_STATISTICS_PATH", str(tmp_path / "user_statistics.json")
+    )
+    logger = logging.getLogger("unit_test_user_statistics")
+    first_sync = UserStatistics(logger)
+    first_sync.record("user_1", "meetings", api_calls=3, documents=500, seconds=2.5)
+    first_sync.record("user_1", "chats", api_calls=10, documents=3000, seconds=9)
+    first_sync.save()
+    second_sync = UserStatistics(logger)
+    second_sync.record("user_1", "chats", api_calls=1, documents=10, seconds=0.5)
+    second_sync.record("user_2", "chats", api_calls=2, documents=20, seconds=1)
+    second_sync.save()
+    statistics = UserStatistics(logger)
+    assert statistics.get_cost("user_1", "meetings") == 2.5
+    assert statistics.get_cost("user_1", "chats") == 0.5
+    assert statistics.get_cost("user_3", "chats") is None
+    assert statistics.get_users_summary() == [
+        ("user_1", {"api_calls": 4, "documents": 510, "seconds": 3.0}),
+        ("user_2", {"api_calls": 2, "documents": 20, "seconds": 1}),
+    ]
@@ -4,11 +4,16 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 
+import json
 import os
 import sys
+from datetime import datetime
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom import utils  # noqa
 from ees_zoom.utils import (  # noqa
+    SharedIdSet,
+    encode_document,
     split_by_max_cumulative_length,
     split_documents_into_equal_chunks,
     split_list_into_buckets,
@@ -132,3 +137,47 @@ def test_split_by_max_cumulative_length_with_optimum_size():
     ]
     returned_document = split_by_max_cumulative_length(document_to_split, allowed_size)
     assert returned_document == expected_output
+
+
+def test_shared_id_set_skips_ids_already_added():
+    """Tests that an id is only added once, whatever its type"""
+    shared_id_set = SharedIdSet()
+    assert shared_id_set.add_if_absent("dummy_id")
+    assert shared_id_set.add_if_absent(123)
+    assert not shared_id_set.add_if_absent("dummy_id")
+    assert not shared_id_set.add_if_absent("123")
+    assert len(shared_id_set) == 2
+
+
+def test_shared_id_set_with_bloom_filter_never_skips_new_ids():
+    """Tests that the bloom filter never adds an id twice and never skips a new id, even when full"""
+    shared_id_set = SharedIdSet(bloom_filter_capacity=100, bloom_filter_error_rate=0.01)
+    added_count = sum(shared_id_set.add_if_absent(f"dummy_id_{index}") for index in range(10000))
+    assert not any(shared_id_set.add_if_absent(f"dummy_id_{index}") for index in range(10000))
+    assert added_count == 10000
+    assert len(shared_id_set) == added_count
+
+
+def test_shared_id_set_discards_ids():
+    """Tests that a discarded id is added again, the bloom filter bits being left set"""
+    shared_id_set = SharedIdSet(bloom_filter_capacity=100)
+    assert shared_id_set.add_if_absent("dummy_id")
+    shared_id_set.discard("dummy_id")
+    assert shared_id_set.add_if_absent("dummy_id")
+    assert not shared_id_set.add_if_absent("dummy_id")
+
+
+def test_encode_document_without_orjson(monkeypatch):
+    """Tests that the json module encodes the documents as orjson does"""
+    document = {"id": 1, "title": "Réunion", "created_at": datetime(2022, 4, 1, 10, 0), "tags": ["a", "b"]}
+    encoded_document = encode_document(document)
+    large_id_document = encode_document({"id": 2 ** 70})
+    monkeypatch.setattr(utils, "orjson", None)
+    assert encode_document(document) == encoded_document
+    assert json.loads(encoded_document) == {
+        "id": 1,
+        "title": "Réunion",
+        "created_at": "2022-04-01T10:00:00",
+        "tags": ["a", "b"],
+    }
+    assert large_id_document == encode_document({"id": 2 ** 70}) == b'{"id":1180591620717411303424}'
@@ -57,10 +57,10 @@ def create_channels_object():
     return ZoomChannels(configs, logger, zoom_client, zoom_enterprise_search_mappings)
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_channels_details_documents(mock_request_get):
     """Test for generating channels documents, generated from data fetched from Zoom.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     # Setup
     channels_object = create_channels_object()
@@ -169,10 +169,10 @@ def test_get_channels_details_documents(mock_request_get):
     assert response["data"] == expected_response
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_channels_details_documents_negative(mock_request_get):
     """test case where Zoom is down
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     # Setup
     dummy_users_data = [
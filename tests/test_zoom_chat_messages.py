@@ -71,10 +71,10 @@ def create_chats_messages_object():
     )
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_chat_messages_positive(mock_request_get):
     """Test for generating chats documents, generated from data fetched from Zoom.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     # Setup
     chats_messages_object = create_chats_messages_object()
@@ -174,10 +174,10 @@ def test_get_chat_messages_positive(mock_request_get):
     assert response["data"] == expected_response
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_chat_messages_negative(mock_request_get):
     """test case where Zoom is down
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     # Setup
     dummy_users_data = ["dummy_user1"]
@@ -207,10 +207,10 @@ def test_get_chat_messages_negative(mock_request_get):
         )
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_files_from_user_id_positive(mock_request_get):
     """Test for fetching files from zoom for user_id
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     # Setup
     chats_messages_object = create_chats_messages_object()
@@ -299,10 +299,10 @@ def test_get_files_from_user_id_positive(mock_request_get):
     assert response == expected_response
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_files_from_user_id_negative(mock_request_get):
     """test case where Zoom is down
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     # Setup
     dummy_user_id = "dummy_user1"
@@ -7,6 +7,7 @@
 import logging
 import os
 import sys
+import threading
 import time
 from unittest import mock
 from unittest.mock import MagicMock
@@ -17,7 +18,7 @@ import requests
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from ees_zoom.configuration import Configuration  # noqa
 from ees_zoom.secrets_storage import SecretsStorage  # noqa
-from ees_zoom.zoom_client import ZoomClient  # noqa
+from ees_zoom.zoom_client import POOLED_HOSTS_COUNT, ZOOM_BASE_URL, ZoomClient  # noqa
 
 CONFIG_FILE = os.path.join(
     os.path.join(os.path.dirname(__file__), "config"),
@@ -78,10 +79,10 @@ def test_ensure_token_valid_when_valid_refresh_token_present(requests_mock):
     assert secrets_storage.get_secrets().get(REFRESH_TOKEN_FIELD) == new_refresh_token
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_ensure_token_valid_when_invalid_refresh_token_present(mock_request_get):
     """Test for ensure_token_valid function call when invalid refresh token is present in secrets storage.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     old_refresh_token = "old_dummy_refresh_token"
     access_token = "dummy_access_token"
@@ -132,3 +133,221 @@ def test_ensure_token_valid_when_refresh_token_absent(requests_mock):
     assert zoom_client_object.access_token == access_token
     assert secrets_storage.get_secrets().get(REFRESH_TOKEN_FIELD) == new_refresh_token
     assert secrets_storage.get_secrets().get(ACCESS_TOKEN_FIELD) == access_token
+
+
+def test_ensure_token_valid_does_not_read_secrets_storage_when_token_valid():
+    """Test that a valid access token kept in memory is used without reading the secrets storage."""
+    config, logger = settings()
+    zoom_client_object = ZoomClient(config, logger)
+    zoom_client_object.access_token = "dummy_access_token"
+    zoom_client_object.access_token_expiration = time.time() + 3000
+    zoom_client_object.secrets_storage.get_secrets = MagicMock()
+    zoom_client_object.secrets_storage.set_secrets = MagicMock()
+    for _ in range(1000):
+        zoom_client_object.ensure_token_valid()
+    zoom_client_object.secrets_storage.get_secrets.assert_not_called()
+    zoom_client_object.secrets_storage.set_secrets.assert_not_called()
+    assert zoom_client_object.token_refresh_thread is None
+
+
+def test_ensure_token_valid_refreshes_token_in_background_before_expiry(requests_mock):
+    """Test that a token close to its expiry is rotated in background while the current one is still used.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    old_refresh_token = "old_dummy_refresh_token"
+    config, logger = settings()
+    zoom_client_object = ZoomClient(config, logger)
+    zoom_client_object.access_token = "old_access_token"
+    zoom_client_object.access_token_expiration = time.time() + 60
+    zoom_client_object.secrets_storage.get_secrets = MagicMock(
+        return_value={
+            REFRESH_TOKEN_FIELD: old_refresh_token,
+            ACCESS_TOKEN_FIELD: "old_access_token",
+            EXPIRATION_TIME_FIELD: zoom_client_object.access_token_expiration,
+        }
+    )
+    zoom_client_object.secrets_storage.set_secrets = MagicMock()
+    requests_mock.post(
+        f"{AUTH_BASE_URL}refresh_token&refresh_token={old_refresh_token}",
+        json={"refresh_token": "new_refresh_token", "access_token": "new_access_token"},
+    )
+    zoom_client_object.ensure_token_valid()
+    zoom_client_object.token_refresh_thread.join(timeout=5)
+    assert zoom_client_object.access_token == "new_access_token"
+    assert zoom_client_object.access_token_expiration > time.time() + 3000
+    zoom_client_object.secrets_storage.set_secrets.assert_called_once()
+
+
+def test_rejected_token_is_rotated_once(requests_mock):
+    """Test that a token rejected with status 401 is rotated even if its expiry is not reached.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    config, logger = settings()
+    zoom_client_object = ZoomClient(config, logger)
+    zoom_client_object.access_token = "rejected_access_token"
+    zoom_client_object.access_token_expiration = time.time() + 3000
+    zoom_client_object.secrets_storage.get_secrets = MagicMock(
+        return_value={
+            REFRESH_TOKEN_FIELD: "refresh_token",
+            ACCESS_TOKEN_FIELD: "rejected_access_token",
+            EXPIRATION_TIME_FIELD: zoom_client_object.access_token_expiration,
+        }
+    )
+    zoom_client_object.secrets_storage.set_secrets = MagicMock()
+    requests_mock.post(
+        f"{AUTH_BASE_URL}refresh_token&refresh_token=refresh_token",
+        json={"refresh_token": "new_refresh_token", "access_token": "new_access_token"},
+    )
+    zoom_client_object.handle_rejected_token("rejected_access_token")
+    zoom_client_object.handle_rejected_token("rejected_access_token")
+    assert zoom_client_object.access_token == "new_access_token"
+    assert requests_mock.call_count == 1
+
+
+def test_session_is_reused_per_thread():
+    """Test that each thread reuses its own pooled session."""
+    config, logger = settings()
+    zoom_client_object = ZoomClient(config, logger)
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(zoom_client_object.session))
+    thread.start()
+    thread.join()
+    session = zoom_client_object.session
+    assert session is zoom_client_object.session
+    assert session is not sessions[0]
+    assert session.get_adapter(ZOOM_BASE_URL)._pool_connections == POOLED_HOSTS_COUNT
+
+
+def test_iter_pages_fetches_pages_lazily(requests_mock):
+    """Test that iter_pages only requests the next page once the previous one is consumed.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    config, logger = settings()
+    zoom_client_object = ZoomClient(config, logger)
+    zoom_client_object.access_token = "dummy"
+    zoom_client_object.access_token_expiration = time.time() + 4000
+    zoom_client_object.secrets_storage.get_secrets = MagicMock(
+        return_value={
+            ACCESS_TOKEN_FIELD: "dummy",
+            EXPIRATION_TIME_FIELD: time.time() + 4000,
+        }
+    )
+    end_point = "chat/users/dummy_user/messages?page_size=300"
+    requests_mock.get(
+        f"{ZOOM_BASE_URL}{end_point}",
+        json={"messages": [{"id": "chat_1"}], "next_page_token": "token"},
+    )
+    requests_mock.get(
+        f"{ZOOM_BASE_URL}{end_point}&next_page_token=token",
+        json={"messages": [{"id": "chat_2"}], "next_page_token": ""},
+    )
+    pages = zoom_client_object.iter_pages(end_point, "messages")
+    assert next(pages) == [{"id": "chat_1"}]
+    assert requests_mock.call_count == 1
+    assert list(pages) == [[{"id": "chat_2"}]]
+    assert requests_mock.call_count == 2
+    assert list(zoom_client_object.iter_items(end_point, "messages")) == [
+        {"id": "chat_1"},
+        {"id": "chat_2"},
+    ]
+
+
+def test_iter_pages_prefetches_next_pages(requests_mock):
+    """Test that iter_pages requests the next pages in background while the current page is processed.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    config, logger = settings()
+    zoom_client_object = ZoomClient(config, logger)
+    zoom_client_object.access_token = "dummy"
+    zoom_client_object.access_token_expiration = time.time() + 4000
+    zoom_client_object.ensure_token_valid = MagicMock()
+    end_point = "users?page_size=300"
+    requests_mock.get(
+        f"{ZOOM_BASE_URL}{end_point}",
+        json={"users": [{"id": "user_1"}], "next_page_token": "token_1"},
+    )
+    requests_mock.get(
+        f"{ZOOM_BASE_URL}{end_point}&next_page_token=token_1",
+        json={"users": [{"id": "user_2"}], "next_page_token": "token_2"},
+    )
+    requests_mock.get(
+        f"{ZOOM_BASE_URL}{end_point}&next_page_token=token_2",
+        status_code=500,
+    )
+    pages = zoom_client_object.iter_pages(end_point, "users", prefetch_depth=2)
+    assert next(pages) == [{"id": "user_1"}]
+    deadline = time.time() + 5
+    while requests_mock.call_count < 3 and time.time() < deadline:
+        time.sleep(0.01)
+    assert requests_mock.call_count == 3
+    assert next(pages) == [{"id": "user_2"}]
+    with pytest.raises(requests.exceptions.HTTPError):
+        next(pages)
+
+
+def test_get_shares_concurrent_and_repeated_calls(requests_mock):
+    """Test that concurrent and repeated calls to the same endpoint are served by one request.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    config, logger = settings()
+    zoom_client_object = ZoomClient(config, logger)
+    zoom_client_object.access_token = "dummy"
+    zoom_client_object.access_token_expiration = time.time() + 4000
+    zoom_client_object.ensure_token_valid = MagicMock()
+
+    def slow_response(request, context):
+        time.sleep(0.2)
+        return {"privileges": ["User:Read"]}
+
+    requests_mock.get(f"{ZOOM_BASE_URL}roles/dummy_role", json=slow_response)
+    responses = []
+    threads = [
+        threading.Thread(
+            target=lambda: responses.append(
+                zoom_client_object.get("roles/dummy_role", "privileges")
+            )
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    responses[0].append("ent_user")
+    assert zoom_client_object.get("roles/dummy_role", "privileges") == ["User:Read"]
+    assert requests_mock.call_count == 1
+    assert zoom_client_object.saved_calls_count == 5
+
+
+def test_get_does_not_keep_user_dependent_responses(requests_mock):
+    """Test that concurrent calls to a user dependent endpoint share one request, its response not being kept.
+    :param requests_mock: fixture for mocking requests calls.
+    """
+    config, logger = settings()
+    zoom_client_object = ZoomClient(config, logger)
+    zoom_client_object.access_token = "dummy"
+    zoom_client_object.access_token_expiration = time.time() + 4000
+    zoom_client_object.ensure_token_valid = MagicMock()
+    end_point = "users/dummy_user/meetings?page_size=300"
+
+    def slow_response(request, context):
+        time.sleep(0.2)
+        return {"meetings": [{"id": "meeting_1"}], "next_page_token": ""}
+
+    requests_mock.get(f"{ZOOM_BASE_URL}{end_point}", json=slow_response)
+    responses = []
+    threads = [
+        threading.Thread(target=lambda: responses.append(zoom_client_object.get(end_point, "meetings")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    responses[0][0]["id"] = "updated_meeting"
+    assert responses[1:] == [[{"id": "meeting_1"}]] * 4
+    assert requests_mock.call_count == 1
+    assert zoom_client_object.single_flight_calls == {}
+    assert zoom_client_object.get(end_point, "meetings") == [{"id": "meeting_1"}]
+    assert requests_mock.call_count == 2
+    assert zoom_client_object.saved_calls_count == 4
@@ -60,10 +60,10 @@ def create_meetings_object():
     return ZoomMeetings(configs, logger, zoom_client, zoom_enterprise_search_mappings)
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_meetings_details_documents(mock_request_get):
     """Test for generating meetings documents, generated from data fetched from Zoom.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     meetings_object = create_meetings_object()
     dummy_users_data = [
@@ -175,7 +175,7 @@ def test_get_meetings_details_documents(mock_request_get):
     assert response["data"] == expected_response
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_meetings_details_documents_negative(mock_request_get):
     """test case where Zoom is down.
     :param mock_request_get: fixture for requests GET call.
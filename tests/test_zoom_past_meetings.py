@@ -8,7 +8,9 @@ import json
 import logging
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 from unittest.mock import Mock
 
@@ -62,7 +64,7 @@ def create_past_meetings_object():
     )
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_past_meetings_details_documents_positive(mock_request_get):
     """Test for generating past-meetings documents,using data fetched from Zoom.
     this case covers scenario where there are more than one participants.
@@ -187,10 +189,10 @@ def test_get_past_meetings_details_documents_positive(mock_request_get):
     assert response["data"] == expected_response
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_past_meetings_details_documents_negative(mock_request_get):
     """test case where meeting id is not past-meeting or Zoom is down.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     dummy_meetings_data = [
         {
@@ -230,7 +232,7 @@ def test_get_past_meetings_details_documents_negative(mock_request_get):
         )
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_past_meetings_details_documents_with_one_participant(mock_request_get):
     """Test for generating past-meetings documents,using data fetched from Zoom.
     this case covers scenario where meeting host is the only participant.
@@ -309,10 +311,10 @@ def test_get_past_meetings_details_documents_with_one_participant(mock_request_g
     assert response["data"] == expected_response
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_past_meeting_details_from_meeting_id_negative(mock_request_get):
     """test case to handle 400 status code.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     # Setup
     past_meetings_object = create_past_meetings_object()
@@ -341,3 +343,24 @@ def test_get_past_meeting_details_from_meeting_id_negative(mock_request_get):
     )
     # Assert
     assert response is None
+
+
+def test_iter_past_meetings_details_documents_fetches_meetings_concurrently():
+    """Test that the past-meetings of the meetings are fetched at the same time by the threads of the executor
+    and yielded as they complete, the meetings without past instance being skipped."""
+    past_meetings_object = create_past_meetings_object()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_past_meeting_document(meeting, *args):
+        # Every call waits for the two others, which only completes if the meetings are fetched concurrently.
+        barrier.wait()
+        return {"id": meeting["id"]} if meeting["id"] != 2 else None
+
+    past_meetings_object.get_past_meeting_document = get_past_meeting_document
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        documents = list(
+            past_meetings_object.iter_past_meetings_details_documents(
+                [{"id": 1}, {"id": 2}, {"id": 3}], SCHEMA, None, None, False, executor
+            )
+        )
+    assert sorted(document["id"] for document in documents) == [1, 3]
@@ -62,10 +62,10 @@ def create_recordings_object():
     return ZoomRecordings(configs, logger, zoom_client, zoom_enterprise_search_mappings)
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_recordings_details_documents_positive(mock_request_get):
     """Test for generating recording documents, generated from data fetched from Zoom.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     # Setup
     recordings_object = create_recordings_object()
@@ -312,10 +312,10 @@ def test_get_recordings_details_documents_positive(mock_request_get):
     assert response["data"] == expected_response
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_recordings_details_documents_negative(mock_request_get):
     """test case where Zoom is down
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     # Setup
     dummy_users_data = [
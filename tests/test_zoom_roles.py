@@ -15,7 +15,7 @@ from unittest.mock import Mock
 
 from ees_zoom.configuration import Configuration
 from ees_zoom.zoom_client import ZoomClient
-from ees_zoom.zoom_roles import ZoomRoles
+from ees_zoom.zoom_roles import RoleIndex, ZoomRoles
 
 CONFIG_FILE = os.path.join(
     os.path.join(os.path.dirname(__file__), "config"),
@@ -86,10 +86,10 @@ def test_fetch_role_permissions(requests_mock):
     assert response == dummy_roles_data["privileges"]
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_fetch_members_of_role(mock_request_get):
     """Test for fetching role members from Zoom.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     dummy_roles_members_data_with_next_page_token = {
         "page_count": 1,
@@ -142,3 +142,33 @@ def test_fetch_members_of_role(mock_request_get):
     mock_request_get.side_effect = mock_response
     response = roles_object.fetch_members_of_role(dummy_role_id)
     assert response == expected_roles_members_response
+
+
+def test_role_index_resolves_roles_once(requests_mock):
+    """Test that the role index maps the users to their roles and the privileges to their users,
+    fetching every role only once.
+    :param requests_mock: fixture for requests.get calls.
+    """
+    roles_object = create_roles_object()
+    requests_mock.get(
+        "https://api.zoom.us/v2/roles",
+        json={"roles": [{"id": "role_1"}, {"id": "role_2"}]},
+    )
+    privileges = {"role_1": ["ChatMessage:Read", "User:Read"], "role_2": ["User:Read"]}
+    members = {"role_1": ["dummy_id_1"], "role_2": ["dummy_id_1", "dummy_id_2"]}
+    for role_id in privileges:
+        requests_mock.get(
+            f"https://api.zoom.us/v2/roles/{role_id}",
+            json={"id": role_id, "privileges": privileges[role_id]},
+        )
+        requests_mock.get(
+            f"https://api.zoom.us/v2/roles/{role_id}/members?page_size=300",
+            json={"members": [{"id": member_id} for member_id in members[role_id]], "next_page_token": ""},
+        )
+    role_index = RoleIndex(roles_object, roles_object.logger, thread_count=4)
+    assert role_index.get_users_with_privilege("ChatMessage:Read") == {"dummy_id_1"}
+    assert role_index.get_users_with_privilege("User:Read") == {"dummy_id_1", "dummy_id_2"}
+    assert role_index.get_user_privileges("dummy_id_1") == ["ChatMessage:Read", "User:Read"]
+    assert role_index.get_users_roles() == {"dummy_id_1": ["role_1", "role_2"], "dummy_id_2": ["role_2"]}
+    assert [role["id"] for role in role_index.get_roles()] == ["role_1", "role_2"]
+    assert requests_mock.call_count == 5
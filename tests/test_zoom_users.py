@@ -62,10 +62,10 @@ def create_users_object():
     return ZoomUsers(configs, logger, zoom_client, zoom_enterprise_search_mappings)
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_users_list_positive(mock_request_get):
     """Test Method to get all users from Zoom.
-    :param mock_request_get: mock patch for requests.get calls."""
+    :param mock_request_get: mock patch for requests.Session.get calls."""
     users_object = create_users_object()
     mock_resp_with_next_page_token = {
         "page_count": 2,
@@ -237,10 +237,10 @@ def test_get_users_details_documents():
     assert response["data"] == expected_response_data
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_users_list_negative(mock_request_get):
     """Test case where Zoom is down
-    :param mock_request_get: mock patch for requests.get calls.
+    :param mock_request_get: mock patch for requests.Session.get calls.
     """
     users_object = create_users_object()
     mock_response = [mock.Mock()]